@@ -1,11 +1,17 @@
+import asyncio
 import logging
+import uuid
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 
 from job_search_agent.core.llm_gateways.observability import init_langsmith
+from job_search_agent.core.llm_gateways.usage_ledger import current_request_id
+from job_search_agent.api.dependencies import get_orchestrator
 from job_search_agent.api.routes import core, monitoring
 from job_search_agent.configs.setting import get_settings
+from job_search_agent.core.orchestration.tools.http_client.pool import close_http_pool
+from job_search_agent.core.orchestration.tools.website_scrapper.parsing import close_parse_pool
 
 settings = get_settings()
 
@@ -13,12 +19,53 @@ settings = get_settings()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+async def _warm_up():
+    try:
+        await asyncio.to_thread(get_orchestrator().warm_up)
+        logger.info("Warm-up finished.")
+    except Exception as e:
+        logger.warning(f"Warm-up failed, continuing cold: {e}")
+
 @asynccontextmanager
 async def lifespan(_: FastAPI):
     logger.info("Starting Job Search Agent API...")
     init_langsmith()
+    crawler = None
+    crawler_lock = None
+    if settings.CRAWLER_ENABLED:
+        from job_search_agent.core.orchestration.crawler import CrawlerLock, VacancyCrawler
+
+        # Every worker runs this lifespan; the lock lets only one of them crawl.
+        crawler_lock = CrawlerLock(settings.CRAWLER_LOCK_PATH)
+        if crawler_lock.acquire():
+            logger.info("Starting background vacancy crawler...")
+            crawler = VacancyCrawler()
+            crawler.start()
+        else:
+            logger.info("Vacancy crawler runs in another process, not starting it here.")
+    batch_worker = None
+    if settings.LLM_BATCH_WORKER_ENABLED:
+        from job_search_agent.core.llm_gateways.gateway import get_gateway
+
+        logger.info("Starting LLM batch worker...")
+        batch_worker = get_gateway().deferred_executor()
+        batch_worker.start()
+    warm_up = None
+    if settings.APP_WARMUP_ENABLED:
+        # In the background, so the worker accepts requests (e.g. health checks) right away.
+        logger.info("Warming up agents and LLM clients...")
+        warm_up = asyncio.create_task(_warm_up())
     yield
     logger.info("Shutting down Job Search Agent API...")
+    if warm_up is not None and not warm_up.done():
+        warm_up.cancel()
+    if crawler is not None:
+        await crawler.stop()
+        crawler_lock.release()
+    if batch_worker is not None:
+        await batch_worker.stop()
+    await close_http_pool()
+    close_parse_pool()
 
 app = FastAPI(
     title="Job Search Agent API",
@@ -46,6 +93,18 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.middleware("http")
+async def request_id_middleware(request: Request, call_next):
+    """Tags LLM usage recorded while serving a request with its id (X-Request-ID, or a new one)."""
+    request_id = request.headers.get("X-Request-ID") or uuid.uuid4().hex
+    token = current_request_id.set(request_id)
+    try:
+        response = await call_next(request)
+    finally:
+        current_request_id.reset(token)
+    response.headers["X-Request-ID"] = request_id
+    return response
+
 # Include Routers
 app.include_router(core.router)
 app.include_router(monitoring.router)
@@ -1,7 +1,11 @@
+import json
 import logging
 from fastapi import APIRouter, HTTPException, status, Depends, UploadFile
+from fastapi.responses import StreamingResponse
 from job_search_agent.api.models import ProcessCVResponse, JobResponse, OptimizeJobRequest, FindJobsResponse
 from job_search_agent.api.dependencies import get_orchestrator
+from job_search_agent.core.llm_gateways.cost_controller import BudgetExceeded
+from job_search_agent.core.llm_gateways.rate_limiter import RateLimitExceeded
 from job_search_agent.core.orchestration.models.resume_models import Resume
 from job_search_agent.core.orchestration.orchestrator import JobSearchOrchestrator
 from job_search_agent.core.orchestration.models.optimization_result import OptimizationResult
@@ -25,6 +29,10 @@ async def process_cv(
         pdf_bytes = await file.read()
         resume = await orchestrator.process_cv(pdf_bytes)
         return ProcessCVResponse(resume=resume)
+    except RateLimitExceeded as e:
+        raise HTTPException(status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail=str(e))
+    except BudgetExceeded as e:
+        raise HTTPException(status_code=status.HTTP_402_PAYMENT_REQUIRED, detail=str(e))
     except Exception as e:
         logger.error(f"Error parsing CV: {str(e)}")
         raise HTTPException(
@@ -56,6 +64,8 @@ async def find_jobs(
         return FindJobsResponse(ranked_jobs=formatted_jobs)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except BudgetExceeded as e:
+        raise HTTPException(status_code=status.HTTP_402_PAYMENT_REQUIRED, detail=str(e))
     except Exception as e:
         logger.error(f"Error finding jobs: {str(e)}")
         raise HTTPException(
@@ -63,6 +73,37 @@ async def find_jobs(
             detail=f"Failed to find jobs: {str(e)}"
         )
 
+@router.post("/find-jobs/stream",
+             response_class=StreamingResponse,
+             summary="Stream matching jobs as soon as they are judged")
+async def find_jobs_stream(
+    request: Resume,
+    orchestrator: JobSearchOrchestrator = Depends(get_orchestrator)
+):
+    """
+    Server-Sent Events variant of /find-jobs. Each matched job is sent as a `job` event
+    (same shape as a JobResponse) as soon as its batch is judged, followed by a final `done` event.
+    Failures are reported as an `error` event since the response has already started.
+    """
+    async def event_stream():
+        try:
+            logger.info("Streaming matching jobs...")
+            async for job, score, reason in orchestrator.stream_jobs(request):
+                payload = JobResponse(job=job, score=score, reason=reason)
+                yield f"event: job\ndata: {payload.model_dump_json()}\n\n"
+            yield "event: done\ndata: {}\n\n"
+        except BudgetExceeded as e:
+            yield f"event: error\ndata: {json.dumps({'status': 402, 'detail': str(e)})}\n\n"
+        except Exception as e:
+            logger.error(f"Error streaming jobs: {str(e)}")
+            yield f"event: error\ndata: {json.dumps({'detail': f'Failed to find jobs: {str(e)}'})}\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
 @router.post("/optimize-job", 
              response_model=OptimizationResult, 
              summary="Optimize application for a specific job")
@@ -75,7 +116,7 @@ async def optimize_job(
     found job vacancy. Requires a CV to have been processed first.
     """
     try:
-        logger.info(f"Optimizing for job...")
+        logger.info("Optimizing for job...")
         result = await orchestrator.optimize_job(request.job, request.resume)
         return result
     except ValueError as e:
@@ -85,6 +126,51 @@ async def optimize_job(
             status_code=status.HTTP_404_NOT_FOUND, 
             detail="Job index not found in recent search results."
         )
+    except RateLimitExceeded as e:
+        raise HTTPException(status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail=str(e))
+    except BudgetExceeded as e:
+        raise HTTPException(status_code=status.HTTP_402_PAYMENT_REQUIRED, detail=str(e))
     except Exception as e:
         logger.error(f"Error optimizing job: {str(e)}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+
+@router.post("/optimize-job/stream",
+             response_class=StreamingResponse,
+             summary="Stream the application optimization as it is generated")
+async def optimize_job_stream(
+    request: OptimizeJobRequest,
+    orchestrator: JobSearchOrchestrator = Depends(get_orchestrator)
+):
+    """
+    Server-Sent Events variant of /optimize-job. Text generated for `explanation`,
+    `optimization_tips` and `cover_letter` is sent as `delta` events
+    ({"field": ..., "text": ...}, to be appended per field) while the model writes it.
+    The final `result` event carries the complete OptimizationResult, validated against
+    its schema. Failures are reported as an `error` event since the response has already started.
+    """
+    async def event_stream():
+        try:
+            logger.info("Streaming job optimization...")
+            async for kind, payload in orchestrator.stream_optimize_job(request.job, request.resume):
+                if kind == "delta":
+                    field, text = payload
+                    yield f"event: delta\ndata: {json.dumps({'field': field, 'text': text}, ensure_ascii=False)}\n\n"
+                else:
+                    yield f"event: result\ndata: {payload.model_dump_json()}\n\n"
+        except RateLimitExceeded as e:
+            logger.warning(f"Rate limited while streaming job optimization: {str(e)}")
+            yield f"event: error\ndata: {json.dumps({'status': 429, 'detail': str(e)})}\n\n"
+        except BudgetExceeded as e:
+            logger.warning(f"Budget exceeded while streaming job optimization: {str(e)}")
+            yield f"event: error\ndata: {json.dumps({'status': 402, 'detail': str(e)})}\n\n"
+        except Exception as e:
+            logger.error(f"Error streaming job optimization: {str(e)}")
+            detail = f"Failed to optimize job: {str(e)}"
+            yield f"event: error\ndata: {json.dumps({'status': 500, 'detail': detail})}\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
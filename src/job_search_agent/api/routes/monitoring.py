@@ -1,6 +1,12 @@
 from fastapi import APIRouter, Depends
 from job_search_agent.api.dependencies import get_orchestrator
 from job_search_agent.core.orchestration.orchestrator import JobSearchOrchestrator
+from job_search_agent.core.llm_gateways.gateway import get_gateway
+from job_search_agent.core.llm_gateways.rate_limiter import get_rate_limiter
+from job_search_agent.core.llm_gateways.response_cache import get_llm_response_cache
+from job_search_agent.core.orchestration.tools.http_client.scheduler import get_scrape_scheduler
+from job_search_agent.core.orchestration.tools.http_client.response_cache import get_response_cache
+from job_search_agent.core.orchestration.tools.website_scrapper.vacancy_cache import get_vacancy_cache
 
 router = APIRouter(tags=["Monitoring"])
 
@@ -16,9 +22,40 @@ async def root():
 @router.get("/usage", summary="Get usage and cost report")
 async def get_usage(orchestrator: JobSearchOrchestrator = Depends(get_orchestrator)):
     """
-    Returns a detailed report of LLM token usage and estimated costs in USD.
+    Returns this month's LLM calls, measured input/output tokens and costs in USD,
+    rolled up per model and per agent over every API worker, plus the budget limit.
     """
     return {
-        "report": orchestrator.get_usage_report(),
+        "report": await orchestrator.get_usage_report(),
         "currency": "USD"
     }
+
+@router.get("/scraper/stats", summary="Get scraper scheduling metrics")
+async def get_scraper_stats():
+    """
+    Returns per-host queue depth, in-flight requests and wait times of the scraping scheduler,
+    plus hit/revalidation counters of the HTTP response and parsed vacancy caches.
+    """
+    response_cache = get_response_cache()
+    vacancy_cache = get_vacancy_cache()
+    return {
+        "scheduler": get_scrape_scheduler().stats(),
+        "response_cache": response_cache.stats() if response_cache else None,
+        "vacancy_cache": vacancy_cache.stats() if vacancy_cache else None,
+    }
+
+@router.get("/llm/stats", summary="Get LLM gateway metrics")
+async def get_llm_stats():
+    """
+    Returns hit/miss counters of the LLM response cache, plus per-model rate limiter
+    queue depth, wait times, rejections and current RPM/RPD/TPM usage, per-complexity
+    hedge rate, fallbacks and estimated hedge cost overhead, and deferred (batch mode)
+    request counts by status.
+    """
+    response_cache = get_llm_response_cache()
+    return {
+        "response_cache": response_cache.stats() if response_cache else None,
+        "rate_limits": get_rate_limiter().stats(),
+        "latency": get_gateway().latency_stats(),
+        "deferred": await get_gateway().deferred_stats(),
+    }
@@ -1,5 +1,5 @@
 from functools import lru_cache
-from typing import Optional
+from typing import List, Optional
 from pydantic import SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -13,9 +13,147 @@ class Settings(BaseSettings):
     LANGCHAIN_ENDPOINT: str = "https://api.smith.langchain.com"
     TAVILY_API_KEY: Optional[SecretStr] = None
 
+    # Exact-match cache of structured LLM responses ("sqlite" or "memory" backend)
+    LLM_CACHE_ENABLED: bool = True
+    LLM_CACHE_BACKEND: str = "sqlite"
+    LLM_CACHE_PATH: str = "cache/llm_responses.sqlite3"
+    LLM_CACHE_TTL: float = 7 * 24 * 3600
+    LLM_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    LLM_CACHE_PURGE_INTERVAL: float = 600
+
+    # Process-wide LLM rate limits, read from this tier in configs/pricing/current.json
+    LLM_RATE_LIMIT_TIER: str = "free_tier"
+    # Requests that would queue longer than this are rejected instead
+    LLM_RATE_LIMIT_MAX_WAIT: float = 120
+
+    # Tail latency: a call still running after this percentile of recent latencies of its complexity
+    # is hedged with the next model of its fallback chain (configs/pricing/current.json); first valid result wins
+    LLM_HEDGE_ENABLED: bool = True
+    LLM_HEDGE_PERCENTILE: float = 95
+    LLM_HEDGE_MIN_DELAY: float = 2.0
+    # Hedge delay until enough latencies have been observed
+    LLM_HEDGE_INITIAL_DELAY: float = 15.0
+    # Rate-limit and 5xx errors move on to the next model of the fallback chain
+    LLM_FALLBACK_ENABLED: bool = True
+
+    # Token usage and spend of every worker, and the monthly LLM budget checked against it
+    LLM_USAGE_LEDGER_PATH: str = "cache/llm_usage.sqlite3"
+    LLM_BUDGET_LIMIT: float = 10.0
+    LLM_BUDGET_REFRESH_SECONDS: float = 30.0
+
+    # Deferred (batch mode) LLM calls for non-interactive work ("gemini" or the in-process "local" stand-in)
+    LLM_BATCH_PROVIDER: str = "gemini"
+    LLM_BATCH_PATH: str = "cache/llm_batches.sqlite3"
+    LLM_BATCH_MAX_REQUESTS: int = 500
+    LLM_BATCH_POLL_INTERVAL: float = 60
+    # Requests claimed by a worker that died before submitting them are requeued after this long
+    LLM_BATCH_CLAIM_LEASE: float = 600
+    # Deferred callers give up after this long (Gemini batches finish within 24h)
+    LLM_BATCH_TIMEOUT: float = 26 * 3600
+    # Run the batch worker inside the API process; otherwise run core/llm_gateways/batch_jobs.py standalone
+    LLM_BATCH_WORKER_ENABLED: bool = False
+
+    # Count prompt tokens with Gemini's local tokenizer when sentencepiece is installed
+    TOKEN_ESTIMATOR_USE_LOCAL_TOKENIZER: bool = True
+
+    # Import the agent stack and create LLM clients in the background at startup,
+    # instead of on the first request (the API itself imports them lazily)
+    APP_WARMUP_ENABLED: bool = False
+
     API_DOCS_URL: str = "/docs"
     API_REDOC_URL: str = "/redoc"
 
+    # Shared HTTP client pool used by scrapers and API callers
+    HTTP_CONNECT_TIMEOUT: float = 5.0
+    HTTP_READ_TIMEOUT: float = 15.0
+    HTTP_MAX_CONNECTIONS_PER_HOST: int = 10
+    HTTP_MAX_KEEPALIVE_PER_HOST: int = 10
+    HTTP_KEEPALIVE_EXPIRY: float = 30.0
+    HTTP2_ENABLED: bool = True
+
+    # Per-host politeness scheduling for scraping
+    SCRAPER_HOST_RATE: float = 4.0
+    SCRAPER_HOST_BURST: float = 8.0
+    SCRAPER_MAX_IN_FLIGHT_PER_HOST: int = 6
+    SCRAPER_MAX_IN_FLIGHT: int = 16
+
+    # Persistent HTTP response cache for vacancy pages
+    HTTP_CACHE_ENABLED: bool = True
+    HTTP_CACHE_PATH: str = "cache/http_responses.sqlite3"
+    HTTP_CACHE_TTL: float = 6 * 3600
+    # Pages not fetched or revalidated for this long are deleted; stale but retained pages still allow a 304
+    HTTP_CACHE_RETENTION: float = 7 * 24 * 3600
+    HTTP_CACHE_MAX_BYTES: int = 256 * 1024 * 1024
+    HTTP_CACHE_PURGE_INTERVAL: float = 600
+
+    # Parsed JobVacancy cache (expires at the vacancy deadline, capped by MAX_TTL)
+    VACANCY_CACHE_ENABLED: bool = True
+    VACANCY_CACHE_PATH: str = "cache/vacancies.sqlite3"
+    VACANCY_CACHE_DEFAULT_TTL: float = 24 * 3600
+    VACANCY_CACHE_MAX_TTL: float = 7 * 24 * 3600
+
+    # HTML parsing off the event loop ("html.parser", "lxml" or "html5lib"; "thread" or "process")
+    HTML_PARSER_BACKEND: str = "html.parser"
+    HTML_PARSE_EXECUTOR: str = "thread"
+    HTML_PARSE_WORKERS: int = 4
+
+    # Streaming find-jobs: jobs per LLM matching batch and max seconds to wait for a batch to fill
+    MATCH_STREAM_BATCH_SIZE: int = 5
+    MATCH_STREAM_BATCH_WAIT: float = 2.0
+    # Matching batches are split into shards of at most this many prompt tokens / jobs, judged concurrently
+    MATCH_SHARD_MAX_TOKENS: int = 4000
+    MATCH_SHARD_MAX_JOBS: int = 10
+    # Extra attempts for a shard whose LLM call failed, before its jobs count as unmatched
+    MATCH_SHARD_RETRIES: int = 1
+
+    # Near-duplicate vacancies (reposts across boards) are dropped before matching
+    NEAR_DUPLICATE_DEDUP_ENABLED: bool = True
+    NEAR_DUPLICATE_THRESHOLD: float = 0.6
+
+    # Embedding prefilter: only the MATCH_MAX_CANDIDATES most similar jobs reach the LLM.
+    # Off by default since it loads a sentence-transformers model; enable APP_WARMUP_ENABLED
+    # with it so the model is loaded at startup rather than by the first request.
+    MATCH_MAX_CANDIDATES: int = 15
+    EMBEDDING_PREFILTER_ENABLED: bool = False
+    EMBEDDING_MODEL: str = "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2"
+    EMBEDDING_BATCH_SIZE: int = 64
+    # Concurrent encode requests arriving within this window share one forward pass
+    EMBEDDING_BATCH_MAX_WAIT: float = 0.01
+    EMBEDDING_BATCH_MAX_TEXTS: int = 256
+    # Persistent embeddings keyed by content hash, so each vacancy text is encoded once
+    EMBEDDING_CACHE_ENABLED: bool = True
+    EMBEDDING_CACHE_DIR: str = "cache/embeddings"
+    # Jobs below this similarity never reach the LLM; streaming, which cannot rank the full set, relies on it alone
+    EMBEDDING_MIN_SIMILARITY: float = 0.3
+
+    # Where find-jobs gets candidates: "live" (web search + scraping) or "store" (local crawled store)
+    JOB_SOURCE_MODE: str = "live"
+    VACANCY_STORE_PATH: str = "cache/vacancy_store.sqlite3"
+    VACANCY_STORE_RETENTION: float = 30 * 24 * 3600
+    VACANCY_STORE_SEARCH_LIMIT: int = 100
+    VACANCY_INDEX_REBUILD_INTERVAL: float = 3600
+    # Semantic retrieval in store mode: IVF vector index over stored vacancy embeddings
+    ANN_INDEX_ENABLED: bool = True
+    ANN_INDEX_DIR: str = "cache/ann_index"
+    ANN_LISTS: int = 1024
+    ANN_PROBES: int = 32
+    # Below this many vectors the index does exact search
+    ANN_MIN_TRAIN_SIZE: int = 10_000
+    ANN_RELOAD_INTERVAL: float = 60
+
+    # Background crawler that keeps the vacancy store fresh
+    CRAWLER_ENABLED: bool = False
+    # Only the process holding this lock crawls, whichever API worker or standalone crawler gets it first
+    CRAWLER_LOCK_PATH: str = "cache/crawler.lock"
+    CRAWLER_USE_WEB_SEARCH: bool = True
+    CRAWLER_INTERVAL: float = 30 * 60
+    CRAWLER_REFRESH_INTERVAL: float = 12 * 3600
+    CRAWLER_KEYWORD_WINDOW: float = 30 * 24 * 3600
+    CRAWLER_KEYWORDS: List[str] = [
+        "developer", "engineer", "analyst", "manager", "designer", "marketing",
+        "sales", "hr", "accountant", "mühasib", "satış", "mütəxəssis",
+    ]
+
     model_config = SettingsConfigDict(env_file=".env", extra="ignore")
 
 @lru_cache
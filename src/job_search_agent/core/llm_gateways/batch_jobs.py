@@ -0,0 +1,430 @@
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple, Type, TypeVar
+
+from pydantic import BaseModel
+
+from job_search_agent.core.llm_gateways.response_cache import cache_key
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T", bound=BaseModel)
+
+# (request id, rendered messages as [{"type": ..., "content": ...}], output JSON schema)
+BatchRequest = Tuple[str, List[Dict[str, str]], Dict[str, Any]]
+# request id -> (result JSON, error message); exactly one of the two is set
+BatchResults = Dict[str, Tuple[Optional[str], Optional[str]]]
+
+
+class BatchRequestFailed(Exception):
+    """Raised when the provider could not produce a result for a deferred request."""
+
+
+def serialize_messages(messages: Sequence[Any]) -> List[Dict[str, str]]:
+    return [{"type": message.type, "content": message.content} for message in messages]
+
+
+class BatchJobStore:
+    """
+    Durable queue of deferred LLM requests.
+
+    A request moves queued -> submitting -> submitted -> done | failed. Claiming
+    queued rows happens in one write transaction, so several worker processes can
+    share the table without submitting a request twice. A claim is a lease: rows left
+    'submitting' for longer than `claim_lease` (their worker died before recording the
+    submission) are queued again by the next claim. Results stay in the table, so
+    callers can collect them after a restart.
+    """
+
+    def __init__(self, path: str, claim_lease: float = 600):
+        self.path = Path(path)
+        self.claim_lease = claim_lease
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA busy_timeout=5000")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS batch_requests (
+                id TEXT PRIMARY KEY,
+                model TEXT NOT NULL,
+                messages TEXT NOT NULL,
+                schema TEXT NOT NULL,
+                status TEXT NOT NULL,
+                batch_name TEXT,
+                result TEXT,
+                error TEXT,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS batch_requests_status ON batch_requests (status, model)")
+
+    def _enqueue(self, request_id: str, model_name: str, messages: List[Dict[str, str]], schema: Dict[str, Any]) -> bool:
+        """Queues a request; False if an identical one is already queued, running or done."""
+        now = time.time()
+        with self._lock:
+            # Identical requests share a row; a failed one is queued again.
+            cursor = self._conn.execute(
+                """
+                INSERT INTO batch_requests (id, model, messages, schema, status, created_at, updated_at)
+                VALUES (?, ?, ?, ?, 'queued', ?, ?)
+                ON CONFLICT(id) DO UPDATE SET status = 'queued', error = NULL, updated_at = excluded.updated_at
+                WHERE batch_requests.status = 'failed'
+                """,
+                (request_id, model_name, json.dumps(messages, ensure_ascii=False), json.dumps(schema), now, now),
+            )
+            return cursor.rowcount > 0
+
+    def _claim(self, limit: int) -> Dict[str, List[BatchRequest]]:
+        """Marks up to `limit` queued requests per model as submitting and returns them."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    "UPDATE batch_requests SET status = 'queued', updated_at = ? WHERE status = 'submitting' AND updated_at < ?",
+                    (now, now - self.claim_lease),
+                )
+                rows = self._conn.execute(
+                    """
+                    SELECT id, model, messages, schema FROM (
+                        SELECT *, ROW_NUMBER() OVER (PARTITION BY model ORDER BY created_at) AS position
+                        FROM batch_requests WHERE status = 'queued'
+                    ) WHERE position <= ?
+                    """,
+                    (limit,),
+                ).fetchall()
+                self._conn.executemany(
+                    "UPDATE batch_requests SET status = 'submitting', updated_at = ? WHERE id = ?",
+                    [(now, row[0]) for row in rows],
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        claimed: Dict[str, List[BatchRequest]] = {}
+        for request_id, model_name, messages, schema in rows:
+            claimed.setdefault(model_name, []).append((request_id, json.loads(messages), json.loads(schema)))
+        return claimed
+
+    def _mark_submitted(self, request_ids: List[str], batch_name: str):
+        with self._lock:
+            self._conn.executemany(
+                "UPDATE batch_requests SET status = 'submitted', batch_name = ?, updated_at = ? WHERE id = ?",
+                [(batch_name, time.time(), request_id) for request_id in request_ids],
+            )
+
+    def _release(self, request_ids: List[str]):
+        """Puts claimed requests back in the queue after a failed submission."""
+        with self._lock:
+            self._conn.executemany(
+                "UPDATE batch_requests SET status = 'queued', updated_at = ? WHERE id = ?",
+                [(time.time(), request_id) for request_id in request_ids],
+            )
+
+    def _pending_batches(self) -> Dict[str, List[str]]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT batch_name, id FROM batch_requests WHERE status = 'submitted'"
+            ).fetchall()
+        batches: Dict[str, List[str]] = {}
+        for batch_name, request_id in rows:
+            batches.setdefault(batch_name, []).append(request_id)
+        return batches
+
+    def _complete(self, results: BatchResults):
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "UPDATE batch_requests SET status = ?, result = ?, error = ?, updated_at = ? WHERE id = ?",
+                [
+                    ("done" if result is not None else "failed", result, error, now, request_id)
+                    for request_id, (result, error) in results.items()
+                ],
+            )
+
+    def _get(self, request_id: str) -> Optional[Tuple[str, Optional[str], Optional[str]]]:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT status, result, error FROM batch_requests WHERE id = ?", (request_id,)
+            ).fetchone()
+
+    def _stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._conn.execute("SELECT status, COUNT(*) FROM batch_requests GROUP BY status").fetchall())
+
+    async def enqueue(self, request_id: str, model_name: str, messages: List[Dict[str, str]], schema: Dict[str, Any]) -> bool:
+        return await asyncio.to_thread(self._enqueue, request_id, model_name, messages, schema)
+
+    async def claim(self, limit: int) -> Dict[str, List[BatchRequest]]:
+        return await asyncio.to_thread(self._claim, limit)
+
+    async def mark_submitted(self, request_ids: List[str], batch_name: str):
+        await asyncio.to_thread(self._mark_submitted, request_ids, batch_name)
+
+    async def release(self, request_ids: List[str]):
+        await asyncio.to_thread(self._release, request_ids)
+
+    async def pending_batches(self) -> Dict[str, List[str]]:
+        return await asyncio.to_thread(self._pending_batches)
+
+    async def complete(self, results: BatchResults):
+        await asyncio.to_thread(self._complete, results)
+
+    async def get(self, request_id: str) -> Optional[Tuple[str, Optional[str], Optional[str]]]:
+        return await asyncio.to_thread(self._get, request_id)
+
+    async def stats(self) -> Dict[str, int]:
+        return await asyncio.to_thread(self._stats)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class BatchProvider(ABC):
+    """Bulk submission interface of an LLM provider's batch API."""
+
+    @abstractmethod
+    async def submit(self, model_name: str, requests: List[BatchRequest]) -> str:
+        """Submits the requests as one batch and returns the batch name."""
+        pass
+
+    @abstractmethod
+    async def poll(self, batch_name: str, request_ids: List[str]) -> Optional[BatchResults]:
+        """Results for `request_ids` once the batch has finished, None while it is still running."""
+        pass
+
+
+class LocalBatchProvider(BatchProvider):
+    """
+    In-process stand-in for a provider batch API, for tests and local runs.
+    Each request is answered by `handler(model_name, messages, schema)`, which
+    returns the result JSON, once the batch is `turnaround` seconds old.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[str, List[Dict[str, str]], Dict[str, Any]], Awaitable[str]],
+        turnaround: float = 0.0,
+    ):
+        self.handler = handler
+        self.turnaround = turnaround
+        self._batches: Dict[str, Tuple[float, str, List[BatchRequest]]] = {}
+
+    async def submit(self, model_name: str, requests: List[BatchRequest]) -> str:
+        batch_name = f"local-batches/{uuid.uuid4().hex}"
+        self._batches[batch_name] = (time.monotonic(), model_name, requests)
+        return batch_name
+
+    async def _answer(self, model_name: str, request: BatchRequest) -> Tuple[Optional[str], Optional[str]]:
+        _, messages, schema = request
+        try:
+            return await self.handler(model_name, messages, schema), None
+        except Exception as e:
+            return None, str(e)
+
+    async def poll(self, batch_name: str, request_ids: List[str]) -> Optional[BatchResults]:
+        batch = self._batches.get(batch_name)
+        if batch is None:
+            # Local batches do not survive a restart.
+            return {request_id: (None, "Local batch lost") for request_id in request_ids}
+        submitted_at, model_name, requests = batch
+        if time.monotonic() - submitted_at < self.turnaround:
+            return None
+        del self._batches[batch_name]
+        answers = await asyncio.gather(*(self._answer(model_name, request) for request in requests))
+        return {request[0]: answer for request, answer in zip(requests, answers)}
+
+
+class GeminiBatchProvider(BatchProvider):
+    """Gemini Batch Mode with inlined requests, billed at the batch discount."""
+
+    FINISHED_STATES = {
+        "JOB_STATE_SUCCEEDED", "JOB_STATE_PARTIALLY_SUCCEEDED", "JOB_STATE_FAILED",
+        "JOB_STATE_CANCELLED", "JOB_STATE_EXPIRED",
+    }
+
+    def __init__(self, api_key: str):
+        from google import genai
+
+        self._client = genai.Client(api_key=api_key)
+
+    @staticmethod
+    def _inline_request(request: BatchRequest) -> Dict[str, Any]:
+        request_id, messages, schema = request
+        system = "\n\n".join(message["content"] for message in messages if message["type"] == "system")
+        contents = [
+            {"role": "model" if message["type"] == "ai" else "user", "parts": [{"text": message["content"]}]}
+            for message in messages if message["type"] != "system"
+        ]
+        config: Dict[str, Any] = {"response_mime_type": "application/json", "response_json_schema": schema}
+        if system:
+            config["system_instruction"] = system
+        return {"contents": contents, "config": config, "metadata": {"request_id": request_id}}
+
+    async def submit(self, model_name: str, requests: List[BatchRequest]) -> str:
+        batch_job = await self._client.aio.batches.create(
+            model=model_name,
+            src=[self._inline_request(request) for request in requests],
+            config={"display_name": f"job-search-agent-{int(time.time())}"},
+        )
+        return batch_job.name
+
+    async def poll(self, batch_name: str, request_ids: List[str]) -> Optional[BatchResults]:
+        batch_job = await self._client.aio.batches.get(name=batch_name)
+        state = batch_job.state.name if batch_job.state is not None else ""
+        if state not in self.FINISHED_STATES:
+            return None
+
+        results: BatchResults = {}
+        responses = (batch_job.dest.inlined_responses if batch_job.dest else None) or []
+        for position, response in enumerate(responses):
+            metadata = response.metadata or {}
+            request_id = metadata.get("request_id") or (request_ids[position] if position < len(request_ids) else None)
+            if request_id is None:
+                continue
+            if response.error is not None or response.response is None:
+                results[request_id] = (None, str(response.error or "Empty response"))
+            else:
+                results[request_id] = (response.response.text, None)
+        for request_id in request_ids:
+            results.setdefault(request_id, (None, f"Batch {batch_name} finished as {state}"))
+        return results
+
+
+class DeferredExecutor:
+    """
+    Deferred ("batch mode") execution of structured LLM calls for non-interactive work.
+
+    Callers enqueue requests in the durable job table. A worker loop submits them in
+    bulk per model, polls the provider, and writes results back to the table, where
+    waiting callers pick them up. The worker is started explicitly: by the API lifespan
+    when LLM_BATCH_WORKER_ENABLED is set, or as a standalone process (`main`). Deferred
+    calls do not go through the interactive rate limiter.
+    """
+
+    def __init__(self, store: BatchJobStore, provider: BatchProvider, max_batch_size: int, poll_interval: float):
+        self.store = store
+        self.provider = provider
+        self.max_batch_size = max_batch_size
+        self.poll_interval = poll_interval
+        self._task: Optional[asyncio.Task] = None
+
+    async def submit(self, model_name: str, messages: Sequence[Any], schema: Type[BaseModel]) -> Tuple[str, bool]:
+        """
+        Queues a request and returns its id, and whether it was newly queued
+        (identical requests share one id and one provider call).
+        """
+        request_id = cache_key(model_name, messages, schema)
+        created = await self.store.enqueue(request_id, model_name, serialize_messages(messages), schema.model_json_schema())
+        return request_id, created
+
+    async def result(self, request_id: str, schema: Type[T]) -> Optional[T]:
+        """The validated result, None while the request is pending."""
+        row = await self.store.get(request_id)
+        if row is None:
+            raise KeyError(request_id)
+        status, result, error = row
+        if status == "done":
+            return schema.model_validate_json(result)
+        if status == "failed":
+            raise BatchRequestFailed(error)
+        return None
+
+    async def wait(self, request_id: str, schema: Type[T], timeout: Optional[float] = None) -> T:
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while True:
+            result = await self.result(request_id, schema)
+            if result is not None:
+                return result
+            if deadline is not None and time.monotonic() >= deadline:
+                raise asyncio.TimeoutError(f"Deferred request {request_id} still pending")
+            await asyncio.sleep(self.poll_interval)
+
+    async def flush(self) -> int:
+        """Submits every queued request, in batches of up to `max_batch_size` per model."""
+        submitted = 0
+        while True:
+            claimed = await self.store.claim(self.max_batch_size)
+            if not claimed:
+                return submitted
+            for model_name, requests in claimed.items():
+                request_ids = [request[0] for request in requests]
+                try:
+                    batch_name = await self.provider.submit(model_name, requests)
+                except Exception as e:
+                    logger.warning(f"Batch submission for {model_name} failed, requeued {len(requests)} requests: {e}")
+                    await self.store.release(request_ids)
+                    return submitted
+                await self.store.mark_submitted(request_ids, batch_name)
+                submitted += len(requests)
+                logger.info(f"Submitted batch {batch_name}: {len(requests)} requests for {model_name}")
+
+    async def poll(self) -> int:
+        """Collects the results of finished batches; returns how many requests completed."""
+        completed = 0
+        for batch_name, request_ids in (await self.store.pending_batches()).items():
+            try:
+                results = await self.provider.poll(batch_name, request_ids)
+            except Exception as e:
+                logger.warning(f"Polling batch {batch_name} failed: {e}")
+                continue
+            if results is not None:
+                await self.store.complete(results)
+                completed += len(results)
+        return completed
+
+    async def run_forever(self):
+        while True:
+            try:
+                await self.flush()
+                await self.poll()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Batch worker pass failed: {e}")
+            await asyncio.sleep(self.poll_interval)
+
+    def start(self) -> asyncio.Task:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run_forever())
+        return self._task
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def stats(self) -> Dict[str, int]:
+        return await self.store.stats()
+
+
+async def main():
+    """Runs the batch worker as a standalone process, e.g. next to a nightly re-matching job."""
+    from job_search_agent.core.llm_gateways.gateway import get_gateway
+
+    logging.basicConfig(level=logging.INFO)
+    executor = get_gateway().deferred_executor()
+    try:
+        await executor.run_forever()
+    finally:
+        executor.store.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,33 @@
+import time
+
+from job_search_agent.core.llm_gateways.gateway import LLMGateway
+
+
+def main(iterations: int = 200):
+    """Compares building a structured Gemini client per call with reusing the pooled one."""
+    from job_search_agent.core.orchestration.models.matching_models import BatchJobMatchResult
+
+    gateway = LLMGateway()
+    model_name = gateway.model_router.target_model("advanced")
+
+    start = time.perf_counter()
+    gateway.structured_client(model_name, BatchJobMatchResult)
+    first = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        gateway._create_client(model_name).with_structured_output(BatchJobMatchResult)
+    fresh = (time.perf_counter() - start) / iterations
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        gateway.structured_client(model_name, BatchJobMatchResult)
+    pooled = (time.perf_counter() - start) / iterations
+
+    print(f"first (lazy) creation: {first * 1000:.2f}ms")
+    print(f"per call, new client:  {fresh * 1000:.3f}ms")
+    print(f"per call, pooled:      {pooled * 1e6:.2f}us")
+
+
+if __name__ == "__main__":
+    main()
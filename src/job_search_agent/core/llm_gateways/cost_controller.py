@@ -1,40 +1,123 @@
+import asyncio
+import logging
+import time
+from typing import Optional
+
+from job_search_agent.configs.setting import get_settings
+from job_search_agent.core.llm_gateways.usage_ledger import UsageLedger, current_period, get_usage_ledger
 from job_search_agent.utils.helper import get_config_file
 
+logger = logging.getLogger(__name__)
+
+
+class BudgetExceeded(Exception):
+    """Raised when a call would take this month's LLM spend over the budget limit."""
+
 
 class CostController:
-    # Hardcoded global state for the session (Simulates a DB)
-    _total_spent = 0.0
+    """
+    Prices LLM calls and enforces the monthly budget against the shared usage ledger.
 
-    def __init__(self):
+    The period's spend is kept in memory so budget checks never touch SQLite on the
+    event loop: every recorded call returns the ledger's new total (which includes the
+    other workers' calls), and `refresh_spent` re-reads it in a thread when it is older
+    than LLM_BUDGET_REFRESH_SECONDS.
+    """
+
+    def __init__(self, ledger: Optional[UsageLedger] = None):
         config = get_config_file()
         self.pricing = config['models']
         self.opt_features = config['optimization_features']
-        self.budget_limit = 10.00
+        settings = get_settings()
+        self.budget_limit = settings.LLM_BUDGET_LIMIT
+        self.refresh_interval = settings.LLM_BUDGET_REFRESH_SECONDS
+        self.ledger = ledger or get_usage_ledger()
+        self._spent = 0.0
+        self._spent_period: Optional[str] = None
+        self._spent_at = 0.0
 
-    @classmethod
-    def get_spent(cls):
-        return cls._total_spent
+    def get_spent(self) -> float:
+        """This month's spend across all workers, as of the last record or refresh."""
+        if self._spent_period != current_period():
+            return 0.0
+        return self._spent
 
-    def estimate_cost(self, model_id, prompt_tokens, expected_output=800):
-        model_cfg = self.pricing.get(model_id)
+    def _set_spent(self, spent: float):
+        self._spent = spent
+        self._spent_period = current_period()
+        self._spent_at = time.monotonic()
+
+    async def refresh_spent(self, force: bool = False):
+        """Re-reads the period's spend from the ledger if the in-memory total is stale."""
+        stale = self._spent_period != current_period() or time.monotonic() - self._spent_at >= self.refresh_interval
+        if force or stale:
+            self._set_spent(await asyncio.to_thread(self.ledger.total_cost))
+
+    def _input_rate(self, model_cfg, prompt_tokens) -> float:
+        p = model_cfg['pricing']
+        if "input_short_context" in p:
+            return p['input_short_context'] if prompt_tokens < p['context_threshold'] else p['input_long_context']
+        return p['input_per_million']
 
-        if "input_short_context" in model_cfg['pricing']:
-            p = model_cfg['pricing']
-            rate = p['input_short_context'] if prompt_tokens < p['context_threshold'] else p['input_long_context']
-            input_cost = (prompt_tokens / 1_000_000) * rate
-        else:
-            input_cost = (prompt_tokens / 1_000_000) * model_cfg['pricing']['input_per_million']
+    def _batch_discount(self, model_cfg) -> float:
+        return model_cfg['pricing'].get('batch_discount', self.opt_features['batching']['cost_reduction'])
+
+    def estimate_cost(self, model_id, prompt_tokens, expected_output=800, batch=False):
+        model_cfg = self.pricing.get(model_id)
+        input_cost = (prompt_tokens / 1_000_000) * self._input_rate(model_cfg, prompt_tokens)
 
         cache_cfg = self.opt_features['caching']
         if cache_cfg['enabled'] and prompt_tokens >= cache_cfg['min_context_tokens']:
             input_cost *= cache_cfg['cost_multiplier']  # 0.10 multiplier
 
         output_cost = (expected_output / 1_000_000) * model_cfg['pricing'].get('output_per_million', 10.0)
+        if batch:
+            # Batch mode is billed at a discount on both input and output tokens.
+            return (input_cost + output_cost) * (1 - self._batch_discount(model_cfg))
+        return input_cost + output_cost
+
+    def usage_cost(self, model_id, input_tokens, output_tokens, cached_tokens=0, batch=False) -> float:
+        """
+        Cost of measured usage: the `cached_tokens` of the prompt that were read from the
+        provider's context cache are billed at the cached rate, the rest at the full rate.
+        """
+        model_cfg = self.pricing.get(model_id)
+        if model_cfg is None:
+            return 0.0
+        rate = self._input_rate(model_cfg, input_tokens)
+        cached_tokens = min(cached_tokens, input_tokens)
+        input_cost = ((input_tokens - cached_tokens) / 1_000_000) * rate
+        input_cost += (cached_tokens / 1_000_000) * rate * self.opt_features['caching']['cost_multiplier']
+
+        output_cost = (output_tokens / 1_000_000) * model_cfg['pricing'].get('output_per_million', 10.0)
+        if batch:
+            return (input_cost + output_cost) * (1 - self._batch_discount(model_cfg))
         return input_cost + output_cost
 
     def can_afford(self, estimated_cost):
-        return (self._total_spent + estimated_cost) < self.budget_limit
+        return (self.get_spent() + estimated_cost) < self.budget_limit
+
+    def check_budget(self, model_id, prompt_tokens, batch=False):
+        """Raises BudgetExceeded when the estimated call does not fit in the remaining budget."""
+        cost_est = self.estimate_cost(model_id, prompt_tokens, batch=batch)
+        if not self.can_afford(cost_est):
+            logger.warning(
+                "Budget limit reached: spent $%.4f of $%.2f, estimated $%.4f for %s",
+                self.get_spent(), self.budget_limit, cost_est, model_id,
+            )
+            raise BudgetExceeded(
+                f"Monthly LLM budget of ${self.budget_limit:.2f} reached "
+                f"(spent ${self.get_spent():.4f}, next call estimated at ${cost_est:.4f})"
+            )
+
+    async def record_usage(self, model_id, input_tokens, output_tokens, agent=None, batch=False, cached_tokens=0) -> float:
+        """Prices the measured tokens of a call and adds them to the ledger."""
+        cost = self.usage_cost(model_id, input_tokens, output_tokens, cached_tokens=cached_tokens, batch=batch)
+        spent = await self.ledger.record(model_id, input_tokens, output_tokens, cost, agent=agent, batch=batch)
+        self._set_spent(spent)
+        return cost
 
-    def commit_spend(self, actual_cost):
-        CostController._total_spent += actual_cost
-        print(f" Spend Updated: ${actual_cost:.4f} | Total: ${self._total_spent:.4f}")
\ No newline at end of file
+    async def usage_report(self) -> dict:
+        report = await self.ledger.rollup()
+        report["budget_limit"] = self.budget_limit
+        return report
@@ -1,10 +1,23 @@
-from langchain.chat_models import init_chat_model
-from langchain_google_genai import ChatGoogleGenerativeAI
+import json
+import threading
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple, Type, TypeVar, Union
 
-from job_search_agent.core.llm_gateways.cost_controller import CostController
+from pydantic import BaseModel
+
+from job_search_agent.core.llm_gateways.batch_jobs import (
+    BatchJobStore,
+    DeferredExecutor,
+    GeminiBatchProvider,
+    LocalBatchProvider,
+)
+from job_search_agent.core.llm_gateways.hedging import LatencyPolicy, hedged_call, with_fallback
 from job_search_agent.core.llm_gateways.model_router import get_model_router
+from job_search_agent.core.llm_gateways.response_cache import cache_key, get_llm_response_cache
+from job_search_agent.core.llm_gateways.token_estimator import get_token_estimator
 from job_search_agent.configs.setting import get_settings
 
+T = TypeVar("T", bound=BaseModel)
+
 class LLMGateway:
     """
     Production-ready Gateway with Cost Control, Routing, and Observability.
@@ -12,20 +25,291 @@ class LLMGateway:
     
     def __init__(self):
         self.settings = get_settings()
-        self.cost_controller = CostController()
         self.model_router = get_model_router()
+        # The router's controller, so budget checks see the spend this gateway records.
+        self.cost_controller = self.model_router.controller
+        self.response_cache = get_llm_response_cache()
+        # Long-lived clients, created on first use: one chat model per model name (so
+        # its HTTP transport is shared) and one structured-output runnable per (model, schema).
+        self._clients: Dict[str, Any] = {}
+        self._structured: Dict[Tuple[str, type, bool], Any] = {}
+        self._clients_lock = threading.Lock()
+        self._deferred: Optional[DeferredExecutor] = None
+        # Per-complexity hedge delays and hedge/fallback counters.
+        self._latency_policies: Dict[str, LatencyPolicy] = {}
 
-    def get_llm(self, prompt_tokens: int, complexity: str):
-        model_name = self.model_router.get_model(complexity, prompt_tokens)
-
+    def _create_client(self, model_name: str):
+        # Provider SDKs are imported with the first client, not with the API process.
         if model_name.startswith("gemini"):
+            from langchain_google_genai import ChatGoogleGenerativeAI
+
             return ChatGoogleGenerativeAI(
                 model=model_name,
                 api_key=self.settings.GOOGLE_API_KEY.get_secret_value()
             )
         else:
+            from langchain.chat_models import init_chat_model
             return init_chat_model(model_name)
 
+    def client(self, model_name: str):
+        client = self._clients.get(model_name)
+        if client is None:
+            with self._clients_lock:
+                client = self._clients.get(model_name)
+                if client is None:
+                    client = self._clients[model_name] = self._create_client(model_name)
+        return client
+
+    def structured_client(self, model_name: str, schema: Type[BaseModel], include_raw: bool = False):
+        key = (model_name, schema, include_raw)
+        runnable = self._structured.get(key)
+        if runnable is None:
+            llm = self.client(model_name)
+            with self._clients_lock:
+                runnable = self._structured.get(key)
+                if runnable is None:
+                    runnable = self._structured[key] = llm.with_structured_output(schema, include_raw=include_raw)
+        return runnable
+
+    def get_llm(self, prompt_tokens: int, complexity: str):
+        return self.client(self.model_router.get_model(complexity, prompt_tokens))
+
+    def get_structured_llm(self, prompt_tokens: int, complexity: str, schema: Type[BaseModel]):
+        return self.structured_client(self.model_router.get_model(complexity, prompt_tokens), schema)
+
+    async def ainvoke_structured(
+        self,
+        messages: Sequence[Any],
+        schema: Type[T],
+        prompt_tokens: int,
+        complexity: str,
+        agent: Optional[str] = None,
+    ) -> T:
+        """
+        Invokes the routed model with structured output. Identical requests (same
+        model, rendered messages and schema) are answered from the response cache
+        without calling the provider; the rest queue for the model's rate limits.
+        Slow calls are hedged and failing models fall back along the model's chain.
+        The tokens reported in the response metadata are recorded in the usage ledger.
+        """
+        key = None
+        if self.response_cache is not None:
+            key = cache_key(self.model_router.target_model(complexity), messages, schema)
+            cached = await self.response_cache.get(key, schema)
+            if cached is not None:
+                return cached
+
+        await self.cost_controller.refresh_spent()
+        model_name = self.model_router.get_model(complexity, prompt_tokens)
+        result, answered_by = await self._invoke_with_latency_policy(
+            model_name, messages, schema, prompt_tokens, complexity, agent
+        )
+        # The key names the routed model; a hedge or fallback answer must not be served as its response.
+        if key is not None and answered_by == model_name and isinstance(result, schema):
+            await self.response_cache.put(key, result)
+        return result
+
+    async def _invoke_model(
+        self,
+        model_name: str,
+        messages: Sequence[Any],
+        schema: Type[T],
+        prompt_tokens: int,
+        agent: Optional[str],
+    ) -> T:
+        await self.model_router.acquire(model_name, prompt_tokens)
+        output = await self.structured_client(model_name, schema, include_raw=True).ainvoke(messages)
+        result = output["parsed"]
+        usage = getattr(output["raw"], "usage_metadata", None) or {}
+        await self._record_usage(model_name, usage, prompt_tokens, self._output_tokens(result), agent)
+        if output["parsing_error"] is not None:
+            raise output["parsing_error"]
+        return result
+
+    def latency_policy(self, complexity: str) -> LatencyPolicy:
+        policy = self._latency_policies.get(complexity)
+        if policy is None:
+            policy = self._latency_policies[complexity] = LatencyPolicy(
+                percentile=self.settings.LLM_HEDGE_PERCENTILE,
+                min_delay=self.settings.LLM_HEDGE_MIN_DELAY,
+                initial_delay=self.settings.LLM_HEDGE_INITIAL_DELAY,
+            )
+        return policy
+
+    async def _invoke_with_latency_policy(
+        self,
+        model_name: str,
+        messages: Sequence[Any],
+        schema: Type[T],
+        prompt_tokens: int,
+        complexity: str,
+        agent: Optional[str],
+    ) -> Tuple[T, str]:
+        """
+        Calls `model_name`, hedging with the next model of its fallback chain when the
+        call outlives the complexity's latency percentile, and moving down the chain
+        on rate-limit or 5xx errors. Returns the result and the model that produced it.
+        """
+        policy = self.latency_policy(complexity)
+        policy.calls += 1
+        chain = self.model_router.fallback_chain(model_name) if self.settings.LLM_FALLBACK_ENABLED else [model_name]
+
+        async def call(model: str) -> T:
+            return await self._invoke_model(model, messages, schema, prompt_tokens, agent)
+
+        def loser_cost(model: str) -> float:
+            if model not in self.cost_controller.pricing:
+                return 0.0
+            return self.cost_controller.estimate_cost(model, prompt_tokens)
+
+        async def attempt(models: List[str]) -> Tuple[T, str]:
+            alternative = models[1] if self.settings.LLM_HEDGE_ENABLED and len(models) > 1 else None
+            return await hedged_call(policy, call, models[0], alternative, loser_cost)
+
+        return await with_fallback(policy, chain, attempt)
+
+    def latency_stats(self) -> Dict[str, dict]:
+        return {complexity: policy.stats() for complexity, policy in self._latency_policies.items()}
+
+    async def astream_structured(
+        self,
+        messages: Sequence[Any],
+        schema: Type[T],
+        prompt_tokens: int,
+        complexity: str,
+        agent: Optional[str] = None,
+    ) -> AsyncIterator[Union[Dict[str, Any], T]]:
+        """
+        Streams a structured response in JSON mode: yields the partially parsed
+        object (a dict) after every chunk, then the complete object validated
+        against `schema`. Cached responses are yielded whole. Streams are rate
+        limited, recorded and cached like `ainvoke_structured`, but not hedged,
+        since their first tokens have already gone to the client.
+        """
+        key = None
+        target_model = self.model_router.target_model(complexity)
+        if self.response_cache is not None:
+            key = cache_key(target_model, messages, schema)
+            cached = await self.response_cache.get(key, schema)
+            if cached is not None:
+                yield cached.model_dump()
+                yield cached
+                return
+
+        await self.cost_controller.refresh_spent()
+        model_name = self.model_router.get_model(complexity, prompt_tokens)
+        await self.model_router.acquire(model_name, prompt_tokens)
+        llm = self.client(model_name).bind(
+            response_mime_type="application/json",
+            response_json_schema=schema.model_json_schema(),
+        )
+        from langchain_core.utils.json import parse_partial_json
+
+        text = ""
+        aggregate = None
+        async for chunk in llm.astream(messages):
+            aggregate = chunk if aggregate is None else aggregate + chunk
+            if chunk.text:
+                text += chunk.text
+                partial = parse_partial_json(text)
+                if isinstance(partial, dict):
+                    yield partial
+
+        usage = (aggregate.usage_metadata if aggregate is not None else None) or {}
+        await self._record_usage(model_name, usage, prompt_tokens, get_token_estimator().count(text), agent)
+        result = schema.model_validate_json(text)
+        if key is not None and model_name == target_model:
+            await self.response_cache.put(key, result)
+        yield result
+
+    async def _record_usage(
+        self,
+        model_name: str,
+        usage: Dict[str, Any],
+        prompt_tokens: int,
+        output_tokens: int,
+        agent: Optional[str],
+    ):
+        """
+        Records a call's `usage_metadata`; the estimated token counts stand in when the
+        provider reported none. Prompt tokens served from the provider's context cache
+        (`input_token_details.cache_read`) are billed at the cached rate.
+        """
+        await self.cost_controller.record_usage(
+            model_name,
+            usage.get("input_tokens", prompt_tokens),
+            usage.get("output_tokens", output_tokens),
+            agent=agent,
+            cached_tokens=(usage.get("input_token_details") or {}).get("cache_read", 0),
+        )
+
+    @staticmethod
+    def _output_tokens(result: Any) -> int:
+        """Estimated output tokens, for responses without usage metadata."""
+        if isinstance(result, BaseModel):
+            return get_token_estimator().count(result.model_dump_json())
+        return 0
+
+    async def _local_batch_handler(self, model_name: str, messages: List[Dict[str, str]], schema: Dict[str, Any]) -> str:
+        """Answers a request of the local batch stand-in with a regular structured call."""
+        runnable = self.client(model_name).with_structured_output(schema)
+        result = await runnable.ainvoke([(message["type"], message["content"]) for message in messages])
+        return json.dumps(result, ensure_ascii=False)
+
+    def deferred_executor(self) -> DeferredExecutor:
+        if self._deferred is None:
+            if self.settings.LLM_BATCH_PROVIDER == "local":
+                provider = LocalBatchProvider(self._local_batch_handler)
+            else:
+                provider = GeminiBatchProvider(self.settings.GOOGLE_API_KEY.get_secret_value())
+            self._deferred = DeferredExecutor(
+                BatchJobStore(self.settings.LLM_BATCH_PATH, claim_lease=self.settings.LLM_BATCH_CLAIM_LEASE),
+                provider,
+                max_batch_size=self.settings.LLM_BATCH_MAX_REQUESTS,
+                poll_interval=self.settings.LLM_BATCH_POLL_INTERVAL,
+            )
+        return self._deferred
+
+    async def deferred_stats(self) -> Optional[Dict[str, int]]:
+        """Deferred request counts by status, None if batch mode was never used in this process."""
+        return await self._deferred.stats() if self._deferred is not None else None
+
+    async def ainvoke_deferred(
+        self,
+        messages: Sequence[Any],
+        schema: Type[T],
+        prompt_tokens: int,
+        complexity: str,
+        agent: Optional[str] = None,
+    ) -> T:
+        """
+        Like `ainvoke_structured`, but through the provider's batch mode: half the
+        price and no interactive rate-limit headroom, with results in minutes to
+        hours. Requests wait in the job table until a batch worker submits them (see
+        DeferredExecutor); this call does not start one.
+        """
+        await self.cost_controller.refresh_spent()
+        model_name = self.model_router.get_model(complexity, prompt_tokens, batch=True)
+        key = None
+        if self.response_cache is not None:
+            key = cache_key(model_name, messages, schema)
+            cached = await self.response_cache.get(key, schema)
+            if cached is not None:
+                return cached
+
+        executor = self.deferred_executor()
+        request_id, created = await executor.submit(model_name, messages, schema)
+        result = await executor.wait(request_id, schema, timeout=self.settings.LLM_BATCH_TIMEOUT)
+        if created:
+            # Batch results carry no usage metadata here, so these are estimates; identical
+            # requests share one provider call and are recorded once.
+            await self.cost_controller.record_usage(
+                model_name, prompt_tokens, self._output_tokens(result), agent=agent, batch=True
+            )
+        if key is not None:
+            await self.response_cache.put(key, result)
+        return result
+
 _gateway = None
 def get_gateway() -> LLMGateway:
     global _gateway
@@ -0,0 +1,147 @@
+import asyncio
+import logging
+from collections import deque
+from typing import Any, Awaitable, Callable, List, Optional, Tuple, TypeVar
+
+from job_search_agent.core.llm_gateways.rate_limiter import RateLimitExceeded
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# HTTP statuses worth retrying on another model: throttling and server-side failures.
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+_RETRYABLE_MARKERS = ("RESOURCE_EXHAUSTED", "UNAVAILABLE", "INTERNAL", "DEADLINE_EXCEEDED")
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Rate-limit and 5xx errors, from our own limiter or the provider SDK."""
+    if isinstance(error, RateLimitExceeded):
+        return True
+    for attribute in ("status_code", "code", "status"):
+        value = getattr(error, attribute, None)
+        if isinstance(value, int) and value in RETRYABLE_STATUS_CODES:
+            return True
+    # Wrapped SDK errors (e.g. ChatGoogleGenerativeAIError) keep the API status only in the message.
+    message = str(error)
+    return any(marker in message for marker in _RETRYABLE_MARKERS)
+
+
+class LatencyPolicy:
+    """
+    Hedging policy of one task complexity.
+
+    The hedge delay is the `percentile` of the last `window` call latencies,
+    clamped to at least `min_delay`; until `min_samples` latencies are known
+    it is `initial_delay`. Only calls slower than nearly all recent ones are
+    hedged, which bounds the extra cost to roughly (100 - percentile)% of calls.
+    """
+
+    def __init__(
+        self,
+        percentile: float,
+        min_delay: float,
+        initial_delay: float,
+        window: int = 200,
+        min_samples: int = 20,
+    ):
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.initial_delay = initial_delay
+        self.min_samples = min_samples
+        self._latencies = deque(maxlen=window)
+
+        # Metrics
+        self.calls = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        self.fallbacks = 0
+        self.overhead_cost = 0.0
+
+    def record(self, seconds: float):
+        self._latencies.append(seconds)
+
+    def delay(self) -> float:
+        if len(self._latencies) < self.min_samples:
+            return self.initial_delay
+        ordered = sorted(self._latencies)
+        index = min(len(ordered) - 1, int(len(ordered) * self.percentile / 100))
+        return max(self.min_delay, ordered[index])
+
+    def stats(self) -> dict:
+        return {
+            "calls": self.calls,
+            "hedged": self.hedged,
+            "hedge_rate": self.hedged / self.calls if self.calls else 0.0,
+            "hedge_wins": self.hedge_wins,
+            "fallbacks": self.fallbacks,
+            "hedge_delay_s": self.delay(),
+            "estimated_overhead_cost": self.overhead_cost,
+        }
+
+
+async def hedged_call(
+    policy: LatencyPolicy,
+    call: Callable[[str], Awaitable[T]],
+    primary: str,
+    alternative: Optional[str],
+    loser_cost: Callable[[str], float],
+) -> Tuple[T, str]:
+    """
+    Runs `call(primary)`; if it has not returned after the policy's delay, also runs
+    `call(alternative)`. Returns the first valid result and the model that produced
+    it, and cancels the other call. Raises the primary's error if both fail.
+    """
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    primary_task = asyncio.ensure_future(call(primary))
+    tasks = {primary_task: primary}
+    try:
+        done, _ = await asyncio.wait({primary_task}, timeout=None if alternative is None else policy.delay())
+        if done:
+            policy.record(loop.time() - started)
+            return primary_task.result(), primary
+
+        policy.hedged += 1
+        hedge_task = asyncio.ensure_future(call(alternative))
+        tasks[hedge_task] = alternative
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is not None:
+                    continue
+                if task is hedge_task:
+                    policy.hedge_wins += 1
+                loser_task = hedge_task if task is primary_task else primary_task
+                if not loser_task.done() or loser_task.exception() is None:
+                    # The losing request reached the provider and is billed even when cancelled.
+                    policy.overhead_cost += loser_cost(tasks[loser_task])
+                # A cancelled primary is at least this slow; recording it keeps the percentile honest.
+                policy.record(loop.time() - started)
+                return task.result(), tasks[task]
+        policy.record(loop.time() - started)
+        raise primary_task.exception()
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+
+
+async def with_fallback(
+    policy: LatencyPolicy,
+    models: List[str],
+    attempt: Callable[[List[str]], Awaitable[Any]],
+):
+    """Calls `attempt(models[i:])` down the chain while it fails with retryable errors."""
+    last_error: Optional[BaseException] = None
+    for i in range(len(models)):
+        try:
+            return await attempt(models[i:])
+        except Exception as e:
+            if not is_retryable(e) or i == len(models) - 1:
+                raise
+            last_error = e
+            policy.fallbacks += 1
+            logger.warning(f"{models[i]} failed ({e}), falling back to {models[i + 1]}")
+    raise last_error
@@ -1,8 +1,7 @@
-import time
-from collections import deque
-from pathlib import Path
+from typing import List
 
 from job_search_agent.core.llm_gateways.cost_controller import CostController
+from job_search_agent.core.llm_gateways.rate_limiter import get_rate_limiter
 from job_search_agent.utils.helper import get_config_file
 
 
@@ -10,45 +9,45 @@ class ModelRouter:
     def __init__(self):
         self.config = get_config_file()
         self.controller = CostController()
+        # Shared per-model RPM/RPD/TPM windows; callers queue in `acquire` when a limit is hit.
+        self.rate_limiter = get_rate_limiter()
 
-        # In-memory request trackers: { "model_name": deque([timestamps]) }
-        self.history = {model: deque() for model in self.config['models']}
-
-    def _is_rate_limited(self, model_name: str) -> bool:
-        """Checks if the model has hit RPM or RPD limits."""
-        now = time.time()
-        limits = self.config['models'][model_name]['limits']['free_tier']
-        usage = self.history[model_name]
-
-        while usage and usage[0] < now - 86400:
-            usage.popleft()
-
-        if len(usage) >= limits['rpd']:
-            return True
-
-        rpm_count = sum(1 for t in usage if t > now - 60)
-        if rpm_count >= limits['rpm']:
-            return True
-
-        return False
-
-    def get_model(self, complexity: str, prompt_tokens: int):
-        target_model = "gemini-2.5-flash-lite"  # Default
+    def target_model(self, complexity: str) -> str:
+        """The model configured for a complexity tier, without recording a request."""
         for name, details in self.config['models'].items():
             if details['task_complexity'] == complexity:
-                target_model = name
-                break
-
-        cost_est = self.controller.estimate_cost(target_model, prompt_tokens)
-        can_afford = self.controller.can_afford(cost_est)
-
-        is_limited = self._is_rate_limited(target_model)
+                return name
+        return "gemini-2.5-flash-lite"  # Default
+
+    def fallback_chain(self, model_name: str) -> List[str]:
+        """
+        `model_name`, then the other models of its complexity tier, then its configured
+        `fallback_models`: the order in which hedges and fallbacks try alternatives.
+        """
+        details = self.config['models'].get(model_name, {})
+        chain = [model_name]
+        chain += [
+            name for name, other in self.config['models'].items()
+            if other['task_complexity'] == details.get('task_complexity')
+        ]
+        chain += details.get('fallback_models', [])
+        return list(dict.fromkeys(chain))
+
+    def get_model(self, complexity: str, prompt_tokens: int, batch: bool = False):
+        target_model = self.target_model(complexity)
+
+        # Raises BudgetExceeded instead of letting the call over the monthly limit.
+        self.controller.check_budget(target_model, prompt_tokens, batch=batch)
+        return target_model
 
-        if can_afford and not is_limited:
-            self.history[target_model].append(time.time())
-            return target_model
+    async def acquire(self, model_name: str, prompt_tokens: int):
+        """Waits until the model's rate limits admit a request of `prompt_tokens`."""
+        await self.rate_limiter.acquire(model_name, prompt_tokens)
 
-        return target_model
 
-def get_model_router():
-    return ModelRouter()
\ No newline at end of file
+_model_router = None
+def get_model_router() -> ModelRouter:
+    global _model_router
+    if _model_router is None:
+        _model_router = ModelRouter()
+    return _model_router
@@ -20,5 +20,3 @@ def init_langsmith():
         print(f"LangSmith Tracing Configured for Project: {settings.LANGCHAIN_PROJECT}")
     else:
         print("LangSmith Tracing is disabled (API Key not found).")
-
-init_langsmith()
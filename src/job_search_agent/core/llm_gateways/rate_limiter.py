@@ -0,0 +1,166 @@
+import asyncio
+import time
+from typing import Dict, Optional
+
+from job_search_agent.configs.setting import get_settings
+from job_search_agent.utils.helper import get_config_file
+
+
+class RateLimitExceeded(Exception):
+    """Raised when a request could not be admitted within the allowed wait."""
+
+
+class SlidingWindowCounter:
+    """
+    Approximate sliding-window sum over `window` seconds, kept in a ring of
+    `buckets` fixed-width buckets with a running total. Adding and checking
+    are amortized O(1). Only the wait-time computation for an over-limit
+    request walks the ring.
+    """
+
+    def __init__(self, window: float, buckets: int):
+        self.width = window / buckets
+        self.buckets = buckets
+        self._counts = [0.0] * buckets
+        self._head = 0
+        self.total = 0.0
+
+    def _advance(self, now: float):
+        slot = int(now // self.width)
+        if slot - self._head >= self.buckets:
+            self._counts = [0.0] * self.buckets
+            self.total = 0.0
+        else:
+            for expired in range(self._head + 1, slot + 1):
+                index = expired % self.buckets
+                self.total -= self._counts[index]
+                self._counts[index] = 0.0
+        self._head = max(self._head, slot)
+
+    def add(self, now: float, amount: float):
+        self._advance(now)
+        self._counts[self._head % self.buckets] += amount
+        self.total += amount
+
+    def current(self, now: float) -> float:
+        self._advance(now)
+        return self.total
+
+    def wait_time(self, now: float, amount: float, limit: float) -> float:
+        """Seconds until `amount` more fits under `limit` (inf if it never can)."""
+        self._advance(now)
+        excess = self.total + amount - limit
+        if excess <= 0:
+            return 0.0
+        if amount > limit:
+            return float("inf")
+        freed = 0.0
+        for slot in range(self._head - self.buckets + 1, self._head + 1):
+            freed += self._counts[slot % self.buckets]
+            if freed >= excess:
+                # Bucket `slot` drops out once the head reaches slot + buckets.
+                return max(0.0, (slot + self.buckets) * self.width - now)
+        return float("inf")
+
+
+class ModelRateLimiter:
+    """
+    RPM, RPD and TPM limits for one model, shared by every caller in the process.
+
+    Callers are admitted strictly in arrival order: the head of the queue sleeps
+    until every window has room, so bursts wait here instead of failing upstream
+    with 429s. A request that would wait longer than `max_wait`, or that can
+    never fit (e.g. more tokens than the TPM limit), is rejected.
+    """
+
+    def __init__(self, rpm: Optional[int], rpd: Optional[int], tpm: Optional[int], max_wait: float):
+        self.max_wait = max_wait
+        self._windows = []
+        if rpm:
+            self._windows.append(("rpm", SlidingWindowCounter(60, 60), rpm, False))
+        if rpd:
+            self._windows.append(("rpd", SlidingWindowCounter(86_400, 1_440), rpd, False))
+        if tpm:
+            self._windows.append(("tpm", SlidingWindowCounter(60, 60), tpm, True))
+        self._lock = asyncio.Lock()
+
+        # Metrics
+        self.waiting = 0
+        self.granted = 0
+        self.rejected = 0
+        self.total_wait = 0.0
+        self.max_observed_wait = 0.0
+
+    def _wait_time(self, now: float, tokens: int) -> float:
+        return max(
+            (counter.wait_time(now, tokens if is_tokens else 1, limit) for _, counter, limit, is_tokens in self._windows),
+            default=0.0,
+        )
+
+    async def acquire(self, tokens: int):
+        start = time.monotonic()
+        self.waiting += 1
+        try:
+            async with self._lock:
+                while True:
+                    now = time.time()
+                    wait = self._wait_time(now, tokens)
+                    if wait <= 0:
+                        break
+                    if time.monotonic() - start + wait > self.max_wait:
+                        self.rejected += 1
+                        if wait == float("inf"):
+                            raise RateLimitExceeded(f"Request of {tokens} tokens exceeds the model's rate limits")
+                        raise RateLimitExceeded(f"Rate limit wait of {wait:.0f}s exceeds {self.max_wait:.0f}s")
+                    await asyncio.sleep(wait)
+                for _, counter, _, is_tokens in self._windows:
+                    counter.add(now, tokens if is_tokens else 1)
+        finally:
+            self.waiting -= 1
+
+        waited = time.monotonic() - start
+        self.granted += 1
+        self.total_wait += waited
+        self.max_observed_wait = max(self.max_observed_wait, waited)
+
+    def stats(self) -> dict:
+        now = time.time()
+        return {
+            "queue_depth": self.waiting,
+            "granted": self.granted,
+            "rejected": self.rejected,
+            "avg_wait_ms": self.total_wait / self.granted * 1000 if self.granted else 0.0,
+            "max_wait_ms": self.max_observed_wait * 1000,
+            "usage": {name: {"current": counter.current(now), "limit": limit} for name, counter, limit, _ in self._windows},
+        }
+
+
+class RateLimiter:
+    """Per-model limiters built from the configured tier in configs/pricing/current.json."""
+
+    def __init__(self, tier: str, max_wait: float, config: Optional[dict] = None):
+        config = config or get_config_file()
+        self._limiters: Dict[str, ModelRateLimiter] = {}
+        for model, details in config["models"].items():
+            limits = details.get("limits", {}).get(tier, {})
+            self._limiters[model] = ModelRateLimiter(
+                limits.get("rpm"), limits.get("rpd"), limits.get("tpm"), max_wait=max_wait
+            )
+
+    async def acquire(self, model_name: str, tokens: int):
+        """Waits for capacity on the model; unknown models are not limited."""
+        limiter = self._limiters.get(model_name)
+        if limiter is not None:
+            await limiter.acquire(tokens)
+
+    def stats(self) -> dict:
+        return {model: limiter.stats() for model, limiter in self._limiters.items()}
+
+
+_rate_limiter = None
+def get_rate_limiter() -> RateLimiter:
+    global _rate_limiter
+    if _rate_limiter is None:
+        settings = get_settings()
+        _rate_limiter = RateLimiter(settings.LLM_RATE_LIMIT_TIER, settings.LLM_RATE_LIMIT_MAX_WAIT)
+    return _rate_limiter
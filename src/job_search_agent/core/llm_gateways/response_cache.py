@@ -0,0 +1,215 @@
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional, Sequence, Tuple, Type
+
+from pydantic import BaseModel, ValidationError
+
+from job_search_agent.configs.setting import get_settings
+
+
+def cache_key(model_name: str, messages: Sequence[Any], schema: Optional[Type[BaseModel]] = None) -> str:
+    """Hash of the model, the rendered messages and the output schema."""
+    payload = {
+        "model": model_name,
+        "messages": [{"type": message.type, "content": message.content} for message in messages],
+        "schema": schema.model_json_schema() if schema is not None else None,
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+class CacheBackend(ABC):
+    """Key/value storage with per-entry expiry for LLM responses."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: str, ttl: float):
+        pass
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
+
+class MemoryLRUBackend(CacheBackend):
+    """In-process LRU bounded by the total size of the stored values."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _pop(self, key: str):
+        value, _ = self._entries.pop(key)
+        self.size -= len(value)
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[1] <= time.time():
+                self._pop(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def set(self, key: str, value: str, ttl: float):
+        if len(value) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._pop(key)
+            self._entries[key] = (value, time.time() + ttl)
+            self.size += len(value)
+            while self.size > self.max_bytes:
+                self._pop(next(iter(self._entries)))
+
+
+class SQLiteBackend(CacheBackend):
+    """
+    On-disk backend shared by all workers on the host and kept across restarts.
+
+    Every `purge_interval` seconds a write also deletes the expired entries and,
+    if the stored values exceed `max_bytes`, the oldest entries beyond that size.
+    """
+
+    def __init__(self, path: str, max_bytes: int, purge_interval: float = 600):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.purge_interval = purge_interval
+        self._purged_at = 0.0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_responses (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                expires_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM llm_responses").fetchone()[0]
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM llm_responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] <= time.time():
+                self._conn.execute("DELETE FROM llm_responses WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+        return row[0]
+
+    def set(self, key: str, value: str, ttl: float):
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_responses (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, value, now + ttl),
+            )
+            if now - self._purged_at >= self.purge_interval:
+                self._purge(now)
+            self._conn.commit()
+
+    def _purge(self, now: float):
+        self._purged_at = now
+        self._conn.execute("DELETE FROM llm_responses WHERE expires_at <= ?", (now,))
+        # All entries share one TTL, so the latest expiry is the most recently written.
+        self._conn.execute(
+            """
+            DELETE FROM llm_responses WHERE key IN (
+                SELECT key FROM (
+                    SELECT key, SUM(LENGTH(CAST(value AS BLOB))) OVER (ORDER BY expires_at DESC) AS kept
+                    FROM llm_responses
+                ) WHERE kept > ?
+            )
+            """,
+            (self.max_bytes,),
+        )
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class LLMResponseCache:
+    """
+    Exact-match cache of structured LLM outputs.
+
+    Values are stored as the validated Pydantic JSON and validated again on the
+    way out, so a schema change turns old entries into misses rather than errors.
+    """
+
+    def __init__(self, backend: CacheBackend, ttl: float):
+        self.backend = backend
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, key: str, schema: Type[BaseModel]) -> Optional[BaseModel]:
+        value = await asyncio.to_thread(self.backend.get, key)
+        if value is not None:
+            try:
+                result = schema.model_validate_json(value)
+                self.hits += 1
+                return result
+            except ValidationError:
+                pass
+        self.misses += 1
+        return None
+
+    async def put(self, key: str, result: BaseModel):
+        await asyncio.to_thread(self.backend.set, key, result.model_dump_json(), self.ttl)
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "entries": len(self.backend),
+        }
+
+
+_llm_response_cache = None
+def get_llm_response_cache() -> Optional[LLMResponseCache]:
+    """Returns the shared LLM response cache, or None when it is disabled."""
+    global _llm_response_cache
+    settings = get_settings()
+    if not settings.LLM_CACHE_ENABLED:
+        return None
+    if _llm_response_cache is None:
+        if settings.LLM_CACHE_BACKEND == "memory":
+            backend = MemoryLRUBackend(settings.LLM_CACHE_MAX_BYTES)
+        else:
+            backend = SQLiteBackend(
+                settings.LLM_CACHE_PATH,
+                max_bytes=settings.LLM_CACHE_MAX_BYTES,
+                purge_interval=settings.LLM_CACHE_PURGE_INTERVAL,
+            )
+        _llm_response_cache = LLMResponseCache(backend, settings.LLM_CACHE_TTL)
+    return _llm_response_cache
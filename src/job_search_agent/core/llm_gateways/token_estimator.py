@@ -0,0 +1,115 @@
+import json
+import math
+import re
+import threading
+import warnings
+from functools import lru_cache
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Any, Dict, Optional, Type
+
+from pydantic import BaseModel
+
+from job_search_agent.configs.setting import get_settings
+
+if TYPE_CHECKING:
+    from langchain_core.prompts import ChatPromptTemplate
+
+# Letter runs, single digits (Gemma-family tokenizers split numbers digit by digit),
+# single symbols and newline runs.
+_PIECES = re.compile(r"[^\W\d_]+|\d|\n+|[^\w\s]")
+
+# Calibrated character-per-token ratios of the SentencePiece tokenizer Gemini uses:
+# English words are mostly whole tokens, while Azerbaijani / Cyrillic words split into more pieces.
+ASCII_CHARS_PER_TOKEN = 4.0
+NON_ASCII_CHARS_PER_TOKEN = 2.8
+# Role markers and turn separators added around every chat message.
+MESSAGE_OVERHEAD_TOKENS = 4
+
+
+def approximate_tokens(text: str) -> int:
+    """Offline token estimate for Gemini models, without a tokenizer."""
+    tokens = 0
+    for piece in _PIECES.findall(text):
+        if piece[0].isalpha():
+            ratio = ASCII_CHARS_PER_TOKEN if piece.isascii() else NON_ASCII_CHARS_PER_TOKEN
+            tokens += math.ceil(len(piece) / ratio)
+        else:
+            tokens += 1
+    return tokens
+
+
+class TokenEstimator:
+    """
+    Counts prompt tokens for routing and cost estimates.
+
+    Uses Gemini's local SentencePiece tokenizer (google-genai's LocalTokenizer)
+    when `sentencepiece` is installed and the tokenizer model can be loaded, and
+    the calibrated `approximate_tokens` otherwise. The static parts of a prompt
+    template and the output schema are counted once and memoized, so each call
+    only tokenizes its variables.
+    """
+
+    def __init__(self, model_name: str = "gemini-2.5-flash", use_tokenizer: bool = True):
+        self.model_name = model_name
+        self._use_tokenizer = use_tokenizer and find_spec("sentencepiece") is not None
+        self._tokenizer = None
+        self._lock = threading.Lock()
+        self._static: Dict[int, int] = {}
+
+    def _get_tokenizer(self):
+        if self._use_tokenizer and self._tokenizer is None:
+            with self._lock:
+                if self._tokenizer is None and self._use_tokenizer:
+                    try:
+                        from google.genai.local_tokenizer import LocalTokenizer
+                        self._tokenizer = LocalTokenizer(model_name=self.model_name)
+                    except Exception as e:
+                        print(f"Local tokenizer unavailable, using approximate token counts: {e}")
+                        self._use_tokenizer = False
+        return self._tokenizer
+
+    def count(self, text: str) -> int:
+        if not text:
+            return 0
+        tokenizer = self._get_tokenizer()
+        if tokenizer is None:
+            return approximate_tokens(text)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            return tokenizer.count_tokens(text).total_tokens
+
+    def _static_tokens(self, prompt: "ChatPromptTemplate") -> int:
+        key = id(prompt)
+        if key not in self._static:
+            total = 0
+            for message in prompt.messages:
+                template = getattr(message, "prompt", None)
+                if template is not None and hasattr(template, "input_variables"):
+                    # The template text with every placeholder left empty.
+                    text = template.format(**{name: "" for name in template.input_variables})
+                else:
+                    text = getattr(message, "content", "")
+                total += self.count(text) + MESSAGE_OVERHEAD_TOKENS
+            self._static[key] = total
+        return self._static[key]
+
+    @lru_cache(maxsize=64)
+    def _schema_tokens(self, schema: Type[BaseModel]) -> int:
+        return self.count(json.dumps(schema.model_json_schema()))
+
+    def count_prompt(self, prompt: "ChatPromptTemplate", output_schema: Optional[Type[BaseModel]] = None, **variables: Any) -> int:
+        """Tokens of `prompt` formatted with `variables`, plus the structured-output schema if given."""
+        tokens = self._static_tokens(prompt)
+        tokens += sum(self.count(str(value)) for value in variables.values())
+        if output_schema is not None:
+            tokens += self._schema_tokens(output_schema)
+        return tokens
+
+
+_token_estimator = None
+def get_token_estimator() -> TokenEstimator:
+    global _token_estimator
+    if _token_estimator is None:
+        settings = get_settings()
+        _token_estimator = TokenEstimator(use_tokenizer=settings.TOKEN_ESTIMATOR_USE_LOCAL_TOKENIZER)
+    return _token_estimator
@@ -0,0 +1,175 @@
+import asyncio
+import sqlite3
+import threading
+import time
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Dict, Optional
+
+from job_search_agent.configs.setting import get_settings
+
+# Id of the API request being served, set by the API middleware.
+current_request_id: ContextVar[Optional[str]] = ContextVar("current_request_id", default=None)
+
+# Model name of the totals row that sums every model of a period.
+ALL_MODELS = "*"
+
+
+def current_period(now: Optional[float] = None) -> str:
+    """Budget period of a timestamp: the calendar month (UTC), e.g. "2026-10"."""
+    return time.strftime("%Y-%m", time.gmtime(now))
+
+
+class UsageLedger:
+    """
+    LLM token usage and cost, shared by every worker process on the host.
+
+    Each call is appended to `usage_events` (model, agent, request, tokens, cost),
+    and per-period, per-model counters in `usage_totals` are bumped in the same
+    write transaction. Budget checks read one counter row instead of summing events.
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA busy_timeout=5000")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS usage_events (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                created_at REAL NOT NULL,
+                period TEXT NOT NULL,
+                model TEXT NOT NULL,
+                agent TEXT,
+                request_id TEXT,
+                input_tokens INTEGER NOT NULL,
+                output_tokens INTEGER NOT NULL,
+                cost REAL NOT NULL,
+                batch INTEGER NOT NULL DEFAULT 0
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS usage_events_period ON usage_events (period, agent)")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS usage_totals (
+                period TEXT NOT NULL,
+                model TEXT NOT NULL,
+                calls INTEGER NOT NULL,
+                input_tokens INTEGER NOT NULL,
+                output_tokens INTEGER NOT NULL,
+                cost REAL NOT NULL,
+                PRIMARY KEY (period, model)
+            )
+            """
+        )
+
+    def _record(
+        self,
+        model_name: str,
+        input_tokens: int,
+        output_tokens: int,
+        cost: float,
+        agent: Optional[str],
+        request_id: Optional[str],
+        batch: bool,
+    ) -> float:
+        now = time.time()
+        period = current_period(now)
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    """
+                    INSERT INTO usage_events
+                        (created_at, period, model, agent, request_id, input_tokens, output_tokens, cost, batch)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (now, period, model_name, agent, request_id, input_tokens, output_tokens, cost, int(batch)),
+                )
+                self._conn.executemany(
+                    """
+                    INSERT INTO usage_totals (period, model, calls, input_tokens, output_tokens, cost)
+                    VALUES (?, ?, 1, ?, ?, ?)
+                    ON CONFLICT(period, model) DO UPDATE SET
+                        calls = calls + 1,
+                        input_tokens = input_tokens + excluded.input_tokens,
+                        output_tokens = output_tokens + excluded.output_tokens,
+                        cost = cost + excluded.cost
+                    """,
+                    [(period, name, input_tokens, output_tokens, cost) for name in (model_name, ALL_MODELS)],
+                )
+                (total,) = self._conn.execute(
+                    "SELECT cost FROM usage_totals WHERE period = ? AND model = ?", (period, ALL_MODELS)
+                ).fetchone()
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return total
+
+    def total_cost(self, period: Optional[str] = None) -> float:
+        """Spend of all models in the period (default: the current one)."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT cost FROM usage_totals WHERE period = ? AND model = ?",
+                (period or current_period(), ALL_MODELS),
+            ).fetchone()
+        return row[0] if row else 0.0
+
+    def _rollup(self, period: str) -> dict:
+        with self._lock:
+            models = self._conn.execute(
+                "SELECT model, calls, input_tokens, output_tokens, cost FROM usage_totals WHERE period = ?",
+                (period,),
+            ).fetchall()
+            agents = self._conn.execute(
+                """
+                SELECT COALESCE(agent, 'unknown'), COUNT(*), SUM(input_tokens), SUM(output_tokens), SUM(cost)
+                FROM usage_events WHERE period = ? GROUP BY 1
+                """,
+                (period,),
+            ).fetchall()
+
+        def as_dict(rows) -> Dict[str, dict]:
+            return {
+                name: {"calls": calls, "input_tokens": input_tokens, "output_tokens": output_tokens, "cost": cost}
+                for name, calls, input_tokens, output_tokens, cost in rows
+            }
+
+        by_model = as_dict(models)
+        total = by_model.pop(ALL_MODELS, {"calls": 0, "input_tokens": 0, "output_tokens": 0, "cost": 0.0})
+        return {"period": period, "total": total, "models": by_model, "agents": as_dict(agents)}
+
+    async def record(
+        self,
+        model_name: str,
+        input_tokens: int,
+        output_tokens: int,
+        cost: float,
+        agent: Optional[str] = None,
+        batch: bool = False,
+    ) -> float:
+        """Adds a call to the ledger and returns the period's spend of all workers, including it."""
+        return await asyncio.to_thread(
+            self._record, model_name, input_tokens, output_tokens, cost, agent, current_request_id.get(), batch
+        )
+
+    async def rollup(self, period: Optional[str] = None) -> dict:
+        """Per-model and per-agent calls, tokens and cost for the period (default: the current one)."""
+        return await asyncio.to_thread(self._rollup, period or current_period())
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_usage_ledger = None
+def get_usage_ledger() -> UsageLedger:
+    global _usage_ledger
+    if _usage_ledger is None:
+        _usage_ledger = UsageLedger(get_settings().LLM_USAGE_LEDGER_PATH)
+    return _usage_ledger
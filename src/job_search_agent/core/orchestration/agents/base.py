@@ -1,8 +1,12 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, AsyncIterator, Dict, Sequence, Type, TypeVar, Union
+
+from pydantic import BaseModel
 
 from job_search_agent.core.llm_gateways.gateway import get_gateway
 
+T = TypeVar("T", bound=BaseModel)
+
 class BaseAgent(ABC):
     def __init__(self, complexity: str = "free"):
         self.complexity = complexity
@@ -11,8 +15,28 @@ class BaseAgent(ABC):
         return get_gateway().get_llm(prompt_tokens, self.complexity)
 
     def get_structured_llm(self, prompt_tokens: int, schema: Any):
-        llm = get_gateway().get_llm(prompt_tokens, self.complexity)
-        return llm.with_structured_output(schema)
+        return get_gateway().get_structured_llm(prompt_tokens, self.complexity, schema)
+
+    async def invoke_structured(self, messages: Sequence[Any], schema: Type[T], prompt_tokens: int) -> T:
+        """Structured call through the gateway, which serves repeated prompts from its cache."""
+        return await get_gateway().ainvoke_structured(
+            messages, schema, prompt_tokens, self.complexity, agent=type(self).__name__
+        )
+
+    async def invoke_deferred(self, messages: Sequence[Any], schema: Type[T], prompt_tokens: int) -> T:
+        """Structured call through the gateway's batch mode, for work nobody is waiting on interactively."""
+        return await get_gateway().ainvoke_deferred(
+            messages, schema, prompt_tokens, self.complexity, agent=type(self).__name__
+        )
+
+    async def stream_structured(
+        self, messages: Sequence[Any], schema: Type[T], prompt_tokens: int
+    ) -> AsyncIterator[Union[Dict[str, Any], T]]:
+        """Partial dicts as the structured response streams in, then the validated object."""
+        async for item in get_gateway().astream_structured(
+            messages, schema, prompt_tokens, self.complexity, agent=type(self).__name__
+        ):
+            yield item
 
     @abstractmethod
     def run(self, *args: Any, **kwargs: Any) -> Any:
@@ -1,3 +1,5 @@
+from typing import Any, AsyncIterator, Tuple
+
 from langsmith import traceable
 
 from job_search_agent.core.orchestration.models.job_vacancy import JobVacancy
@@ -5,6 +7,11 @@ from job_search_agent.core.orchestration.models.resume_models import Resume
 from job_search_agent.core.orchestration.models.optimization_result import OptimizationResult
 from job_search_agent.core.orchestration.agents.base import BaseAgent
 from job_search_agent.core.llm_gateways.prompts.optimizer_prompts import JOB_OPTIMIZER_PROMPT
+from job_search_agent.core.llm_gateways.token_estimator import get_token_estimator
+
+# Text fields of OptimizationResult that are streamed as they are generated.
+STREAMED_FIELDS = ("explanation", "optimization_tips", "cover_letter")
+
 
 class JobOptimizerAgent(BaseAgent):
     def __init__(self):
@@ -14,7 +21,24 @@ class JobOptimizerAgent(BaseAgent):
     @traceable
     async def run(self, job: JobVacancy, resume: Resume) -> OptimizationResult:
         prompt_text = self.prompt.format_messages(job=job, resume=resume)
-        prompt_string = self.prompt.format(job=job, resume=resume)
-        structured_llm = self.get_structured_llm(len(prompt_string), OptimizationResult)
-        response = await structured_llm.ainvoke(prompt_text)
-        return response
\ No newline at end of file
+        prompt_tokens = get_token_estimator().count_prompt(self.prompt, OptimizationResult, job=job, resume=resume)
+        return await self.invoke_structured(prompt_text, OptimizationResult, prompt_tokens)
+
+    async def stream(self, job: JobVacancy, resume: Resume) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Yields ("delta", (field, text)) as text is appended to the streamed fields,
+        then ("result", OptimizationResult) once the complete output has been validated.
+        """
+        prompt_text = self.prompt.format_messages(job=job, resume=resume)
+        prompt_tokens = get_token_estimator().count_prompt(self.prompt, OptimizationResult, job=job, resume=resume)
+        emitted = dict.fromkeys(STREAMED_FIELDS, 0)
+        async for item in self.stream_structured(prompt_text, OptimizationResult, prompt_tokens):
+            partial = item.model_dump() if isinstance(item, OptimizationResult) else item
+            for field in STREAMED_FIELDS:
+                value = partial.get(field)
+                # Partially parsed strings only ever grow, so the new text is the suffix.
+                if isinstance(value, str) and len(value) > emitted[field]:
+                    yield "delta", (field, value[emitted[field]:])
+                    emitted[field] = len(value)
+            if isinstance(item, OptimizationResult):
+                yield "result", item
@@ -1,6 +1,7 @@
 from langsmith import traceable
 
 from job_search_agent.core.llm_gateways.prompts.resume_prompts import RESUME_PARSER_PROMPT
+from job_search_agent.core.llm_gateways.token_estimator import get_token_estimator
 from job_search_agent.core.orchestration.agents.base import BaseAgent
 from job_search_agent.core.orchestration.models.resume_models import Resume
 
@@ -16,7 +17,5 @@ class ResumeAgent(BaseAgent):
 
     async def run(self, cv: str) -> Resume:
         prompt_text = self.prompt.format_messages(cv=cv)
-        prompt_string = self.prompt.format(cv=cv)
-        structured_llm = self.get_structured_llm(len(prompt_string), Resume)
-        response = await structured_llm.ainvoke(prompt_text)
-        return response
\ No newline at end of file
+        prompt_tokens = get_token_estimator().count_prompt(self.prompt, Resume, cv=cv)
+        return await self.invoke_structured(prompt_text, Resume, prompt_tokens)
\ No newline at end of file
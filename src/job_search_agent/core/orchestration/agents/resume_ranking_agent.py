@@ -1,21 +1,39 @@
 from langsmith.run_helpers import traceable
 import asyncio
-from typing import List, Tuple
+import logging
+from contextlib import aclosing
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 from job_search_agent.core.orchestration.models.resume_models import Resume
 from job_search_agent.core.orchestration.models.matching_models import BatchJobMatchResult
 from job_search_agent.core.llm_gateways.prompts.matching_prompts import JOB_MATCHING_PROMPT
+from job_search_agent.core.llm_gateways.cost_controller import BudgetExceeded
+from job_search_agent.core.llm_gateways.rate_limiter import RateLimitExceeded
+from job_search_agent.core.llm_gateways.token_estimator import get_token_estimator
 
 from job_search_agent.configs.setting import get_settings
 from job_search_agent.core.orchestration.agents.base import BaseAgent
 from job_search_agent.core.orchestration.tools.search_tool.tavily_search_tool import TavilySearchTool
 from job_search_agent.core.orchestration.tools.search_tool.ddg_search_tool import DuckDuckGoSearchTool
 from job_search_agent.core.orchestration.tools.website_scrapper.engine import ScrapingEngine
+from job_search_agent.core.orchestration.tools.website_scrapper.url_canonicalizer import canonical_url
 from job_search_agent.core.orchestration.tools.api_call.glorri_api_call import GlorriAPICall
 from job_search_agent.core.orchestration.models.job_vacancy import JobVacancy
+from job_search_agent.core.orchestration.store.vacancy_store import get_vacancy_store
+from job_search_agent.core.orchestration.store.vector_index import get_vector_index
+from job_search_agent.core.orchestration.tools.dedup.near_duplicates import NearDuplicateFilter
+from job_search_agent.core.orchestration.tools.embeddings.prefilter import EmbeddingPrefilter
+from job_search_agent.utils.async_pipeline import batched, iterate_as_completed, map_unordered
+
+logger = logging.getLogger(__name__)
 
 class ResumeRankingAgent(BaseAgent): 
-    def __init__(self):
+    def __init__(self, deferred: bool = False):
+        """
+        `deferred` judges matches through the LLM batch mode. It is for library use in offline
+        jobs (e.g. nightly re-matching) that run a batch worker; the API never sets it.
+        """
         super().__init__('advanced')
+        self.deferred = deferred
         settings = get_settings()
         if settings.TAVILY_API_KEY:
             self.web_searcher = TavilySearchTool(max_results=10)
@@ -23,109 +41,332 @@ class ResumeRankingAgent(BaseAgent):
             self.web_searcher = DuckDuckGoSearchTool(max_results=10)
         self.scraper = ScrapingEngine()
         self.api_searcher = GlorriAPICall()
+        self.source_mode = settings.JOB_SOURCE_MODE
+        self.store_search_limit = settings.VACANCY_STORE_SEARCH_LIMIT
+        self.max_candidates = settings.MATCH_MAX_CANDIDATES
+        self.prefilter_enabled = settings.EMBEDDING_PREFILTER_ENABLED
+        self._prefilter: Optional[EmbeddingPrefilter] = None
+        self.near_duplicate_threshold = (
+            settings.NEAR_DUPLICATE_THRESHOLD if settings.NEAR_DUPLICATE_DEDUP_ENABLED else None
+        )
+        self.min_similarity = settings.EMBEDDING_MIN_SIMILARITY
+        self.stream_batch_size = settings.MATCH_STREAM_BATCH_SIZE
+        self.stream_batch_wait = settings.MATCH_STREAM_BATCH_WAIT
+        self.shard_max_tokens = settings.MATCH_SHARD_MAX_TOKENS
+        self.shard_max_jobs = settings.MATCH_SHARD_MAX_JOBS
+        self.shard_retries = settings.MATCH_SHARD_RETRIES
+
+
+    @property
+    def prefilter(self) -> Optional[EmbeddingPrefilter]:
+        """Created on first use, so constructing the agent stays cheap."""
+        if self.prefilter_enabled and self._prefilter is None:
+            self._prefilter = EmbeddingPrefilter()
+        return self._prefilter
 
+    @property
+    def vector_index(self):
+        return get_vector_index() if self.prefilter_enabled else None
 
     def _build_resume_summary(self, cv: Resume) -> str:
         """Create a concise summary of the resume for the matching agent."""
         return f"Titles: {', '.join(cv.titles)}\nSkills: {', '.join(cv.skills)}\nExperience: {cv.years_experience} years ({cv.seniority})"
 
-    async def _batch_check_matches(self, jobs: List[JobVacancy], resume_summary: str) -> BatchJobMatchResult:
-        """Use AI to check which jobs match the resume in a single batch call."""
-        if not jobs:
-            return BatchJobMatchResult(matching_indices=[], reasons={})
-            
-        jobs_formatted = ""
+    @staticmethod
+    def _format_job(index: int, job: JobVacancy) -> str:
+        return f"--- JOB INDEX {index} ---\nTitle: {job.title}\nRequirements: {job.requirements}\n\n"
+
+    def _shard_jobs(self, jobs: List[JobVacancy], resume_summary: str) -> List[Tuple[int, List[JobVacancy]]]:
+        """
+        Packs jobs, in order, into shards whose prompts stay within the token budget.
+        Returns (offset of the shard's first job, jobs) pairs; a job larger than the
+        budget gets a shard of its own.
+        """
+        estimator = get_token_estimator()
+        base_tokens = estimator.count_prompt(
+            JOB_MATCHING_PROMPT, BatchJobMatchResult, resume=resume_summary, jobs_list=""
+        )
+        shards: List[Tuple[int, List[JobVacancy]]] = []
+        shard: List[JobVacancy] = []
+        offset = 0
+        tokens = base_tokens
         for i, job in enumerate(jobs):
-            jobs_formatted += f"--- JOB INDEX {i} ---\nTitle: {job.title}\nRequirements: {job.requirements}\n\n"
+            # Shard-local indices have the same width as global ones, so this never undercounts.
+            job_tokens = estimator.count(self._format_job(i, job))
+            if shard and (tokens + job_tokens > self.shard_max_tokens or len(shard) >= self.shard_max_jobs):
+                shards.append((offset, shard))
+                shard, offset, tokens = [], i, base_tokens
+            shard.append(job)
+            tokens += job_tokens
+        if shard:
+            shards.append((offset, shard))
+        return shards
+
+    async def _check_shard(self, jobs: List[JobVacancy], resume_summary: str) -> BatchJobMatchResult:
+        """One structured matching call; indices in the result are local to `jobs`."""
+        jobs_formatted = "".join(self._format_job(i, job) for i, job in enumerate(jobs))
 
         prompt_text = JOB_MATCHING_PROMPT.format_messages(
             resume=resume_summary,
             jobs_list=jobs_formatted
         )
-        prompt_string = JOB_MATCHING_PROMPT.format(
+        prompt_tokens = get_token_estimator().count_prompt(
+            JOB_MATCHING_PROMPT, BatchJobMatchResult,
             resume=resume_summary,
             jobs_list=jobs_formatted
         )
-        
-        structured_llm = self.get_structured_llm(len(prompt_string), BatchJobMatchResult)
+        if self.deferred:
+            return await self.invoke_deferred(prompt_text, BatchJobMatchResult, prompt_tokens)
+        return await self.invoke_structured(prompt_text, BatchJobMatchResult, prompt_tokens)
+
+    async def _check_shard_with_retry(self, jobs: List[JobVacancy], resume_summary: str) -> BatchJobMatchResult:
+        for attempt in range(self.shard_retries + 1):
+            try:
+                return await self._check_shard(jobs, resume_summary)
+            except (RateLimitExceeded, BudgetExceeded):
+                # Waiting again would only exceed the limiter's max wait again; the budget will not refill.
+                raise
+            except Exception as e:
+                logger.warning(f"Error in batch matching ({len(jobs)} jobs, attempt {attempt + 1}): {e}")
+        return BatchJobMatchResult(matching_indices=[], reasons={})
+
+    async def _batch_check_matches(self, jobs: List[JobVacancy], resume_summary: str) -> BatchJobMatchResult:
+        """
+        Use AI to check which jobs match the resume. Jobs are split into token-bounded
+        shards judged concurrently (the gateway's rate limiter paces the calls); a failed
+        shard is retried on its own, and the shard results are merged back to indices
+        into `jobs`. A rate-limit or budget error cancels the other shards and propagates,
+        so the API can answer 429/402 instead of an empty result.
+        """
+        if not jobs:
+            return BatchJobMatchResult(matching_indices=[], reasons={})
+
+        shards = self._shard_jobs(jobs, resume_summary)
+        try:
+            async with asyncio.TaskGroup() as group:
+                tasks = [group.create_task(self._check_shard_with_retry(shard, resume_summary)) for _, shard in shards]
+        except BaseExceptionGroup as errors:
+            # Other shard errors are handled by the retry, so these are rate-limit/budget errors.
+            raise errors.exceptions[0]
+        results = [task.result() for task in tasks]
+
+        matching_indices: List[int] = []
+        reasons: Dict[int, str] = {}
+        for (offset, shard), result in zip(shards, results):
+            for i in result.matching_indices:
+                # Out-of-range indices would point into a neighbouring shard.
+                if 0 <= i < len(shard):
+                    matching_indices.append(offset + i)
+            for i, reason in result.reasons.items():
+                if 0 <= int(i) < len(shard):
+                    reasons[offset + int(i)] = reason
+        return BatchJobMatchResult(matching_indices=sorted(matching_indices), reasons=reasons)
+
+    async def _search_urls(self, queries: List[str]) -> AsyncIterator[str]:
+        """Stage 1: runs web and API searches concurrently and yields each new canonical URL as soon as its search returns."""
+        logger.info(f"Searching via web and API for {len(queries)} queries...")
+        searches = [asyncio.to_thread(self.web_searcher.search, f"{query.lower()}") for query in queries]
+        searches += [self.api_searcher.scrape(query) for query in queries]
+
+        seen_urls = set()
+        async for url_list in iterate_as_completed(searches):
+            if isinstance(url_list, Exception):
+                logger.warning(f"Search error: {url_list}")
+                continue
+            if not isinstance(url_list, list):
+                continue
+            # Canonical URLs, so www./subdomain/tracking-query variants are fetched once.
+            for url in map(canonical_url, url_list):
+                if url not in seen_urls:
+                    seen_urls.add(url)
+                    yield url
+
+    async def _scrape_jobs(self, urls: AsyncIterator[str]) -> AsyncIterator[JobVacancy]:
+        """Stage 2: scrapes each URL as it arrives and yields vacancies in completion order."""
+        async for job in map_unordered(urls, self.scraper.scrape_url):
+            if isinstance(job, JobVacancy):
+                yield job
+
+    async def _semantic_keys(self, resume_summary: str) -> List[str]:
+        """Store keys of the vacancies nearest to the resume in the vector index."""
+        index = self.vector_index
+        if index is None:
+            return []
         try:
-            response = await structured_llm.ainvoke(prompt_text)
-            return response
+            query = (await self.prefilter.embedder.aencode([resume_summary]))[0]
+            index.maybe_reload()
+            hits = await asyncio.to_thread(index.search, query, self.store_search_limit)
         except Exception as e:
-            print(f"Error in batch matching: {e}")
-            return BatchJobMatchResult(matching_indices=[], reasons={})
+            logger.warning(f"Vector index search failed: {e}")
+            return []
+        return [key for key, _ in hits]
 
-    @traceable
-    async def run(self, cv: Resume) -> List[Tuple[JobVacancy, float, str]]:
-        search_queries = list(dict.fromkeys(cv.keywords))
+    async def _stored_jobs(self, queries: List[str], resume_summary: str) -> AsyncIterator[JobVacancy]:
+        """
+        Stages 1+2 in store mode: a local lookup replaces live search and scraping.
+        BM25 keyword hits come first, followed by the nearest vacancies by embedding
+        that the keywords missed.
+        """
+        store = get_vacancy_store()
+        # Keeps the background crawler covering what users actually search for.
+        await store.add_keywords(queries)
+        keyword_jobs, semantic_keys = await asyncio.gather(
+            store.search(queries, limit=self.store_search_limit),
+            self._semantic_keys(resume_summary),
+        )
+        for job in keyword_jobs + await store.get(semantic_keys):
+            yield job
 
-        async def search_all_keywords(queries: List[str]) -> List[str]:
-            tasks = [asyncio.to_thread(self.web_searcher.search, f"{query.lower()}") for query in queries]
-            results = await asyncio.gather(*tasks)
-            unique_urls = set()
-            for url_list in results:
-                if isinstance(url_list, list):
-                    unique_urls.update(url_list)
-            return list(unique_urls)
-
-        search_urls = await search_all_keywords(search_queries)
-        
-        # API Search for URLs
-        api_urls = []
-        print(f"Searching via API for {len(search_queries)} queries...")
-        api_tasks = [self.api_searcher.scrape(query) for query in search_queries]
-        api_results = await asyncio.gather(*api_tasks, return_exceptions=True)
-        for res in api_results:
-            if isinstance(res, list):
-                api_urls.extend(res)
-            elif isinstance(res, Exception):
-                print(f"API search error: {res}")
-
-        # Combine and unique URLs
-        all_urls = list(set(search_urls + api_urls))
-        
-        jobs = []
-        if all_urls:
-            async def scrape_all(urls: List[str]) -> List[JobVacancy]:
-                tasks = [self.scraper.scrape_url(url) for url in urls]
-                return await asyncio.gather(*tasks, return_exceptions=True)
-                
-            print(f"Scraping {len(all_urls)} potential jobs from combined sources...")
-            results = await scrape_all(all_urls)
-            jobs = [job for job in results if isinstance(job, JobVacancy) and job is not None]
-        
-        # Deduplicate jobs by (title + company)
-        unique_jobs = []
+    async def _dedupe_jobs(self, jobs: AsyncIterator[JobVacancy]) -> AsyncIterator[JobVacancy]:
+        """
+        Stage 3: drops vacancies already seen under the same (title, company), and
+        near-duplicate reposts of the same vacancy on another board.
+        """
         seen_job_keys = set()
-        for job in jobs:
+        near_duplicates = (
+            NearDuplicateFilter(self.near_duplicate_threshold) if self.near_duplicate_threshold is not None else None
+        )
+        async for job in jobs:
             title_norm = job.title.strip().lower() if job.title else ""
             company_norm = job.company.strip().lower() if job.company else ""
             job_key = (title_norm, company_norm)
-            
-            if job_key not in seen_job_keys:
-                seen_job_keys.add(job_key)
-                unique_jobs.append(job)
-        
-        jobs = unique_jobs
 
-        if not jobs:
-            print("No valid jobs found.")
-            return []
-        
-        jobs_to_process = jobs[:15]
+            if job_key in seen_job_keys:
+                continue
+            seen_job_keys.add(job_key)
+            if near_duplicates is not None:
+                original = near_duplicates.add(job)
+                if original is not None:
+                    logger.debug(f"Near-duplicate: {job.title} at {job.company} ({job.url}) ~ {original.url}")
+                    continue
+            yield job
+
+    @staticmethod
+    async def _take(jobs: AsyncIterator[JobVacancy], limit: int) -> AsyncIterator[JobVacancy]:
+        """Stops the upstream stages once `limit` candidates have been collected."""
+        if limit <= 0:
+            return
+        async with aclosing(jobs):
+            count = 0
+            async for job in jobs:
+                yield job
+                count += 1
+                if count >= limit:
+                    break
+
+    async def _prefilter_jobs(
+        self,
+        jobs: AsyncIterator[JobVacancy],
+        resume_summary: str,
+        streaming: bool,
+    ) -> AsyncIterator[JobVacancy]:
+        """
+        Stage 4: keeps the candidates most similar to the resume for LLM matching.
+        Both modes drop jobs below `min_similarity`. Non-streaming runs wait for the whole
+        candidate pool, which the searches or the store lookup bound, since the top
+        `max_candidates` are only known once every job is scored; streaming runs judge
+        each arriving window and keep the first `max_candidates` above the threshold.
+        """
+        if self.prefilter is None:
+            async for job in self._take(jobs, self.max_candidates):
+                yield job
+            return
+
+        if not streaming:
+            pool = [job async for job in jobs]
+            try:
+                ranked = [
+                    job for job, score in await self.prefilter.top_k(resume_summary, pool, self.max_candidates)
+                    if score >= self.min_similarity
+                ]
+            except Exception as e:
+                logger.warning(f"Embedding prefilter failed, falling back to arrival order: {e}")
+                ranked = pool[:self.max_candidates]
+            logger.debug(f"Prefilter kept {len(ranked)} of {len(pool)} candidates")
+            for job in ranked:
+                yield job
+            return
+
+        kept = 0
+        async with aclosing(batched(jobs, self.stream_batch_size, self.stream_batch_wait)) as windows:
+            async for window in windows:
+                try:
+                    scores = await self.prefilter.score(resume_summary, window)
+                except Exception as e:
+                    logger.warning(f"Embedding prefilter failed, passing window through: {e}")
+                    scores = [1.0] * len(window)
+                for job, score in zip(window, scores):
+                    if score >= self.min_similarity:
+                        yield job
+                        kept += 1
+                        if kept >= self.max_candidates:
+                            return
+
+    async def _match_jobs(
+        self,
+        jobs: AsyncIterator[JobVacancy],
+        resume_summary: str,
+        batch_size: int,
+        batch_wait: Optional[float],
+    ) -> AsyncIterator[Tuple[JobVacancy, float, str]]:
+        """Stage 5: judges candidates in batches and yields matches as soon as their batch is judged."""
+        async def judge(batch: List[JobVacancy]):
+            return batch, await self._batch_check_matches(batch, resume_summary)
+
+        judged = 0
+        async with aclosing(map_unordered(batched(jobs, batch_size, batch_wait), judge)) as outcomes:
+            async for outcome in outcomes:
+                if isinstance(outcome, (RateLimitExceeded, BudgetExceeded)):
+                    # Closing `outcomes` cancels the batches still being judged.
+                    raise outcome
+                if isinstance(outcome, Exception):
+                    logger.warning(f"Error in batch matching: {outcome}")
+                    continue
+                batch, match_result = outcome
+                judged += len(batch)
+                matching_indices = match_result.matching_indices
+                reasons = match_result.reasons
+
+                for i, job in enumerate(batch):
+                    reason = reasons.get(i) or reasons.get(str(i), "Səbəb tapılmadı")
+                    if i in matching_indices:
+                        yield job, 1.0, reason
+                    else:
+                        logger.debug(f"Not a match: {job.title} at {job.company}. Reason: {reason}")
+
+        if not judged:
+            logger.info("No valid jobs found.")
+
+    async def _pipeline(
+        self,
+        cv: Resume,
+        batch_size: int,
+        batch_wait: Optional[float],
+    ) -> AsyncIterator[Tuple[JobVacancy, float, str]]:
+        """Chains search -> scrape -> dedupe -> prefilter -> match; every stage consumes the previous one as it produces."""
+        search_queries = list(dict.fromkeys(cv.keywords))
         resume_summary = self._build_resume_summary(cv)
 
-        match_result = await self._batch_check_matches(jobs_to_process, resume_summary)
-        matching_indices = match_result.matching_indices
-        reasons = match_result.reasons
-        
-        ranked_jobs = []
-        for i, job in enumerate(jobs_to_process):
-            reason = reasons.get(i) or reasons.get(str(i), "Səbəb tapılmadı")
-            if i in matching_indices:
-                ranked_jobs.append((job, 1.0, reason))
-            else:
-                print(f"Not a match: {job.title} at {job.company}")
-                print(f"Reason: {reason}")
-            
-        return ranked_jobs
\ No newline at end of file
+        if self.source_mode == "store":
+            found = self._stored_jobs(search_queries, resume_summary)
+        else:
+            found = self._scrape_jobs(self._search_urls(search_queries))
+        jobs = self._dedupe_jobs(found)
+        candidates = self._prefilter_jobs(jobs, resume_summary, streaming=batch_wait is not None)
+
+        async with aclosing(self._match_jobs(candidates, resume_summary, batch_size, batch_wait)) as matches:
+            async for ranked in matches:
+                yield ranked
+
+    @traceable
+    async def stream(self, cv: Resume) -> AsyncIterator[Tuple[JobVacancy, float, str]]:
+        """Yields each matched job as soon as its (small) batch has been judged."""
+        async with aclosing(self._pipeline(cv, self.stream_batch_size, self.stream_batch_wait)) as matches:
+            async for ranked in matches:
+                yield ranked
+
+    @traceable
+    async def run(self, cv: Resume) -> List[Tuple[JobVacancy, float, str]]:
+        # One batch of all candidates; _batch_check_matches shards it into concurrent LLM calls.
+        async with aclosing(self._pipeline(cv, self.max_candidates, None)) as matches:
+            return [ranked async for ranked in matches]
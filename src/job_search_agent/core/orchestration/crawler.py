@@ -0,0 +1,194 @@
+import asyncio
+import logging
+import time
+from pathlib import Path
+from typing import List, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: no flock, development runs a single process anyway
+    fcntl = None
+
+from job_search_agent.configs.setting import get_settings
+from job_search_agent.core.orchestration.models.job_vacancy import JobVacancy
+from job_search_agent.core.orchestration.store.vacancy_store import VacancyStore, get_vacancy_store
+from job_search_agent.core.orchestration.store.vector_index import IVFIndex, get_vector_index
+from job_search_agent.core.orchestration.tools.api_call.glorri_api_call import GlorriAPICall
+from job_search_agent.core.orchestration.tools.embeddings.embedder import job_embedding_text
+from job_search_agent.core.orchestration.tools.embeddings.embedding_store import get_cached_embedder
+from job_search_agent.core.orchestration.tools.search_tool.tavily_search_tool import TavilySearchTool
+from job_search_agent.core.orchestration.tools.search_tool.ddg_search_tool import DuckDuckGoSearchTool
+from job_search_agent.core.orchestration.tools.website_scrapper.engine import ScrapingEngine
+from job_search_agent.core.orchestration.tools.website_scrapper.url_canonicalizer import canonical_url
+
+logger = logging.getLogger(__name__)
+
+
+class CrawlerLock:
+    """
+    Exclusive, non-blocking flock on a lock file, so only one process on the host
+    crawls: with several API workers (and/or the standalone crawler) the first to
+    acquire it runs the crawler. The OS releases it when the process exits.
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self._file = None
+
+    def acquire(self) -> bool:
+        if fcntl is None:
+            return True
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        file = open(self.path, "a")
+        try:
+            fcntl.flock(file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            file.close()
+            return False
+        self._file = file
+        return True
+
+    def release(self):
+        if self._file is not None:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+            self._file.close()
+            self._file = None
+
+
+class VacancyCrawler:
+    """
+    Periodically discovers and scrapes vacancies into the local VacancyStore.
+
+    Each pass searches for the seed keywords plus keywords recently requested by
+    users, skips vacancies refreshed within `refresh_interval`, scrapes the rest
+    through the shared ScrapingEngine (so scheduler limits and caches apply) and
+    prunes expired vacancies. Newly scraped vacancies are embedded right away, so
+    the ranking prefilter later reads their vectors from the embedding cache, and
+    the vectors are written to the shared vector index, which the crawler owns.
+    """
+
+    def __init__(
+        self,
+        store: Optional[VacancyStore] = None,
+        engine: Optional[ScrapingEngine] = None,
+        api_searcher: Optional[GlorriAPICall] = None,
+        web_searcher=None,
+        embedder=None,
+        vector_index: Optional[IVFIndex] = None,
+    ):
+        settings = get_settings()
+        self.store = store or get_vacancy_store()
+        self.engine = engine or ScrapingEngine()
+        self.api_searcher = api_searcher or GlorriAPICall()
+        if web_searcher is None and settings.CRAWLER_USE_WEB_SEARCH:
+            if settings.TAVILY_API_KEY:
+                web_searcher = TavilySearchTool(max_results=10)
+            else:
+                web_searcher = DuckDuckGoSearchTool(max_results=10)
+        self.web_searcher = web_searcher
+        if embedder is None and settings.EMBEDDING_PREFILTER_ENABLED:
+            embedder = get_cached_embedder()
+        self.embedder = embedder
+        self.vector_index = vector_index or (get_vector_index() if embedder is not None else None)
+        self.seed_keywords = settings.CRAWLER_KEYWORDS
+        self.interval = settings.CRAWLER_INTERVAL
+        self.refresh_interval = settings.CRAWLER_REFRESH_INTERVAL
+        self.keyword_window = settings.CRAWLER_KEYWORD_WINDOW
+        self._task: Optional[asyncio.Task] = None
+
+    async def _keywords(self) -> List[str]:
+        requested = await self.store.keywords(since=time.time() - self.keyword_window)
+        return list(dict.fromkeys([k.lower() for k in self.seed_keywords] + requested))
+
+    async def _discover(self, keywords: List[str]) -> List[str]:
+        searches = [self.api_searcher.scrape(keyword) for keyword in keywords]
+        if self.web_searcher is not None:
+            searches += [asyncio.to_thread(self.web_searcher.search, keyword) for keyword in keywords]
+        results = await asyncio.gather(*searches, return_exceptions=True)
+
+        urls = []
+        for res in results:
+            if isinstance(res, list):
+                urls.extend(res)
+            elif isinstance(res, Exception):
+                logger.warning(f"Crawler search error: {res}")
+        return list(dict.fromkeys(canonical_url(url) for url in urls))
+
+    async def _embed(self, jobs: List[JobVacancy], expired: List[str]):
+        if self.embedder is None:
+            return
+        try:
+            if jobs:
+                vectors = await self.embedder.aencode([job_embedding_text(job) for job in jobs])
+                if self.vector_index is not None:
+                    self.vector_index.add([canonical_url(job.url) for job in jobs], vectors)
+            if self.vector_index is not None:
+                self.vector_index.remove(expired)
+                if jobs or expired:
+                    await asyncio.to_thread(self.vector_index.save)
+        except Exception as e:
+            logger.warning(f"Crawler embedding error: {e}")
+
+    async def crawl_once(self) -> int:
+        """Runs a single crawl pass and returns the number of vacancies stored."""
+        keywords = await self._keywords()
+        urls = await self._discover(keywords)
+        fresh = await self.store.seen_since(urls, since=time.time() - self.refresh_interval)
+        stale = [url for url in urls if url not in fresh]
+
+        results = await asyncio.gather(*(self.engine.scrape_url(url) for url in stale), return_exceptions=True)
+        jobs = [job for job in results if isinstance(job, JobVacancy)]
+        await self.store.upsert(jobs)
+        expired = await self.store.remove_expired()
+        await self._embed(jobs, expired)
+
+        logger.info(
+            f"Crawl pass: {len(keywords)} keywords, {len(urls)} urls, "
+            f"{len(stale)} scraped, {len(jobs)} stored, {len(expired)} expired"
+        )
+        return len(jobs)
+
+    async def run_forever(self):
+        while True:
+            try:
+                await self.crawl_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Crawl pass failed: {e}")
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> asyncio.Task:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run_forever())
+        return self._task
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+async def main():
+    """Runs the crawler as a standalone process, unless another process already holds the crawler lock."""
+    from job_search_agent.core.orchestration.tools.http_client.pool import close_http_pool
+
+    logging.basicConfig(level=logging.INFO)
+    lock = CrawlerLock(get_settings().CRAWLER_LOCK_PATH)
+    if not lock.acquire():
+        logger.error(f"Another process holds {lock.path}; the crawler is already running.")
+        return
+    crawler = VacancyCrawler()
+    try:
+        await crawler.run_forever()
+    finally:
+        await close_http_pool()
+        lock.release()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,8 +1,6 @@
-from typing import List, Tuple
+from typing import Any, AsyncIterator, List, Tuple
 
-from job_search_agent.core.orchestration.agents import ResumeAgent
-from job_search_agent.core.orchestration.agents.job_optimizer_agent import JobOptimizerAgent
-from job_search_agent.core.orchestration.agents.resume_ranking_agent import ResumeRankingAgent
+from job_search_agent.configs.setting import get_settings
 from job_search_agent.core.orchestration.models.resume_models import Resume
 from job_search_agent.core.orchestration.models.job_vacancy import JobVacancy
 from job_search_agent.core.orchestration.models.optimization_result import OptimizationResult
@@ -11,12 +9,38 @@ from job_search_agent.utils.resume_parser import resume_parser
 
 
 class JobSearchOrchestrator:
+    """
+    Entry point of the API into the agents. Agent modules (langsmith, prompts, search
+    tools, stores) are imported on first use so that importing the API stays fast.
+    """
+
     def __init__(self):
         self.gateway = get_gateway()
 
+    def warm_up(self):
+        """
+        Does the first-request work ahead of time: imports the agent stack, creates
+        the LLM clients of every configured model, loads the token estimator and,
+        with the prefilter enabled, the embedding model. Blocking; run it in a thread.
+        """
+        from job_search_agent.core.orchestration.agents import ResumeAgent  # noqa: F401
+        from job_search_agent.core.orchestration.agents.job_optimizer_agent import JobOptimizerAgent  # noqa: F401
+        from job_search_agent.core.orchestration.agents.resume_ranking_agent import ResumeRankingAgent  # noqa: F401
+        from job_search_agent.core.llm_gateways.token_estimator import get_token_estimator
+
+        for model_name in self.gateway.model_router.config['models']:
+            self.gateway.client(model_name)
+        get_token_estimator().count("warm up")
+        if get_settings().EMBEDDING_PREFILTER_ENABLED:
+            from job_search_agent.core.orchestration.tools.embeddings.embedder import get_embedder
+
+            get_embedder().encode(["warm up"])
+
     @staticmethod
     async def process_cv(cv_file: bytes) -> Resume:
         """Parses CV into a structured Resume object."""
+        from job_search_agent.core.orchestration.agents import ResumeAgent
+
         cv_text = resume_parser(cv_file)
         agent = ResumeAgent()
         result = await agent.parse_cv(cv_text)
@@ -25,16 +49,39 @@ class JobSearchOrchestrator:
     @staticmethod
     async def find_jobs(cv: Resume) -> List[Tuple[JobVacancy, float, str]]:
         """Finds and ranks jobs based on currently parsed the CV."""
+        from job_search_agent.core.orchestration.agents.resume_ranking_agent import ResumeRankingAgent
+
         agent = ResumeRankingAgent()
         ranked_jobs = await agent.run(cv)
         return ranked_jobs
 
+    @staticmethod
+    async def stream_jobs(cv: Resume) -> AsyncIterator[Tuple[JobVacancy, float, str]]:
+        """Yields matched jobs incrementally as the ranking pipeline judges them."""
+        from job_search_agent.core.orchestration.agents.resume_ranking_agent import ResumeRankingAgent
+
+        agent = ResumeRankingAgent()
+        async for ranked in agent.stream(cv):
+            yield ranked
+
     @staticmethod
     async def optimize_job(job: JobVacancy, cv: Resume) -> OptimizationResult:
         """Optimizes a specific job using the LangGraph optimize_job node."""
+        from job_search_agent.core.orchestration.agents.job_optimizer_agent import JobOptimizerAgent
+
         agent = JobOptimizerAgent()
         result = await agent.run(job, cv)
         return result
 
-    def get_usage_report(self) -> str:
-        return self.gateway.cost_controller.get_spent()
\ No newline at end of file
+    @staticmethod
+    async def stream_optimize_job(job: JobVacancy, cv: Resume) -> AsyncIterator[Tuple[str, Any]]:
+        """Streams the optimization text fields as they are generated, then the validated result."""
+        from job_search_agent.core.orchestration.agents.job_optimizer_agent import JobOptimizerAgent
+
+        agent = JobOptimizerAgent()
+        async for event in agent.stream(job, cv):
+            yield event
+
+    async def get_usage_report(self) -> dict:
+        """This month's LLM calls, tokens and cost per model and agent, across all workers."""
+        return await self.gateway.cost_controller.usage_report()
\ No newline at end of file
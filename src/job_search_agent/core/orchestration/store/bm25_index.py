@@ -0,0 +1,217 @@
+import math
+import threading
+import time
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from job_search_agent.utils.tokenizer import tokenize
+
+
+class _Postings:
+    """Append-only posting list for a term with lazily materialized NumPy views."""
+
+    __slots__ = ("doc_ids", "tfs", "_arrays")
+
+    def __init__(self):
+        self.doc_ids: List[int] = []
+        self.tfs: List[float] = []
+        self._arrays: Optional[Tuple[np.ndarray, np.ndarray]] = None
+
+    def add(self, doc_id: int, tf: float):
+        self.doc_ids.append(doc_id)
+        self.tfs.append(tf)
+        self._arrays = None
+
+    def arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        if self._arrays is None:
+            self._arrays = (np.asarray(self.doc_ids, dtype=np.int64), np.asarray(self.tfs, dtype=np.float32))
+        return self._arrays
+
+
+class BM25Index:
+    """
+    In-memory BM25 inverted index over vacancies.
+
+    Scoring is term-at-a-time with NumPy: each query term adds its BM25 weight for
+    all matching documents into a dense score vector in one vectorized step, and
+    the top-k are selected with argpartition. Removal marks documents dead; their
+    postings are dropped on the next compaction.
+
+    Fields are weighted by repeating their term frequencies (title counts more
+    than requirements, which count more than the description).
+    """
+
+    FIELD_WEIGHTS = {"title": 3.0, "requirements": 1.5, "description": 1.0}
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75, compact_ratio: float = 0.25):
+        self.k1 = k1
+        self.b = b
+        self.compact_ratio = compact_ratio
+        self._lock = threading.RLock()
+        self._reset()
+
+    def _reset(self):
+        self._postings: Dict[str, _Postings] = {}
+        self._keys: List[Optional[str]] = []
+        self._ids: Dict[str, int] = {}
+        self._doc_len: List[float] = []
+        self._alive: List[bool] = []
+        self._live_count = 0
+        self._total_len = 0.0
+        self._arrays: Optional[Tuple[np.ndarray, np.ndarray]] = None
+
+    def __len__(self) -> int:
+        return self._live_count
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._ids
+
+    def _field_terms(self, fields: Dict[str, str]) -> Counter:
+        terms = Counter()
+        for name, text in fields.items():
+            weight = self.FIELD_WEIGHTS.get(name, 1.0)
+            for token in tokenize(text or ""):
+                terms[token] += weight
+        return terms
+
+    def add(self, key: str, fields: Dict[str, str]):
+        """Indexes a document; re-adding an existing key replaces it."""
+        terms = self._field_terms(fields)
+        with self._lock:
+            if key in self._ids:
+                self._remove(key)
+            doc_id = len(self._keys)
+            self._keys.append(key)
+            self._ids[key] = doc_id
+            length = sum(terms.values())
+            self._doc_len.append(length)
+            self._alive.append(True)
+            self._live_count += 1
+            self._total_len += length
+            for term, tf in terms.items():
+                postings = self._postings.get(term)
+                if postings is None:
+                    postings = self._postings[term] = _Postings()
+                postings.add(doc_id, tf)
+            self._arrays = None
+
+    def remove(self, key: str):
+        with self._lock:
+            self._remove(key)
+            if len(self._keys) and (len(self._keys) - self._live_count) / len(self._keys) > self.compact_ratio:
+                self._compact()
+
+    def _remove(self, key: str):
+        doc_id = self._ids.pop(key, None)
+        if doc_id is None:
+            return
+        self._alive[doc_id] = False
+        self._keys[doc_id] = None
+        self._live_count -= 1
+        self._total_len -= self._doc_len[doc_id]
+        self._arrays = None
+
+    def _compact(self):
+        """Rebuilds posting lists without dead documents, renumbering ids densely."""
+        remap = {}
+        keys, doc_len, alive = [], [], []
+        for old_id, key in enumerate(self._keys):
+            if self._alive[old_id]:
+                remap[old_id] = len(keys)
+                keys.append(key)
+                doc_len.append(self._doc_len[old_id])
+                alive.append(True)
+
+        postings = {}
+        for term, old in self._postings.items():
+            new = _Postings()
+            for doc_id, tf in zip(old.doc_ids, old.tfs):
+                if doc_id in remap:
+                    new.add(remap[doc_id], tf)
+            if new.doc_ids:
+                postings[term] = new
+
+        self._postings = postings
+        self._keys = keys
+        self._ids = {key: i for i, key in enumerate(keys)}
+        self._doc_len = doc_len
+        self._alive = alive
+        self._arrays = None
+
+    def _doc_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        if self._arrays is None:
+            self._arrays = (
+                np.asarray(self._doc_len, dtype=np.float32),
+                np.asarray(self._alive, dtype=bool),
+            )
+        return self._arrays
+
+    def search(self, query: str, k: int = 10) -> List[Tuple[str, float]]:
+        """Returns up to k (key, score) pairs for the query, best first."""
+        query_terms = Counter(tokenize(query))
+        with self._lock:
+            if not query_terms or not self._live_count:
+                return []
+            doc_len, alive = self._doc_arrays()
+            n_docs = self._live_count
+            avg_len = self._total_len / n_docs if n_docs else 1.0
+            # Per-document length normalization, shared by every term.
+            norm = self.k1 * (1.0 - self.b + self.b * doc_len / avg_len)
+
+            scores = np.zeros(len(doc_len), dtype=np.float32)
+            for term, query_tf in query_terms.items():
+                postings = self._postings.get(term)
+                if postings is None:
+                    continue
+                ids, tfs = postings.arrays()
+                live = alive[ids]
+                df = int(live.sum())
+                if not df:
+                    continue
+                idf = math.log(1.0 + (n_docs - df + 0.5) / (df + 0.5))
+                ids, tfs = ids[live], tfs[live]
+                scores[ids] += query_tf * idf * tfs * (self.k1 + 1.0) / (tfs + norm[ids])
+
+            candidates = np.flatnonzero(scores)
+            if not candidates.size:
+                return []
+            if candidates.size > k:
+                top = candidates[np.argpartition(-scores[candidates], k - 1)[:k]]
+            else:
+                top = candidates
+            top = top[np.argsort(-scores[top])]
+            return [(self._keys[i], float(scores[i])) for i in top]
+
+
+def main(n_docs: int = 100_000, queries: int = 200):
+    """Builds a synthetic index and reports top-k query latency."""
+    rng = np.random.default_rng(0)
+    vocabulary = [f"term{i}" for i in range(20_000)] + [
+        "python", "developer", "frontend", "backend", "mühasib", "satış", "menecer", "analitik",
+    ]
+    # Zipf-like term popularity, like real vacancy text.
+    weights = 1.0 / np.arange(1, len(vocabulary) + 1)
+    weights /= weights.sum()
+
+    index = BM25Index()
+    start = time.perf_counter()
+    corpus = rng.choice(len(vocabulary), size=(n_docs, 80), p=weights)
+    for i, row in enumerate(corpus):
+        words = [vocabulary[w] for w in row]
+        index.add(f"doc{i}", {"title": " ".join(words[:5]), "requirements": " ".join(words[5:40]), "description": " ".join(words[40:])})
+    print(f"Indexed {n_docs} docs in {time.perf_counter() - start:.1f}s")
+
+    timings = []
+    for _ in range(queries):
+        query = " ".join(rng.choice(vocabulary, size=10, p=weights))
+        start = time.perf_counter()
+        index.search(query, k=100)
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    print(f"top-100 query: p50={timings[len(timings) // 2] * 1000:.2f}ms p99={timings[int(len(timings) * 0.99) - 1] * 1000:.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
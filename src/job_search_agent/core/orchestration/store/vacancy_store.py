@@ -0,0 +1,236 @@
+import asyncio
+import sqlite3
+import threading
+import time
+from datetime import timedelta
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+from job_search_agent.configs.setting import get_settings
+from job_search_agent.core.orchestration.models.job_vacancy import JobVacancy
+from job_search_agent.core.orchestration.store.bm25_index import BM25Index
+from job_search_agent.core.orchestration.tools.website_scrapper.url_canonicalizer import canonical_url
+from job_search_agent.utils.date_parser import parse_deadline
+
+
+class VacancyStore:
+    """
+    Local SQLite store of crawled vacancies.
+
+    The background crawler keeps it fresh; the ranking agent reads candidates
+    from it instead of searching and scraping the job boards per request.
+    Vacancies are dropped once their deadline has passed, or after `retention`
+    seconds without being seen again when no deadline is known.
+
+    Keyword retrieval goes through an in-process BM25 index. Rows written by other
+    processes (e.g. a standalone crawler) are picked up incrementally by `last_seen`,
+    and the index is rebuilt every `index_rebuild_interval` to drop rows they deleted.
+    """
+
+    def __init__(self, path: str, retention: float, index_rebuild_interval: float = 3600):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.retention = retention
+        self.index_rebuild_interval = index_rebuild_interval
+        self._index = BM25Index()
+        self._index_watermark = 0.0
+        self._index_built_at = 0.0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS vacancies (
+                url TEXT PRIMARY KEY,
+                title TEXT NOT NULL,
+                company TEXT NOT NULL,
+                source TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                first_seen REAL NOT NULL,
+                last_seen REAL NOT NULL,
+                expires_at REAL
+            );
+            CREATE INDEX IF NOT EXISTS idx_vacancies_last_seen ON vacancies (last_seen);
+            CREATE TABLE IF NOT EXISTS crawl_keywords (
+                keyword TEXT PRIMARY KEY,
+                last_requested REAL NOT NULL
+            );
+            """
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def _index_fields(job: JobVacancy) -> dict:
+        return {"title": job.title, "requirements": job.requirements, "description": job.description}
+
+    @staticmethod
+    def _expires_at(job: JobVacancy) -> Optional[float]:
+        deadline = parse_deadline(job.deadline)
+        return (deadline + timedelta(days=1)).timestamp() if deadline else None
+
+    def _upsert(self, jobs: List[JobVacancy]):
+        now = time.time()
+        rows = [
+            (
+                canonical_url(job.url), job.title, job.company, job.source,
+                job.model_dump_json(), now, now, self._expires_at(job),
+            )
+            for job in jobs
+        ]
+        with self._lock:
+            self._conn.executemany(
+                """
+                INSERT INTO vacancies (url, title, company, source, payload, first_seen, last_seen, expires_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(url) DO UPDATE SET
+                    title = excluded.title,
+                    company = excluded.company,
+                    source = excluded.source,
+                    payload = excluded.payload,
+                    last_seen = excluded.last_seen,
+                    expires_at = excluded.expires_at
+                """,
+                rows,
+            )
+            self._conn.commit()
+            for row, job in zip(rows, jobs):
+                self._index.add(row[0], self._index_fields(job))
+
+    def _sync_index(self):
+        """Brings the BM25 index up to date with rows written since the last sync."""
+        now = time.time()
+        if now - self._index_built_at > self.index_rebuild_interval:
+            self._index = BM25Index()
+            self._index_watermark = 0.0
+            self._index_built_at = now
+
+        rows = self._conn.execute(
+            "SELECT url, payload, last_seen FROM vacancies WHERE last_seen > ? ORDER BY last_seen",
+            (self._index_watermark,),
+        ).fetchall()
+        for url, payload, last_seen in rows:
+            self._index.add(url, self._index_fields(JobVacancy.model_validate_json(payload)))
+            self._index_watermark = last_seen
+
+    def _seen_since(self, urls: List[str], since: float) -> set:
+        keys = {canonical_url(url): url for url in urls}
+        with self._lock:
+            found = set()
+            items = list(keys)
+            for start in range(0, len(items), 500):
+                chunk = items[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                found.update(
+                    row[0] for row in self._conn.execute(
+                        f"SELECT url FROM vacancies WHERE last_seen >= ? AND url IN ({placeholders})",
+                        (since, *chunk),
+                    )
+                )
+        return {keys[key] for key in found}
+
+    def _search(self, keywords: List[str], limit: int) -> List[JobVacancy]:
+        query = " ".join(keyword for keyword in keywords if keyword.strip())
+        if not query:
+            return []
+        with self._lock:
+            self._sync_index()
+            # Over-fetch so vacancies that expired since indexing do not shrink the result.
+            hits = self._index.search(query, k=limit * 2)
+        return self._get([key for key, _ in hits])[:limit]
+
+    def _get(self, keys: List[str]) -> List[JobVacancy]:
+        """Loads the non-expired vacancies for the keys, in the given order."""
+        if not keys:
+            return []
+        with self._lock:
+            payloads = {}
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                payloads.update(self._conn.execute(
+                    f"SELECT url, payload FROM vacancies WHERE url IN ({placeholders}) "
+                    "AND (expires_at IS NULL OR expires_at > ?)",
+                    (*chunk, time.time()),
+                ).fetchall())
+        return [JobVacancy.model_validate_json(payloads[key]) for key in keys if key in payloads]
+
+    def _remove_expired(self) -> List[str]:
+        now = time.time()
+        condition = "expires_at <= ? OR (expires_at IS NULL AND last_seen < ?)"
+        with self._lock:
+            expired = [
+                row[0] for row in
+                self._conn.execute(f"SELECT url FROM vacancies WHERE {condition}", (now, now - self.retention))
+            ]
+            self._conn.execute(f"DELETE FROM vacancies WHERE {condition}", (now, now - self.retention))
+            self._conn.commit()
+            for url in expired:
+                self._index.remove(url)
+        return expired
+
+    def _add_keywords(self, keywords: Iterable[str]):
+        now = time.time()
+        rows = [(keyword.strip().lower(), now) for keyword in keywords if keyword.strip()]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT INTO crawl_keywords (keyword, last_requested) VALUES (?, ?) "
+                "ON CONFLICT(keyword) DO UPDATE SET last_requested = excluded.last_requested",
+                rows,
+            )
+            self._conn.commit()
+
+    def _keywords(self, since: float) -> List[str]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT keyword FROM crawl_keywords WHERE last_requested >= ? ORDER BY last_requested DESC",
+                (since,),
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM vacancies").fetchone()[0]
+
+    async def upsert(self, jobs: List[JobVacancy]):
+        if jobs:
+            await asyncio.to_thread(self._upsert, jobs)
+
+    async def seen_since(self, urls: List[str], since: float) -> set:
+        """Returns the subset of URLs that were (re)crawled after `since`."""
+        return await asyncio.to_thread(self._seen_since, urls, since)
+
+    async def search(self, keywords: List[str], limit: int = 100) -> List[JobVacancy]:
+        """BM25 top-`limit` vacancies for the keywords, best first."""
+        return await asyncio.to_thread(self._search, keywords, limit)
+
+    async def get(self, keys: List[str]) -> List[JobVacancy]:
+        """Vacancies by store key (canonical URL), skipping expired or unknown ones."""
+        return await asyncio.to_thread(self._get, keys)
+
+    async def remove_expired(self) -> List[str]:
+        """Deletes expired vacancies and returns their keys."""
+        return await asyncio.to_thread(self._remove_expired)
+
+    async def add_keywords(self, keywords: Iterable[str]):
+        """Registers keywords from user requests so the crawler keeps covering them."""
+        await asyncio.to_thread(self._add_keywords, list(keywords))
+
+    async def keywords(self, since: float) -> List[str]:
+        return await asyncio.to_thread(self._keywords, since)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_vacancy_store = None
+def get_vacancy_store() -> VacancyStore:
+    global _vacancy_store
+    if _vacancy_store is None:
+        settings = get_settings()
+        _vacancy_store = VacancyStore(
+            settings.VACANCY_STORE_PATH,
+            settings.VACANCY_STORE_RETENTION,
+            index_rebuild_interval=settings.VACANCY_INDEX_REBUILD_INTERVAL,
+        )
+    return _vacancy_store
@@ -0,0 +1,382 @@
+import json
+import os
+import shutil
+import threading
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from job_search_agent.configs.setting import get_settings
+from job_search_agent.utils.vector_similarity import cosine_many_to_many, cosine_one_to_many, normalize, top_k
+
+
+class VectorIndex(ABC):
+    """Top-k inner-product search over L2-normalized vectors, keyed by vacancy key."""
+
+    @abstractmethod
+    def add(self, keys: Sequence[str], vectors: np.ndarray):
+        """Inserts vectors; re-adding an existing key replaces its vector."""
+
+    @abstractmethod
+    def remove(self, keys: Sequence[str]):
+        pass
+
+    @abstractmethod
+    def search(self, query: np.ndarray, k: int) -> List[Tuple[str, float]]:
+        """Returns up to k (key, similarity) pairs, best first."""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
+
+class ExactIndex(VectorIndex):
+    """Brute-force dot product over every vector; the ground truth for IVFIndex."""
+
+    def __init__(self):
+        self._keys: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._vectors = np.zeros((0, 0), dtype=np.float32)
+
+    def add(self, keys: Sequence[str], vectors: np.ndarray):
+        self.remove(keys)
+        vectors = np.asarray(vectors, dtype=np.float32)
+        base = len(self._keys)
+        self._vectors = vectors if not base else np.vstack([self._vectors, vectors])
+        for i, key in enumerate(keys):
+            self._rows[key] = base + i
+        self._keys.extend(keys)
+
+    def remove(self, keys: Sequence[str]):
+        drop = [self._rows[key] for key in keys if key in self._rows]
+        if not drop:
+            return
+        keep = np.setdiff1d(np.arange(len(self._keys)), drop)
+        self._keys = [self._keys[i] for i in keep]
+        self._vectors = self._vectors[keep]
+        self._rows = {key: i for i, key in enumerate(self._keys)}
+
+    def search(self, query: np.ndarray, k: int) -> List[Tuple[str, float]]:
+        if k <= 0 or not self._keys:
+            return []
+        scores = cosine_one_to_many(query, self._vectors, normalized=True)
+        return [(self._keys[i], float(scores[i])) for i in top_k(scores, k)]
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+def _spherical_kmeans(vectors: np.ndarray, n_lists: int, iterations: int, seed: int = 0) -> np.ndarray:
+    """Unit-length centroids maximizing the inner product with their assigned vectors."""
+    rng = np.random.default_rng(seed)
+    centroids = vectors[rng.choice(len(vectors), n_lists, replace=False)].copy()
+    for _ in range(iterations):
+        assignment = _assign(vectors, centroids)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assignment, vectors)
+        counts = np.bincount(assignment, minlength=n_lists)
+        empty = counts == 0
+        # Empty lists are reseeded from random vectors so no probe is wasted.
+        sums[empty] = vectors[rng.choice(len(vectors), int(empty.sum()), replace=False)]
+        centroids = normalize(sums)
+    return centroids
+
+
+def _assign(vectors: np.ndarray, centroids: np.ndarray, chunk: int = 16_384) -> np.ndarray:
+    out = np.empty(len(vectors), dtype=np.int32)
+    for start in range(0, len(vectors), chunk):
+        out[start:start + chunk] = np.argmax(cosine_many_to_many(vectors[start:start + chunk], centroids, normalized=True), axis=1)
+    return out
+
+
+class IVFIndex(VectorIndex):
+    """
+    Inverted-file (IVF-flat) index: vectors are clustered around k-means centroids
+    and a query only scans the `n_probe` lists whose centroids are closest to it.
+
+    The saved index is a set of .npy files, with vectors sorted by list so each
+    list is one contiguous slice. Files are opened with mmap, so workers share
+    pages and start without reading the whole matrix. Inserts since the last save
+    go to an in-memory delta. Deletes are tombstones until the next save
+    compacts them. Saves write a new generation directory and atomically
+    repoint CURRENT; readers pick it up with `maybe_reload`. There should be a
+    single writer (the crawler).
+
+    Below `min_train_size` vectors the index stays a single list, which is exact search.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        n_lists: int = 1024,
+        n_probe: int = 32,
+        min_train_size: int = 10_000,
+        kmeans_iterations: int = 8,
+        reload_interval: float = 60.0,
+    ):
+        self.directory = Path(directory) if directory else None
+        self.n_lists = n_lists
+        self.n_probe = n_probe
+        self.min_train_size = min_train_size
+        self.kmeans_iterations = kmeans_iterations
+        self.reload_interval = reload_interval
+        self._lock = threading.RLock()
+        self._generation: Optional[str] = None
+        self._checked_at = 0.0
+        self._dirty = False
+        self._reset()
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._load()
+
+    def _reset(self, dim: int = 0):
+        self._centroids: Optional[np.ndarray] = None
+        self._trained_size = 0
+        self._base = np.zeros((0, dim), dtype=np.float32)
+        self._offsets = np.zeros(2, dtype=np.int64)
+        self._base_alive = np.zeros(0, dtype=bool)
+        self._keys: List[Optional[str]] = []
+        self._delta: List[np.ndarray] = []
+        self._delta_lists: List[int] = []
+        self._delta_alive: List[bool] = []
+        self._delta_arrays: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self._rows: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    # --- persistence -------------------------------------------------------
+
+    def _current(self) -> Optional[str]:
+        try:
+            return (self.directory / "CURRENT").read_text().strip() or None
+        except FileNotFoundError:
+            return None
+
+    def _load(self):
+        generation = self._current()
+        if generation is None:
+            return
+        path = self.directory / generation
+        meta = json.loads((path / "meta.json").read_text())
+        keys = json.loads((path / "keys.json").read_text())
+        self._reset()
+        self._base = np.load(path / "vectors.npy", mmap_mode="r")
+        self._offsets = np.load(path / "offsets.npy")
+        self._centroids = np.load(path / "centroids.npy") if meta["trained"] else None
+        self._trained_size = meta["trained_size"]
+        self._base_alive = np.ones(len(keys), dtype=bool)
+        self._keys = keys
+        self._rows = {key: i for i, key in enumerate(keys)}
+        self._generation = generation
+
+    def maybe_reload(self):
+        """Picks up a generation saved by another process, unless there are unsaved local changes."""
+        if self.directory is None or self._dirty:
+            return
+        now = time.monotonic()
+        if now - self._checked_at < self.reload_interval:
+            return
+        self._checked_at = now
+        generation = self._current()
+        if generation != self._generation:
+            with self._lock:
+                self._load()
+
+    def _live(self) -> Tuple[List[str], np.ndarray]:
+        n_base = len(self._base_alive)
+        base_rows = np.flatnonzero(self._base_alive)
+        keys = [self._keys[i] for i in base_rows]
+        parts = [np.asarray(self._base[base_rows])] if base_rows.size else []
+        delta_rows = [i for i, alive in enumerate(self._delta_alive) if alive]
+        keys += [self._keys[n_base + i] for i in delta_rows]
+        if delta_rows:
+            parts.append(np.stack([self._delta[i] for i in delta_rows]))
+        vectors = np.vstack(parts) if parts else np.zeros((0, self._base.shape[1]), dtype=np.float32)
+        return keys, vectors
+
+    def save(self):
+        """Compacts tombstones and the delta into a new on-disk generation, retraining lists when needed."""
+        if self.directory is None:
+            raise ValueError("IVFIndex has no directory to save to")
+        with self._lock:
+            keys, vectors = self._live()
+            n = len(keys)
+            centroids, trained_size = self._centroids, self._trained_size
+            # Retrain once the index outgrows its clustering so lists stay balanced.
+            if n >= self.min_train_size and (centroids is None or n > 2 * trained_size):
+                n_lists = min(self.n_lists, max(1, int(np.sqrt(n))))
+                sample = vectors[np.random.default_rng(0).choice(n, min(n, n_lists * 64), replace=False)]
+                centroids = _spherical_kmeans(sample, n_lists, self.kmeans_iterations)
+                trained_size = n
+            elif n < self.min_train_size:
+                centroids, trained_size = None, 0
+
+            if centroids is not None:
+                assignment = _assign(vectors, centroids)
+                order = np.argsort(assignment, kind="stable")
+                offsets = np.searchsorted(assignment[order], np.arange(len(centroids) + 1)).astype(np.int64)
+            else:
+                order = np.arange(n)
+                offsets = np.array([0, n], dtype=np.int64)
+
+            generation = f"gen-{time.time_ns()}"
+            path = self.directory / generation
+            path.mkdir()
+            np.save(path / "vectors.npy", vectors[order])
+            np.save(path / "offsets.npy", offsets)
+            if centroids is not None:
+                np.save(path / "centroids.npy", centroids)
+            (path / "keys.json").write_text(json.dumps([keys[i] for i in order]))
+            (path / "meta.json").write_text(json.dumps({"trained": centroids is not None, "trained_size": trained_size}))
+            tmp = self.directory / "CURRENT.tmp"
+            tmp.write_text(generation)
+            os.replace(tmp, self.directory / "CURRENT")
+
+            previous = self._generation
+            self._dirty = False
+            self._load()
+            # Keep the previous generation: readers may still be mid-reload from it.
+            for old in self.directory.glob("gen-*"):
+                if old.name not in (generation, previous):
+                    shutil.rmtree(old, ignore_errors=True)
+
+    # --- mutation ----------------------------------------------------------
+
+    def add(self, keys: Sequence[str], vectors: np.ndarray):
+        vectors = np.asarray(vectors, dtype=np.float32)
+        with self._lock:
+            self.remove(keys)
+            if not len(self._keys) and self._base.shape[1] != vectors.shape[1]:
+                self._reset(vectors.shape[1])
+            lists = _assign(vectors, self._centroids) if self._centroids is not None else np.zeros(len(keys), dtype=np.int32)
+            for key, vector, list_id in zip(keys, vectors, lists):
+                self._rows[key] = len(self._keys)
+                self._keys.append(key)
+                self._delta.append(vector)
+                self._delta_lists.append(int(list_id))
+                self._delta_alive.append(True)
+            self._delta_arrays = None
+            self._dirty = True
+
+    def remove(self, keys: Sequence[str]):
+        with self._lock:
+            n_base = len(self._base_alive)
+            for key in keys:
+                row = self._rows.pop(key, None)
+                if row is None:
+                    continue
+                if row < n_base:
+                    self._base_alive[row] = False
+                else:
+                    self._delta_alive[row - n_base] = False
+                self._dirty = True
+
+    # --- search ------------------------------------------------------------
+
+    def search(self, query: np.ndarray, k: int) -> List[Tuple[str, float]]:
+        if k <= 0:
+            return []
+        query = np.asarray(query, dtype=np.float32)
+        with self._lock:
+            if not self._rows:
+                return []
+            if self._centroids is not None:
+                n_probe = min(self.n_probe, len(self._centroids))
+                probe = top_k(cosine_one_to_many(query, self._centroids, normalized=True), n_probe)
+            else:
+                probe = np.zeros(1, dtype=np.int64)
+
+            rows, scores = [], []
+            for list_id in probe:
+                start, end = self._offsets[list_id], self._offsets[list_id + 1]
+                if end > start:
+                    rows.append(np.arange(start, end))
+                    scores.append(cosine_one_to_many(query, self._base[start:end], normalized=True))
+
+            n_base = len(self._base_alive)
+            if self._delta:
+                if self._delta_arrays is None:
+                    self._delta_arrays = (np.stack(self._delta), np.asarray(self._delta_lists))
+                delta, delta_lists = self._delta_arrays
+                selected = np.flatnonzero(np.isin(delta_lists, probe))
+                if selected.size:
+                    rows.append(selected + n_base)
+                    scores.append(cosine_one_to_many(query, delta[selected], normalized=True))
+            if not rows:
+                return []
+
+            rows = np.concatenate(rows)
+            scores = np.concatenate(scores)
+            alive = np.concatenate([self._base_alive, np.asarray(self._delta_alive, dtype=bool)])[rows]
+            rows, scores = rows[alive], scores[alive]
+            return [(self._keys[rows[i]], float(scores[i])) for i in top_k(scores, k)]
+
+
+_vector_index = None
+def get_vector_index() -> Optional[IVFIndex]:
+    """Returns the shared vacancy vector index, or None when it is disabled."""
+    global _vector_index
+    settings = get_settings()
+    if not settings.ANN_INDEX_ENABLED:
+        return None
+    if _vector_index is None:
+        _vector_index = IVFIndex(
+            settings.ANN_INDEX_DIR,
+            n_lists=settings.ANN_LISTS,
+            n_probe=settings.ANN_PROBES,
+            min_train_size=settings.ANN_MIN_TRAIN_SIZE,
+            reload_interval=settings.ANN_RELOAD_INTERVAL,
+        )
+    return _vector_index
+
+
+def main(n_vectors: int = 500_000, dim: int = 384, queries: int = 200, k: int = 100):
+    """Reports recall@k and query latency of IVFIndex against exact search on clustered synthetic vectors."""
+    import tempfile
+
+    rng = np.random.default_rng(0)
+    # Vacancies cluster by profession; mimic that instead of uniform noise.
+    topics = rng.standard_normal((500, dim)).astype(np.float32)
+    vectors = topics[rng.integers(0, len(topics), n_vectors)] + 0.35 * rng.standard_normal((n_vectors, dim)).astype(np.float32)
+    vectors = normalize(vectors)
+    keys = [f"job{i}" for i in range(n_vectors)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        start = time.perf_counter()
+        index = IVFIndex(directory)
+        index.add(keys, vectors)
+        index.save()
+        print(f"Built IVF index over {n_vectors} vectors in {time.perf_counter() - start:.1f}s")
+
+        start = time.perf_counter()
+        index = IVFIndex(directory)
+        print(f"Reopened (mmap) in {(time.perf_counter() - start) * 1000:.1f}ms")
+
+        sample = rng.choice(n_vectors, queries, replace=False)
+        query_vectors = vectors[sample] + 0.3 * rng.standard_normal((queries, dim)).astype(np.float32)
+        query_vectors = normalize(query_vectors)
+
+        for n_probe in (4, 8, 16, 32, 64):
+            index.n_probe = n_probe
+            recalls, ivf_times, exact_times = [], [], []
+            for query in query_vectors:
+                start = time.perf_counter()
+                exact = top_k(cosine_one_to_many(query, vectors, normalized=True), k)
+                exact_times.append(time.perf_counter() - start)
+                start = time.perf_counter()
+                approx = index.search(query, k)
+                ivf_times.append(time.perf_counter() - start)
+                expected = {keys[i] for i in exact}
+                recalls.append(len(expected & {key for key, _ in approx}) / k)
+            print(
+                f"n_probe={n_probe:3d} recall@{k}={np.mean(recalls):.3f} "
+                f"ivf p50={np.median(ivf_times) * 1000:.2f}ms exact p50={np.median(exact_times) * 1000:.2f}ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
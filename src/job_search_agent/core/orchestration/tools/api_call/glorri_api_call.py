@@ -1,21 +1,23 @@
 import asyncio
-from typing import List, Any
-import httpx
+from typing import List, Any, Optional
 
 from job_search_agent.core.orchestration.models.job_vacancy import JobVacancy
 from job_search_agent.core.orchestration.tools.api_call.model_mapper import map_glorri_response
+from job_search_agent.core.orchestration.tools.http_client.pool import HttpClientPool, get_http_pool
+from job_search_agent.core.orchestration.tools.http_client.scheduler import HostScheduler, get_scrape_scheduler
 
 
 class GlorriAPICall:
-    def __init__(self):
-        pass
+    def __init__(self, http_pool: Optional[HttpClientPool] = None, scheduler: Optional[HostScheduler] = None):
+        self.http_pool = http_pool or get_http_pool()
+        self.scheduler = scheduler or get_scrape_scheduler()
 
     async def scrape(self, query: str) -> List[str]:
         url = f"https://api-dev.glorri.az/job-service-v2/jobs/public?keyword={query.lower()}&offset=0&limit=10"
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url)
-            response.raise_for_status()
-            data = response.json()
+        async with self.scheduler.slot(url):
+            response = await self.http_pool.get(url)
+        response.raise_for_status()
+        data = response.json()
 
         jobs = [map_glorri_response(item) for item in data.get("entities", [])]
         return jobs
@@ -26,6 +28,7 @@ async def main():
     jobs = await scraper.scrape("developer")  # your search query
     for job in jobs:
         print(job)
+    await scraper.http_pool.aclose()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,51 @@
+from typing import Dict, List, Optional, Set
+
+from job_search_agent.core.orchestration.models.job_vacancy import JobVacancy
+from job_search_agent.utils.minhash import MinHashLSH
+from job_search_agent.utils.tokenizer import tokenize
+
+
+def job_shingles(job: JobVacancy) -> Set[str]:
+    """
+    Title and company tokens (tagged by field) plus requirement word bigrams.
+    Tokens are folded, so "Mühasib" / "Muhasib" and "Front-end" / "Frontend" shingle alike.
+    """
+    shingles = {f"t:{token}" for token in tokenize(job.title)}
+    shingles |= {f"c:{token}" for token in tokenize(job.company)}
+    requirements = tokenize(job.requirements)
+    shingles |= {f"{a} {b}" for a, b in zip(requirements, requirements[1:])}
+    return shingles
+
+
+def _jaccard(a: Set[str], b: Set[str]) -> float:
+    return len(a & b) / len(a | b) if a or b else 1.0
+
+
+class NearDuplicateFilter:
+    """
+    Detects reposts of the same vacancy (e.g. on both jobsearch.az and glorri)
+    whose title or company spelling differs slightly.
+
+    MinHash LSH over `job_shingles` finds candidates in sub-linear time. A
+    candidate only counts as a duplicate if the titles also overlap: companies
+    often paste the same requirements template into different positions.
+    """
+
+    def __init__(self, threshold: float = 0.6, title_threshold: float = 0.5):
+        self.title_threshold = title_threshold
+        self._lsh = MinHashLSH(threshold=threshold)
+        self._titles: Dict[int, Set[str]] = {}
+        self._jobs: List[JobVacancy] = []
+
+    def add(self, job: JobVacancy) -> Optional[JobVacancy]:
+        """Indexes the vacancy unless it duplicates one already seen; returns that earlier vacancy."""
+        signature = self._lsh.signature(job_shingles(job))
+        title = set(tokenize(job.title))
+        for key, _ in self._lsh.query(signature):
+            if _jaccard(title, self._titles[key]) >= self.title_threshold:
+                return self._jobs[key]
+        key = len(self._jobs)
+        self._jobs.append(job)
+        self._titles[key] = title
+        self._lsh.add(key, signature)
+        return None
@@ -0,0 +1,132 @@
+import asyncio
+import threading
+from typing import List, Optional, Set, Tuple
+
+import numpy as np
+
+from job_search_agent.configs.setting import get_settings
+from job_search_agent.core.orchestration.models.job_vacancy import JobVacancy
+
+
+def job_embedding_text(job: JobVacancy, max_chars: int = 2000) -> str:
+    """Text used to embed a vacancy: the fields the matching prompt also relies on."""
+    return f"{job.title}\n{job.requirements}\n{job.description}"[:max_chars]
+
+
+class Embedder:
+    """
+    Thin wrapper around a sentence-transformers model.
+
+    The model is loaded lazily on first use (importing torch is slow), and every
+    call returns L2-normalized float32 vectors so cosine similarity is a plain dot product.
+    """
+
+    def __init__(self, model_name: str, batch_size: int = 64):
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self._model = None
+        self._lock = threading.Lock()
+
+    def _get_model(self):
+        if self._model is None:
+            with self._lock:
+                if self._model is None:
+                    from sentence_transformers import SentenceTransformer
+                    self._model = SentenceTransformer(self.model_name, device="cpu")
+        return self._model
+
+    def encode(self, texts: List[str]) -> np.ndarray:
+        if not texts:
+            return np.zeros((0, 0), dtype=np.float32)
+        vectors = self._get_model().encode(
+            texts,
+            batch_size=self.batch_size,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=False,
+        )
+        return vectors.astype(np.float32, copy=False)
+
+    async def aencode(self, texts: List[str]) -> np.ndarray:
+        """Encodes in a worker thread so the model forward pass does not block the event loop."""
+        return await asyncio.to_thread(self.encode, texts)
+
+
+class EncodeBatcher:
+    """
+    Coalesces concurrent encode requests into a single model forward pass.
+
+    Requests arriving within `max_wait` seconds of each other (or while a forward
+    pass is already running) are concatenated and encoded together, then each
+    caller receives its own slice of the result.
+    """
+
+    def __init__(self, embedder: Embedder, max_batch: int = 256, max_wait: float = 0.01):
+        self.embedder = embedder
+        self.model_name = embedder.model_name
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._pending: List[Tuple[List[str], asyncio.Future]] = []
+        self._pending_texts = 0
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._running = False
+        self._tasks: Set[asyncio.Task] = set()
+        self.batches = 0
+        self.requests = 0
+
+    async def aencode(self, texts: List[str]) -> np.ndarray:
+        if not texts:
+            return np.zeros((0, 0), dtype=np.float32)
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((texts, future))
+        self._pending_texts += len(texts)
+        self.requests += 1
+        if self._pending_texts >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+        return await future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        # A running pass flushes again when it finishes, picking up everything queued meanwhile.
+        if self._running or not self._pending:
+            return
+        pending, self._pending, self._pending_texts = self._pending, [], 0
+        self._running = True
+        task = asyncio.create_task(self._run(pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, pending: List[Tuple[List[str], asyncio.Future]]):
+        try:
+            texts = [text for request, _ in pending for text in request]
+            self.batches += 1
+            try:
+                vectors = await self.embedder.aencode(texts)
+            except Exception as e:
+                for _, future in pending:
+                    if not future.done():
+                        future.set_exception(e)
+                return
+            offset = 0
+            for request, future in pending:
+                if not future.done():
+                    future.set_result(vectors[offset:offset + len(request)])
+                offset += len(request)
+        finally:
+            self._running = False
+            if self._pending:
+                self._flush()
+
+
+_embedder = None
+def get_embedder() -> Embedder:
+    global _embedder
+    if _embedder is None:
+        settings = get_settings()
+        _embedder = Embedder(settings.EMBEDDING_MODEL, batch_size=settings.EMBEDDING_BATCH_SIZE)
+    return _embedder
@@ -0,0 +1,207 @@
+import asyncio
+import hashlib
+import re
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from job_search_agent.configs.setting import get_settings
+from job_search_agent.core.orchestration.tools.embeddings.embedder import EncodeBatcher, get_embedder
+
+
+def content_hash(text: str, model_name: str) -> str:
+    """Stable key for an embedding: model name plus whitespace-normalized text."""
+    normalized = re.sub(r"\s+", " ", text).strip()
+    return hashlib.sha1(f"{model_name}\0{normalized}".encode("utf-8")).hexdigest()
+
+
+class EmbeddingStore:
+    """
+    Disk-backed embedding cache for one model.
+
+    Vectors live in a raw float32 file that is memory-mapped, so lookups are
+    zero-copy reads and several workers share the same page cache. A SQLite
+    table maps content hash -> row. Rows are allocated inside a write transaction,
+    which keeps concurrent writers (API workers, the crawler) from colliding.
+    """
+
+    GROWTH_ROWS = 4096
+
+    def __init__(self, directory: str, model_name: str):
+        slug = re.sub(r"[^A-Za-z0-9_.-]+", "_", model_name)
+        self.directory = Path(directory) / slug
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.model_name = model_name
+        self.vectors_path = self.directory / "vectors.f32"
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.directory / "index.sqlite3", check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS rows (hash TEXT PRIMARY KEY, row INTEGER NOT NULL);
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+            """
+        )
+        dim = self._conn.execute("SELECT value FROM meta WHERE key = 'dim'").fetchone()
+        self.dim: Optional[int] = int(dim[0]) if dim else None
+        self._map: Optional[np.memmap] = None
+
+    def _mapped_rows(self) -> int:
+        return 0 if self._map is None else self._map.shape[0]
+
+    def _remap(self):
+        """(Re)opens the memory map over the whole file, e.g. after it grew."""
+        if self.dim is None or not self.vectors_path.exists():
+            self._map = None
+            return
+        rows = self.vectors_path.stat().st_size // (4 * self.dim)
+        self._map = np.memmap(self.vectors_path, dtype=np.float32, mode="r+", shape=(rows, self.dim)) if rows else None
+
+    def _ensure_capacity(self, rows: int):
+        needed = rows * 4 * self.dim
+        size = self.vectors_path.stat().st_size if self.vectors_path.exists() else 0
+        if size < needed:
+            grow_to = max(needed, size + self.GROWTH_ROWS * 4 * self.dim)
+            with open(self.vectors_path, "ab") as f:
+                f.truncate(grow_to)
+        if self._mapped_rows() < rows:
+            self._remap()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM rows").fetchone()[0]
+
+    def get_many(self, hashes: List[str]) -> Dict[str, np.ndarray]:
+        """Returns the cached vectors for the hashes that are present."""
+        if not hashes or self.dim is None:
+            return {}
+        with self._lock:
+            found = {}
+            for start in range(0, len(hashes), 500):
+                chunk = hashes[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                found.update(self._conn.execute(
+                    f"SELECT hash, row FROM rows WHERE hash IN ({placeholders})", chunk
+                ).fetchall())
+            if not found:
+                return {}
+            if max(found.values()) >= self._mapped_rows():
+                self._remap()
+            return {h: np.array(self._map[row]) for h, row in found.items()}
+
+    def put_many(self, hashes: List[str], vectors: np.ndarray):
+        if not hashes:
+            return
+        vectors = np.asarray(vectors, dtype=np.float32)
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                if self.dim is None:
+                    self.dim = int(vectors.shape[1])
+                    self._conn.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('dim', ?)", (str(self.dim),))
+                existing = {
+                    row[0] for row in self._conn.execute(
+                        f"SELECT hash FROM rows WHERE hash IN ({','.join('?' * len(hashes))})", hashes
+                    )
+                }
+                new = [(h, v) for h, v in zip(hashes, vectors) if h not in existing]
+                if new:
+                    first = self._conn.execute("SELECT COALESCE(MAX(row) + 1, 0) FROM rows").fetchone()[0]
+                    self._ensure_capacity(first + len(new))
+                    self._map[first:first + len(new)] = np.stack([v for _, v in new])
+                    self._map.flush()
+                    self._conn.executemany(
+                        "INSERT INTO rows (hash, row) VALUES (?, ?)",
+                        [(h, first + i) for i, (h, _) in enumerate(new)],
+                    )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def close(self):
+        with self._lock:
+            self._map = None
+            self._conn.close()
+
+
+class CachedEmbedder:
+    """
+    Embedder front-end that only runs the model for texts it has never seen.
+
+    Known texts are read from the EmbeddingStore; unknown ones go through the
+    EncodeBatcher and are written back. Concurrent requests for the same text
+    share one in-flight computation instead of encoding it twice.
+    """
+
+    def __init__(self, batcher: EncodeBatcher, store: EmbeddingStore):
+        self.batcher = batcher
+        self.store = store
+        self.model_name = batcher.model_name
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self.hits = 0
+        self.misses = 0
+
+    async def _compute(self, missing: Dict[str, str]) -> Dict[str, np.ndarray]:
+        vectors = await self.batcher.aencode(list(missing.values()))
+        await asyncio.to_thread(self.store.put_many, list(missing), vectors)
+        return dict(zip(missing, vectors))
+
+    async def aencode(self, texts: List[str]) -> np.ndarray:
+        if not texts:
+            return np.zeros((0, 0), dtype=np.float32)
+        hashes = [content_hash(text, self.model_name) for text in texts]
+        vectors = await asyncio.to_thread(self.store.get_many, list(dict.fromkeys(hashes)))
+
+        missing: Dict[str, str] = {}
+        waits = set()
+        for h, text in zip(hashes, texts):
+            if h in vectors or h in missing:
+                continue
+            if h in self._inflight:
+                waits.add(self._inflight[h])
+            else:
+                missing[h] = text
+        self.hits += sum(1 for h in hashes if h in vectors)
+        self.misses += len(missing)
+
+        if missing:
+            task = asyncio.ensure_future(self._compute(missing))
+            for h in missing:
+                self._inflight[h] = task
+            task.add_done_callback(lambda _: [self._inflight.pop(h, None) for h in missing])
+            waits.add(task)
+        # Shielded so a cancelled caller does not abort work other callers are waiting on.
+        for task in waits:
+            vectors.update(await asyncio.shield(task))
+        return np.stack([vectors[h] for h in hashes])
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stored": len(self.store),
+            "batches": self.batcher.batches,
+            "requests": self.batcher.requests,
+        }
+
+
+_cached_embedder = None
+def get_cached_embedder():
+    """Returns the shared caching embedder, or the plain embedder when the cache is disabled."""
+    global _cached_embedder
+    settings = get_settings()
+    if not settings.EMBEDDING_CACHE_ENABLED:
+        return get_embedder()
+    if _cached_embedder is None:
+        embedder = get_embedder()
+        batcher = EncodeBatcher(
+            embedder,
+            max_batch=settings.EMBEDDING_BATCH_MAX_TEXTS,
+            max_wait=settings.EMBEDDING_BATCH_MAX_WAIT,
+        )
+        _cached_embedder = CachedEmbedder(batcher, EmbeddingStore(settings.EMBEDDING_CACHE_DIR, embedder.model_name))
+    return _cached_embedder
@@ -0,0 +1,33 @@
+from typing import List, Tuple
+
+import numpy as np
+
+from job_search_agent.core.orchestration.models.job_vacancy import JobVacancy
+from job_search_agent.core.orchestration.tools.embeddings.embedder import job_embedding_text
+from job_search_agent.core.orchestration.tools.embeddings.embedding_store import get_cached_embedder
+from job_search_agent.utils.vector_similarity import cosine_one_to_many, top_k
+
+
+class EmbeddingPrefilter:
+    """
+    Ranks candidate vacancies by embedding similarity to the resume so only the
+    most promising ones are sent to the (expensive) LLM matching step.
+    """
+
+    def __init__(self, embedder=None):
+        # Anything with an async `aencode(texts)` returning normalized vectors.
+        self.embedder = embedder or get_cached_embedder()
+
+    async def score(self, resume_text: str, jobs: List[JobVacancy]) -> np.ndarray:
+        """Cosine similarity of each job to the resume, from one batched encode and one matrix product."""
+        if not jobs:
+            return np.zeros(0, dtype=np.float32)
+        vectors = await self.embedder.aencode([resume_text] + [job_embedding_text(job) for job in jobs])
+        return cosine_one_to_many(vectors[0], vectors[1:], normalized=True)
+
+    async def top_k(self, resume_text: str, jobs: List[JobVacancy], k: int) -> List[Tuple[JobVacancy, float]]:
+        """Returns the k most similar jobs, best first."""
+        if k <= 0:
+            return []
+        scores = await self.score(resume_text, jobs)
+        return [(jobs[i], float(scores[i])) for i in top_k(scores, k)]
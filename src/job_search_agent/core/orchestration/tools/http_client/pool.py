@@ -0,0 +1,76 @@
+import asyncio
+from importlib.util import find_spec
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+import httpx
+
+from job_search_agent.configs.setting import get_settings
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+}
+
+
+class HttpClientPool:
+    """
+    Process-wide pool of keep-alive httpx clients, one per host.
+
+    Keeping a dedicated client per host gives every job board its own connection
+    limit, so a burst against one site cannot starve requests to another, and
+    connections (TCP + TLS) are reused across scrapes instead of being opened per URL.
+    """
+
+    def __init__(self):
+        settings = get_settings()
+        self.timeout = httpx.Timeout(
+            settings.HTTP_READ_TIMEOUT,
+            connect=settings.HTTP_CONNECT_TIMEOUT,
+        )
+        self.limits = httpx.Limits(
+            max_connections=settings.HTTP_MAX_CONNECTIONS_PER_HOST,
+            max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_PER_HOST,
+            keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY,
+        )
+        # HTTP/2 needs the optional `h2` package; fall back to HTTP/1.1 keep-alive without it.
+        self.http2 = settings.HTTP2_ENABLED and find_spec("h2") is not None
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+
+    def client_for(self, url: str) -> httpx.AsyncClient:
+        """Returns the shared client for the host of the given URL, creating it lazily."""
+        host = urlparse(url).netloc.lower()
+        client = self._clients.get(host)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                headers=DEFAULT_HEADERS,
+                timeout=self.timeout,
+                limits=self.limits,
+                http2=self.http2,
+                follow_redirects=True,
+            )
+            self._clients[host] = client
+        return client
+
+    async def get(self, url: str, headers: Optional[Dict[str, str]] = None) -> httpx.Response:
+        return await self.client_for(url).get(url, headers=headers)
+
+    async def aclose(self):
+        """Closes every pooled client. Called from the API lifespan on shutdown."""
+        clients = list(self._clients.values())
+        self._clients.clear()
+        await asyncio.gather(*(client.aclose() for client in clients), return_exceptions=True)
+
+
+_http_pool = None
+def get_http_pool() -> HttpClientPool:
+    global _http_pool
+    if _http_pool is None:
+        _http_pool = HttpClientPool()
+    return _http_pool
+
+
+async def close_http_pool():
+    global _http_pool
+    if _http_pool is not None:
+        await _http_pool.aclose()
+        _http_pool = None
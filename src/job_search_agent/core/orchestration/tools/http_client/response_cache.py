@@ -0,0 +1,153 @@
+import asyncio
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+from pydantic import BaseModel
+
+from job_search_agent.configs.setting import get_settings
+
+
+class CachedResponse(BaseModel):
+    url: str
+    body: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    fetched_at: float
+
+    def is_fresh(self, ttl: float) -> bool:
+        return time.time() - self.fetched_at < ttl
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Validators to send with a revalidation request."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """
+    On-disk (SQLite) cache of fetched pages with their HTTP validators.
+
+    Entries younger than `ttl` are served without touching the network. Older
+    entries are revalidated with a conditional GET, so an unchanged page costs
+    a bodiless 304 instead of a full download.
+
+    Every `purge_interval` seconds a write also deletes the entries not fetched or
+    revalidated within `retention`, then the least recently fetched entries beyond
+    `max_bytes` of stored pages.
+    """
+
+    def __init__(self, path: str, ttl: float, retention: float, max_bytes: int, purge_interval: float = 600):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.retention = retention
+        self.max_bytes = max_bytes
+        self.purge_interval = purge_interval
+        self._purged_at = 0.0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                url TEXT PRIMARY KEY,
+                body TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                fetched_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+        # Metrics
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+
+    def _get(self, url: str) -> Optional[CachedResponse]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url, body, etag, last_modified, fetched_at FROM responses WHERE url = ?",
+                (url,),
+            ).fetchone()
+        if row is None:
+            return None
+        return CachedResponse(url=row[0], body=row[1], etag=row[2], last_modified=row[3], fetched_at=row[4])
+
+    def _put(self, entry: CachedResponse):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (url, body, etag, last_modified, fetched_at) VALUES (?, ?, ?, ?, ?)",
+                (entry.url, entry.body, entry.etag, entry.last_modified, entry.fetched_at),
+            )
+            if entry.fetched_at - self._purged_at >= self.purge_interval:
+                self._purge(entry.fetched_at)
+            self._conn.commit()
+
+    def _purge(self, now: float):
+        self._purged_at = now
+        self._conn.execute("DELETE FROM responses WHERE fetched_at < ?", (now - self.retention,))
+        self._conn.execute(
+            """
+            DELETE FROM responses WHERE url IN (
+                SELECT url FROM (
+                    SELECT url, SUM(LENGTH(CAST(body AS BLOB))) OVER (ORDER BY fetched_at DESC) AS kept
+                    FROM responses
+                ) WHERE kept > ?
+            )
+            """,
+            (self.max_bytes,),
+        )
+
+    def _touch(self, url: str):
+        with self._lock:
+            self._conn.execute("UPDATE responses SET fetched_at = ? WHERE url = ?", (time.time(), url))
+            self._conn.commit()
+
+    async def get(self, url: str) -> Optional[CachedResponse]:
+        return await asyncio.to_thread(self._get, url)
+
+    async def put(self, url: str, body: str, etag: Optional[str], last_modified: Optional[str]):
+        entry = CachedResponse(url=url, body=body, etag=etag, last_modified=last_modified, fetched_at=time.time())
+        await asyncio.to_thread(self._put, entry)
+
+    async def touch(self, url: str):
+        """Marks a revalidated (304) entry as fresh again."""
+        await asyncio.to_thread(self._touch, url)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "revalidated": self.revalidated, "misses": self.misses}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_response_cache = None
+def get_response_cache() -> Optional[ResponseCache]:
+    """Returns the shared response cache, or None when caching is disabled."""
+    global _response_cache
+    settings = get_settings()
+    if not settings.HTTP_CACHE_ENABLED:
+        return None
+    if _response_cache is None:
+        _response_cache = ResponseCache(
+            settings.HTTP_CACHE_PATH,
+            settings.HTTP_CACHE_TTL,
+            retention=settings.HTTP_CACHE_RETENTION,
+            max_bytes=settings.HTTP_CACHE_MAX_BYTES,
+            purge_interval=settings.HTTP_CACHE_PURGE_INTERVAL,
+        )
+    return _response_cache
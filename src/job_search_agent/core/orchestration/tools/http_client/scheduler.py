@@ -0,0 +1,183 @@
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Deque, Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+from job_search_agent.configs.setting import get_settings
+
+
+class _HostState:
+    """Token bucket, in-flight counter and FIFO wait queue for a single host."""
+
+    def __init__(self, burst: float):
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.in_flight = 0
+        self.waiters: Deque[Tuple[asyncio.Future, float]] = deque()
+
+
+class HostScheduler:
+    """
+    Politeness scheduler for outbound requests to job boards.
+
+    Every request waits for a slot that respects three limits:
+    - a token bucket per host (sustained `rate_per_host` requests/sec with `burst` headroom),
+    - a maximum number of in-flight requests per host,
+    - a global maximum of in-flight requests across all hosts.
+
+    Requests to the same host are served FIFO and hosts are served round-robin,
+    so one busy board cannot starve the others.
+    """
+
+    def __init__(
+        self,
+        rate_per_host: float,
+        burst: float,
+        max_in_flight_per_host: int,
+        max_in_flight: int,
+    ):
+        self.rate_per_host = rate_per_host
+        self.burst = max(burst, 1.0)
+        self.max_in_flight_per_host = max_in_flight_per_host
+        self.max_in_flight = max_in_flight
+
+        self._hosts: Dict[str, _HostState] = {}
+        self._round_robin: Deque[str] = deque()
+        self._in_flight = 0
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._timer_due = 0.0
+
+        # Metrics
+        self._granted = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    @asynccontextmanager
+    async def slot(self, url: str):
+        """Waits for a request slot for the URL's host and holds it for the duration of the block."""
+        host = urlparse(url).netloc.lower()
+        await self._acquire(host)
+        try:
+            yield
+        finally:
+            self._release(host)
+
+    def stats(self) -> dict:
+        """Queue depth, concurrency and wait-time metrics for tuning throughput."""
+        return {
+            "in_flight": self._in_flight,
+            "queue_depth": sum(len(s.waiters) for s in self._hosts.values()),
+            "granted": self._granted,
+            "avg_wait_ms": round(self._total_wait / self._granted * 1000, 2) if self._granted else 0.0,
+            "max_wait_ms": round(self._max_wait * 1000, 2),
+            "hosts": {
+                host: {
+                    "in_flight": state.in_flight,
+                    "queue_depth": len(state.waiters),
+                    "tokens": round(state.tokens, 2),
+                }
+                for host, state in self._hosts.items()
+            },
+        }
+
+    async def _acquire(self, host: str):
+        state = self._hosts.get(host)
+        if state is None:
+            state = self._hosts[host] = _HostState(self.burst)
+
+        future = asyncio.get_running_loop().create_future()
+        state.waiters.append((future, time.monotonic()))
+        if host not in self._round_robin:
+            self._round_robin.append(host)
+        self._dispatch()
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was granted right before cancellation; hand it back.
+                self._release(host)
+            else:
+                state.waiters = deque(w for w in state.waiters if w[0] is not future)
+            raise
+
+    def _release(self, host: str):
+        self._hosts[host].in_flight -= 1
+        self._in_flight -= 1
+        self._dispatch()
+
+    def _refill(self, state: _HostState, now: float):
+        state.tokens = min(self.burst, state.tokens + (now - state.updated) * self.rate_per_host)
+        state.updated = now
+
+    def _dispatch(self):
+        """Grants slots round-robin across hosts until a limit is hit."""
+        next_token_in = None
+        idle_rounds = 0
+
+        while self._round_robin and self._in_flight < self.max_in_flight and idle_rounds < len(self._round_robin):
+            host = self._round_robin.popleft()
+            state = self._hosts[host]
+
+            while state.waiters and state.waiters[0][0].done():
+                state.waiters.popleft()
+            if not state.waiters:
+                continue
+
+            now = time.monotonic()
+            self._refill(state, now)
+
+            if state.in_flight < self.max_in_flight_per_host and state.tokens >= 1.0:
+                future, enqueued_at = state.waiters.popleft()
+                state.tokens -= 1.0
+                state.in_flight += 1
+                self._in_flight += 1
+
+                waited = now - enqueued_at
+                self._granted += 1
+                self._total_wait += waited
+                self._max_wait = max(self._max_wait, waited)
+
+                future.set_result(None)
+                idle_rounds = 0
+            else:
+                if state.in_flight < self.max_in_flight_per_host and self.rate_per_host > 0:
+                    wait = (1.0 - state.tokens) / self.rate_per_host
+                    next_token_in = wait if next_token_in is None else min(next_token_in, wait)
+                idle_rounds += 1
+
+            if state.waiters:
+                self._round_robin.append(host)
+
+        if next_token_in is not None:
+            self._schedule_wakeup(next_token_in)
+
+    def _schedule_wakeup(self, delay: float):
+        loop = asyncio.get_running_loop()
+        due = loop.time() + delay
+        if self._timer is not None and not self._timer.cancelled() and self._timer_due <= due:
+            return
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer_due = due
+        self._timer = loop.call_later(delay, self._on_wakeup)
+
+    def _on_wakeup(self):
+        self._timer = None
+        self._dispatch()
+
+
+_scheduler = None
+def get_scrape_scheduler() -> HostScheduler:
+    global _scheduler
+    if _scheduler is None:
+        settings = get_settings()
+        _scheduler = HostScheduler(
+            rate_per_host=settings.SCRAPER_HOST_RATE,
+            burst=settings.SCRAPER_HOST_BURST,
+            max_in_flight_per_host=settings.SCRAPER_MAX_IN_FLIGHT_PER_HOST,
+            max_in_flight=settings.SCRAPER_MAX_IN_FLIGHT,
+        )
+    return _scheduler
@@ -1,6 +1,5 @@
 import concurrent.futures
 import threading
-from tavily import TavilyClient
 from job_search_agent.core.orchestration.tools.search_tool.base import BaseSearchTool
 from job_search_agent.core.orchestration.tools.search_tool.trusted_websites import TRUSTED_WEBSITES, is_from_trusted_domain
 from job_search_agent.configs.setting import get_settings
@@ -8,6 +7,8 @@ from job_search_agent.core.orchestration.models.job_vacancy import JobVacancy
 
 class TavilySearchTool(BaseSearchTool):
     def __init__(self, max_results: int = 20):
+        from tavily import TavilyClient
+
         settings = get_settings()
         self.client = TavilyClient(api_key=settings.TAVILY_API_KEY.get_secret_value())
         self.max_results = max_results
@@ -1,9 +1,62 @@
 from abc import ABC, abstractmethod
+from typing import Optional
+
 from job_search_agent.core.orchestration.models.job_vacancy import JobVacancy
+from job_search_agent.core.orchestration.tools.http_client.pool import HttpClientPool, get_http_pool
+from job_search_agent.core.orchestration.tools.http_client.scheduler import HostScheduler, get_scrape_scheduler
+from job_search_agent.core.orchestration.tools.http_client.response_cache import ResponseCache, get_response_cache
+from job_search_agent.core.orchestration.tools.website_scrapper.parsing import ParsePool, get_parse_pool
 
 class BaseScraper(ABC):
     """Base class for all website scrapers."""
-    
+
+    def __init__(
+        self,
+        http_pool: Optional[HttpClientPool] = None,
+        scheduler: Optional[HostScheduler] = None,
+        response_cache: Optional[ResponseCache] = None,
+        parse_pool: Optional[ParsePool] = None,
+    ):
+        self.http_pool = http_pool or get_http_pool()
+        self.scheduler = scheduler or get_scrape_scheduler()
+        self.response_cache = response_cache or get_response_cache()
+        self.parse_pool = parse_pool or get_parse_pool()
+
+    def resolve_url(self, url: str) -> str:
+        """Maps a found URL to the one that should actually be fetched."""
+        return url
+
+    async def fetch(self, url: str) -> str:
+        """
+        Returns the page HTML, served from the response cache while fresh and
+        otherwise downloaded (or revalidated) through the pool, paced by the host scheduler.
+        """
+        cache = self.response_cache
+        cached = await cache.get(url) if cache else None
+        if cached and cached.is_fresh(cache.ttl):
+            cache.hits += 1
+            return cached.body
+
+        headers = cached.conditional_headers() if cached else None
+        async with self.scheduler.slot(url):
+            response = await self.http_pool.get(url, headers=headers)
+
+        if cached and response.status_code == 304:
+            cache.revalidated += 1
+            await cache.touch(url)
+            return cached.body
+
+        response.raise_for_status()
+        if cache:
+            cache.misses += 1
+            await cache.put(
+                url,
+                response.text,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+            )
+        return response.text
+
     @abstractmethod
     def can_handle(self, url: str) -> bool:
         """Check if this scraper can handle the given URL."""
@@ -13,3 +66,12 @@ class BaseScraper(ABC):
     async def scrape(self, url: str) -> JobVacancy:
         """Scrape the given URL and return a JobVacancy object."""
         pass
+
+    @classmethod
+    @abstractmethod
+    def parse(cls, html: str, url: str, backend: str = "html.parser") -> Optional[JobVacancy]:
+        """
+        Extract a JobVacancy from the page HTML.
+        Runs in the parse pool, so it must not touch instance or event-loop state.
+        """
+        pass
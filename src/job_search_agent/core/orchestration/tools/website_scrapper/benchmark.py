@@ -0,0 +1,224 @@
+import argparse
+import asyncio
+import hashlib
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from job_search_agent.core.orchestration.tools.website_scrapper.parsing import parse_page, resolve_backend
+from job_search_agent.core.orchestration.tools.website_scrapper.scrapers.glorri_com import GlorriScraper
+from job_search_agent.core.orchestration.tools.website_scrapper.scrapers.jobsearch_az import JobSearchAzScraper
+
+DEFAULT_CORPUS = Path("benchmarks/scraper_corpus")
+REFERENCE_BACKEND = "html.parser"
+SCRAPERS = {cls.__name__: cls for cls in (JobSearchAzScraper, GlorriScraper)}
+SCRAPER_DIRS = {"JobSearchAzScraper": "jobsearch_az", "GlorriScraper": "glorri_com"}
+
+
+def _load_json(path: Path, default):
+    return json.loads(path.read_text(encoding="utf-8")) if path.exists() else default
+
+
+def _dump_json(path: Path, data):
+    path.write_text(json.dumps(data, ensure_ascii=False, indent=2, sort_keys=True), encoding="utf-8")
+
+
+def load_corpus(corpus: Path) -> List[dict]:
+    """
+    Returns manifest entries with their HTML loaded.
+
+    Corpus layout:
+        manifest.json   [{"url": ..., "scraper": "JobSearchAzScraper", "file": "jobsearch_az/<hash>.html"}]
+        expected.json   {url: JobVacancy fields} extracted with the reference backend
+        <scraper>/      raw HTML pages
+    """
+    pages = []
+    for entry in _load_json(corpus / "manifest.json", []):
+        html = (corpus / entry["file"]).read_text(encoding="utf-8")
+        pages.append({**entry, "html": html})
+    return pages
+
+
+def _percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def extract(pages: List[dict], backend: str) -> Dict[str, Optional[dict]]:
+    results = {}
+    for page in pages:
+        job = parse_page(SCRAPERS[page["scraper"]], page["html"], page["url"], backend)
+        results[page["url"]] = job.model_dump() if job else None
+    return results
+
+
+def check_stability(pages: List[dict], backend: str, expected: Dict[str, Optional[dict]]) -> List[str]:
+    """Lists every URL/field whose extraction differs from the recorded golden output."""
+    failures = []
+    for url, fields in extract(pages, backend).items():
+        if url not in expected:
+            failures.append(f"{url}: no golden output (run update-golden)")
+            continue
+        golden = expected[url]
+        if golden is None or fields is None:
+            if golden != fields:
+                failures.append(f"{url}: expected {'nothing' if golden is None else 'a vacancy'}, got {'nothing' if fields is None else 'a vacancy'}")
+            continue
+        for key in sorted(set(golden) | set(fields)):
+            if golden.get(key) != fields.get(key):
+                failures.append(f"{url}: field '{key}' changed")
+    return failures
+
+
+def benchmark(pages: List[dict], backend: str, repeat: int = 5) -> Dict[str, dict]:
+    """Times the parse path per scraper and reports throughput, latency percentiles and peak memory."""
+    by_scraper = defaultdict(list)
+    for page in pages:
+        by_scraper[page["scraper"]].append(page)
+
+    report = {}
+    for name, scraper_pages in by_scraper.items():
+        scraper_cls = SCRAPERS[name]
+
+        # Warm up imports and regex caches so they do not skew the first sample.
+        parse_page(scraper_cls, scraper_pages[0]["html"], scraper_pages[0]["url"], backend)
+
+        timings = []
+        for _ in range(repeat):
+            for page in scraper_pages:
+                start = time.perf_counter()
+                parse_page(scraper_cls, page["html"], page["url"], backend)
+                timings.append(time.perf_counter() - start)
+
+        # Memory is measured in a separate pass because tracemalloc slows allocation down.
+        peak_bytes = _peak_memory(scraper_pages, backend)
+
+        report[name] = {
+            "pages": len(scraper_pages),
+            "pages_per_sec": round(len(timings) / sum(timings), 1),
+            "p50_ms": round(statistics.median(timings) * 1000, 3),
+            "p99_ms": round(_percentile(timings, 99) * 1000, 3),
+            "peak_memory_kb": round(peak_bytes / 1024, 1),
+        }
+    return report
+
+
+def _peak_memory(pages: List[dict], backend: str) -> int:
+    tracemalloc.start()
+    peak = 0
+    for page in pages:
+        parse_page(SCRAPERS[page["scraper"]], page["html"], page["url"], backend)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.reset_peak()
+    tracemalloc.stop()
+    return peak
+
+
+async def record(corpus: Path, urls: List[str]):
+    """Downloads pages once and stores them with their golden extraction."""
+    from job_search_agent.core.orchestration.tools.website_scrapper.engine import ScrapingEngine
+
+    corpus.mkdir(parents=True, exist_ok=True)
+    manifest = _load_json(corpus / "manifest.json", [])
+    known = {entry["url"] for entry in manifest}
+
+    engine = ScrapingEngine()
+    for url in urls:
+        scraper = next((s for s in engine.scrapers if s.can_handle(url)), None)
+        if scraper is None:
+            print(f"No scraper for {url}")
+            continue
+        target = scraper.resolve_url(url)
+        if target in known:
+            continue
+        try:
+            html = await scraper.fetch(target)
+        except Exception as e:
+            print(f"Error recording {url}: {e}")
+            continue
+
+        name = type(scraper).__name__
+        file = f"{SCRAPER_DIRS[name]}/{hashlib.sha1(target.encode()).hexdigest()[:16]}.html"
+        (corpus / file).parent.mkdir(parents=True, exist_ok=True)
+        (corpus / file).write_text(html, encoding="utf-8")
+        manifest.append({"url": target, "scraper": name, "file": file})
+        known.add(target)
+        print(f"Recorded {target}")
+    await engine.http_pool.aclose()
+
+    _dump_json(corpus / "manifest.json", manifest)
+    update_golden(corpus)
+
+
+def update_golden(corpus: Path):
+    pages = load_corpus(corpus)
+    _dump_json(corpus / "expected.json", extract(pages, REFERENCE_BACKEND))
+    print(f"Golden output written for {len(pages)} pages")
+
+
+def run(corpus: Path, backends: List[str], repeat: int) -> int:
+    pages = load_corpus(corpus)
+    if not pages:
+        print(f"Corpus at {corpus} is empty; record pages first.")
+        return 1
+    expected = _load_json(corpus / "expected.json", {})
+
+    exit_code = 0
+    for backend in backends:
+        if resolve_backend(backend) != backend:
+            continue
+        failures = check_stability(pages, backend, expected)
+        for name, stats in benchmark(pages, backend, repeat).items():
+            print(
+                f"{name:20} {backend:12} pages={stats['pages']:<4} {stats['pages_per_sec']:>8} pages/s  "
+                f"p50={stats['p50_ms']:.2f}ms  p99={stats['p99_ms']:.2f}ms  peak={stats['peak_memory_kb']}KB"
+            )
+        if failures:
+            exit_code = 1
+            print(f"{backend}: {len(failures)} extraction differences from golden output")
+            for failure in failures:
+                print(f"  {failure}")
+    return exit_code
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Offline benchmark for the scraper parse paths. Pages are recorded once and then
+    replayed through `Scraper.parse` with no network access:
+
+        python -m job_search_agent.core.orchestration.tools.website_scrapper.benchmark record <url> [<url> ...]
+        python -m job_search_agent.core.orchestration.tools.website_scrapper.benchmark run --backends html.parser lxml
+
+    `run` exits non-zero when any backend extracts different fields than the golden output.
+    """
+    parser = argparse.ArgumentParser(description="Offline scraper parse benchmark")
+    parser.add_argument("--corpus", type=Path, default=DEFAULT_CORPUS)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    record_cmd = sub.add_parser("record", help="Record vacancy pages into the corpus")
+    record_cmd.add_argument("urls", nargs="+")
+
+    run_cmd = sub.add_parser("run", help="Replay the corpus and report parse performance")
+    run_cmd.add_argument("--backends", nargs="+", default=[REFERENCE_BACKEND, "lxml"])
+    run_cmd.add_argument("--repeat", type=int, default=5)
+
+    sub.add_parser("update-golden", help="Re-extract the golden output with the reference backend")
+
+    args = parser.parse_args(argv)
+    if args.command == "record":
+        asyncio.run(record(args.corpus, args.urls))
+        return 0
+    if args.command == "update-golden":
+        update_golden(args.corpus)
+        return 0
+    return run(args.corpus, args.backends, args.repeat)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,31 +4,71 @@ from job_search_agent.core.orchestration.tools.website_scrapper.base import Base
 from job_search_agent.core.orchestration.tools.website_scrapper.scrapers.jobsearch_az import JobSearchAzScraper
 from job_search_agent.core.orchestration.tools.website_scrapper.scrapers.glorri_com import GlorriScraper
 from job_search_agent.core.orchestration.models.job_vacancy import JobVacancy
-import httpx
-from bs4 import BeautifulSoup
+from job_search_agent.core.orchestration.tools.http_client.pool import HttpClientPool, get_http_pool
+from job_search_agent.core.orchestration.tools.http_client.scheduler import HostScheduler, get_scrape_scheduler
+from job_search_agent.core.orchestration.tools.http_client.response_cache import ResponseCache, get_response_cache
+from job_search_agent.core.orchestration.tools.website_scrapper.vacancy_cache import VacancyCache, get_vacancy_cache
+from job_search_agent.core.orchestration.tools.website_scrapper.parsing import ParsePool, get_parse_pool
 
 class ScrapingEngine:
     """Orchestrates different scrapers based on URL."""
     
-    def __init__(self, scrapers: Optional[List[BaseScraper]] = None):
+    def __init__(
+        self,
+        scrapers: Optional[List[BaseScraper]] = None,
+        http_pool: Optional[HttpClientPool] = None,
+        scheduler: Optional[HostScheduler] = None,
+        response_cache: Optional[ResponseCache] = None,
+        vacancy_cache: Optional[VacancyCache] = None,
+        parse_pool: Optional[ParsePool] = None,
+    ):
+        self.http_pool = http_pool or get_http_pool()
+        # Shared across engines so the per-host limits hold for the whole process.
+        self.scheduler = scheduler or get_scrape_scheduler()
+        self.response_cache = response_cache or get_response_cache()
+        self.vacancy_cache = vacancy_cache or get_vacancy_cache()
+        self.parse_pool = parse_pool or get_parse_pool()
         self.scrapers = scrapers or [
-            JobSearchAzScraper(),
-            GlorriScraper(),
+            JobSearchAzScraper(self.http_pool, self.scheduler, self.response_cache, self.parse_pool),
+            GlorriScraper(self.http_pool, self.scheduler, self.response_cache, self.parse_pool),
         ]
 
 
     async def scrape_url(self, url: str) -> JobVacancy:
+        if self.vacancy_cache:
+            cached = await self.vacancy_cache.get(url)
+            if cached is not None:
+                return cached
+
         for scraper in self.scrapers:
             if scraper.can_handle(url):
                 try:
-                    return await scraper.scrape(url)
+                    job = await scraper.scrape(url)
+                    if job is not None and self.vacancy_cache:
+                        await self.vacancy_cache.put(url, job)
+                    return job
                 except Exception as e:
                     print(f"Error scraping with {scraper.__class__.__name__}: {e}")
                     continue
+
+    def resolve_url(self, url: str) -> str:
+        """Returns the URL the handling scraper actually fetches (and stores on the JobVacancy)."""
+        for scraper in self.scrapers:
+            if scraper.can_handle(url):
+                return scraper.resolve_url(url)
+        return url
+
+    def stats(self) -> dict:
+        """Exposes scheduler queue depth, wait times and cache hit rates."""
+        return {
+            "scheduler": self.scheduler.stats(),
+            "response_cache": self.response_cache.stats() if self.response_cache else None,
+            "vacancy_cache": self.vacancy_cache.stats() if self.vacancy_cache else None,
+        }
         
     async def test_glorri_scraper(self, url: str) -> JobVacancy:
         """Directly tests the GlorriScraper with a given URL."""
-        scraper = GlorriScraper()
+        scraper = GlorriScraper(self.http_pool, self.scheduler, self.response_cache, self.parse_pool)
         return await scraper.scrape(url)
 
 
@@ -36,6 +76,7 @@ async def main():
     engine = ScrapingEngine()
     job = await engine.test_glorri_scraper("https://jobs.glorri.com/vacancies/idda/idda-aparici-layihe-meneceri-38152?isLocal=true")
     print(job)
+    await engine.http_pool.aclose()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,145 @@
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Dict, Iterable, Optional, Type
+
+from job_search_agent.configs.setting import get_settings
+from job_search_agent.core.orchestration.models.job_vacancy import JobVacancy
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+
+# BeautifulSoup tree builders and the module each one needs. All of them expose the
+# same soup API (select/find/get_text), so scrapers keep a single set of selectors.
+PARSER_BACKENDS = {
+    "html.parser": None,
+    "lxml": "lxml",
+    "html5lib": "html5lib",
+}
+
+
+def resolve_backend(name: str) -> str:
+    """Returns the configured backend, falling back to the stdlib parser if it is unknown or not installed."""
+    if name not in PARSER_BACKENDS:
+        print(f"Unknown HTML parser backend '{name}', using html.parser")
+        return "html.parser"
+    module = PARSER_BACKENDS[name]
+    if module and find_spec(module) is None:
+        print(f"HTML parser backend '{name}' is not installed, using html.parser")
+        return "html.parser"
+    return name
+
+
+def make_soup(html: str, backend: str) -> "BeautifulSoup":
+    from bs4 import BeautifulSoup
+
+    return BeautifulSoup(html, backend)
+
+
+def parse_page(scraper_cls: Type, html: str, url: str, backend: str) -> Optional[JobVacancy]:
+    """Module-level entry point so it can be pickled into process pool workers."""
+    return scraper_cls.parse(html, url, backend)
+
+
+class ParsePool:
+    """
+    Bounded worker pool that runs HTML parsing off the event loop.
+
+    "thread" keeps parsing in-process (cheap hand-off, still shares the GIL);
+    "process" gives true parallelism at the cost of pickling HTML and results.
+    """
+
+    def __init__(self, backend: str, executor: str = "thread", workers: int = 4):
+        self.backend = resolve_backend(backend)
+        self.workers = workers
+        self.kind = executor
+        self._executor: Optional[Executor] = None
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.kind == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="html-parse")
+        return self._executor
+
+    async def parse(self, scraper_cls: Type, html: str, url: str) -> Optional[JobVacancy]:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), parse_page, scraper_cls, html, url, self.backend)
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+def compare_backends(
+    scraper_cls: Type,
+    html: str,
+    url: str,
+    backends: Iterable[str] = ("html.parser", "lxml"),
+    reference: str = "html.parser",
+) -> Dict[str, Dict[str, tuple]]:
+    """
+    Parses the same page with each backend and returns, per backend, the JobVacancy
+    fields that differ from the reference backend as {field: (reference, other)}.
+    An empty dict for a backend means it produced identical output.
+    """
+    expected = parse_page(scraper_cls, html, url, reference)
+    expected_fields = expected.model_dump() if expected else {}
+    diffs = {}
+    for backend in backends:
+        if backend == reference or resolve_backend(backend) != backend:
+            continue
+        result = parse_page(scraper_cls, html, url, backend)
+        fields = result.model_dump() if result else {}
+        diffs[backend] = {
+            key: (expected_fields.get(key), fields.get(key))
+            for key in set(expected_fields) | set(fields)
+            if expected_fields.get(key) != fields.get(key)
+        }
+    return diffs
+
+
+_parse_pool = None
+def get_parse_pool() -> ParsePool:
+    global _parse_pool
+    if _parse_pool is None:
+        settings = get_settings()
+        _parse_pool = ParsePool(
+            backend=settings.HTML_PARSER_BACKEND,
+            executor=settings.HTML_PARSE_EXECUTOR,
+            workers=settings.HTML_PARSE_WORKERS,
+        )
+    return _parse_pool
+
+
+def close_parse_pool():
+    global _parse_pool
+    if _parse_pool is not None:
+        _parse_pool.shutdown()
+        _parse_pool = None
+
+
+async def main(urls: Iterable[str]):
+    """Fetches live pages and reports any field the alternative backends extract differently."""
+    from job_search_agent.core.orchestration.tools.website_scrapper.engine import ScrapingEngine
+
+    engine = ScrapingEngine()
+    for url in urls:
+        scraper = next((s for s in engine.scrapers if s.can_handle(url)), None)
+        if scraper is None:
+            print(f"No scraper for {url}")
+            continue
+        target = scraper.resolve_url(url)
+        html = await scraper.fetch(target)
+        diffs = compare_backends(type(scraper), html, target, backends=PARSER_BACKENDS)
+        for backend, fields in diffs.items():
+            status = "identical" if not fields else f"differs in {sorted(fields)}"
+            print(f"{backend:12} {status} :: {url}")
+    await engine.http_pool.aclose()
+
+
+if __name__ == "__main__":
+    import sys
+    asyncio.run(main(sys.argv[1:]))
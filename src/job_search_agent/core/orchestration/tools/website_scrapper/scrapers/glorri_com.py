@@ -1,9 +1,8 @@
 from typing import Optional
-import httpx
-from bs4 import BeautifulSoup
 import re
 
 from job_search_agent.core.orchestration.tools.website_scrapper.base import BaseScraper
+from job_search_agent.core.orchestration.tools.website_scrapper.parsing import make_soup
 from job_search_agent.core.orchestration.models.job_vacancy import JobVacancy
 
 class GlorriScraper(BaseScraper):
@@ -13,19 +12,17 @@ class GlorriScraper(BaseScraper):
         return "glorri.com" in url
 
     async def scrape(self, url: str) -> Optional[JobVacancy]:
-        async with httpx.AsyncClient() as client:
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-            }
-            try:
-                response = await client.get(url, headers=headers, follow_redirects=True)
-                response.raise_for_status()
-                html = response.text
-            except Exception as e:
-                print(f"Error fetching {url}: {e}")
-                return None
-        
-        soup = BeautifulSoup(html, "html.parser")
+        try:
+            html = await self.fetch(url)
+        except Exception as e:
+            print(f"Error fetching {url}: {e}")
+            return None
+
+        return await self.parse_pool.parse(type(self), html, url)
+
+    @classmethod
+    def parse(cls, html: str, url: str, backend: str = "html.parser") -> Optional[JobVacancy]:
+        soup = make_soup(html, backend)
         
         # Title - usually in h1
         title_tag = soup.select_one("h1")
@@ -1,10 +1,9 @@
 from typing import Optional
-import asyncio
-import httpx
-from bs4 import BeautifulSoup
 import re
 
 from job_search_agent.core.orchestration.tools.website_scrapper.base import BaseScraper
+from job_search_agent.core.orchestration.tools.website_scrapper.parsing import make_soup
+from job_search_agent.core.orchestration.tools.website_scrapper.url_canonicalizer import canonical_url
 from job_search_agent.core.orchestration.models.job_vacancy import JobVacancy
 
 class JobSearchAzScraper(BaseScraper):
@@ -13,21 +12,18 @@ class JobSearchAzScraper(BaseScraper):
     def can_handle(self, url: str) -> bool:
         return "jobsearch.az" in url
 
+    def resolve_url(self, url: str) -> str:
+        # The canonical jobsearch.az URL is on the classic subdomain, which serves SSR content for the same ids.
+        return canonical_url(url)
+
     async def scrape(self, url: str) -> Optional[JobVacancy]:
-        # jobsearch.az modern site is client-side rendered (SPA).
-        # We redirect to the classic subdomain which provides SSR content for the same IDs.
-        if "classic.jobsearch.az" not in url and "jobsearch.az" in url:
-            url = url.replace("jobsearch.az", "classic.jobsearch.az")
+        url = self.resolve_url(url)
+        html = await self.fetch(url)
+        return await self.parse_pool.parse(type(self), html, url)
 
-        async with httpx.AsyncClient() as client:
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-            }
-            response = await client.get(url, headers=headers, follow_redirects=True)
-            response.raise_for_status()
-            html = response.text
-        
-        soup = BeautifulSoup(html, "html.parser")
+    @classmethod
+    def parse(cls, html: str, url: str, backend: str = "html.parser") -> Optional[JobVacancy]:
+        soup = make_soup(html, backend)
         
         # Title
         title_tag = soup.select_one("h1.vacancies__title, h1.vacancy__title")
@@ -0,0 +1,77 @@
+import re
+from typing import List, Optional, Pattern, Tuple
+from urllib.parse import parse_qsl, urlencode, urlparse
+
+# Query parameters that only track where a click came from.
+TRACKING_PARAMS = frozenset({"isLocal", "ref", "fbclid", "gclid", "yclid", "mc_cid", "mc_eid"})
+
+
+class SourceCanonicalizer:
+    """
+    Canonical host rules for the vacancy pages of one job board.
+
+    The canonical URL is also the URL that gets fetched and the vacancy's key in
+    the vacancy cache and store, so every variant of a vacancy link (www., other
+    subdomain, tracking query, trailing slash) maps to one download and one key.
+    Only paths matching `vacancy_path` (default: any) are rewritten; other pages
+    of the board are canonicalized like unknown sites.
+    """
+
+    source = ""
+    hosts: Tuple[str, ...] = ()
+    canonical_host = ""
+    vacancy_path: Optional[Pattern[str]] = None
+
+    def matches(self, host: str, path: str) -> bool:
+        if host not in self.hosts:
+            return False
+        return self.vacancy_path is None or self.vacancy_path.match(path) is not None
+
+
+class JobSearchAzCanonicalizer(SourceCanonicalizer):
+    source = "jobsearch.az"
+    # The modern site is client-side rendered; the classic subdomain serves the same ids as HTML.
+    hosts = ("jobsearch.az", "classic.jobsearch.az")
+    canonical_host = "classic.jobsearch.az"
+
+
+class GlorriCanonicalizer(SourceCanonicalizer):
+    source = "glorri"
+    hosts = ("jobs.glorri.com", "glorri.com")
+    canonical_host = "jobs.glorri.com"
+    # glorri.com also hosts the company site (/about, /blog, ...), which jobs.glorri.com does not serve.
+    vacancy_path = re.compile(r"/vacancies/[^/]+/[^/]+/?$")
+
+
+_canonicalizers: List[SourceCanonicalizer] = [JobSearchAzCanonicalizer(), GlorriCanonicalizer()]
+
+
+def register_canonicalizer(canonicalizer: SourceCanonicalizer):
+    """Adds rules for a new job board; later registrations take precedence."""
+    _canonicalizers.insert(0, canonicalizer)
+
+
+def _split(url: str):
+    parsed = urlparse(url.strip())
+    host = parsed.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    for canonicalizer in _canonicalizers:
+        if canonicalizer.matches(host, parsed.path):
+            return parsed, canonicalizer.canonical_host
+    return parsed, host
+
+
+def canonical_url(url: str) -> str:
+    """
+    Maps URL variants of the same vacancy to one URL: the board's canonical host for
+    vacancy pages of known boards, without a trailing slash and tracking parameters.
+    The remaining query parameters are kept, sorted.
+    """
+    parsed, host = _split(url)
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parsed.query, keep_blank_values=True)
+        if key not in TRACKING_PARAMS and not key.startswith("utm_")
+    )
+    canonical = f"https://{host}{parsed.path.rstrip('/')}"
+    return f"{canonical}?{urlencode(query)}" if query else canonical
@@ -0,0 +1,109 @@
+import asyncio
+import sqlite3
+import threading
+import time
+from datetime import timedelta
+from pathlib import Path
+from typing import Optional
+
+from job_search_agent.configs.setting import get_settings
+from job_search_agent.core.orchestration.models.job_vacancy import JobVacancy
+from job_search_agent.core.orchestration.tools.website_scrapper.url_canonicalizer import canonical_url
+from job_search_agent.utils.date_parser import parse_deadline
+
+
+class VacancyCache:
+    """
+    SQLite cache of parsed JobVacancy objects keyed by canonical URL, like the vacancy store.
+
+    A vacancy stays cached until its application deadline (end of that day),
+    capped at `max_ttl` so edited postings are eventually re-parsed. Vacancies
+    without a parseable deadline expire after `default_ttl`.
+    """
+
+    def __init__(self, path: str, default_ttl: float, max_ttl: float):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.default_ttl = default_ttl
+        self.max_ttl = max_ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS vacancies (
+                url TEXT PRIMARY KEY,
+                payload TEXT NOT NULL,
+                expires_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+        # Metrics
+        self.hits = 0
+        self.misses = 0
+
+    def expires_at(self, job: JobVacancy) -> float:
+        now = time.time()
+        deadline = parse_deadline(job.deadline)
+        if deadline is not None:
+            end_of_day = (deadline + timedelta(days=1)).timestamp()
+            if end_of_day > now:
+                return min(end_of_day, now + self.max_ttl)
+        return now + self.default_ttl
+
+    def _get(self, key: str) -> Optional[JobVacancy]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, expires_at FROM vacancies WHERE url = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] <= time.time():
+                self._conn.execute("DELETE FROM vacancies WHERE url = ?", (key,))
+                self._conn.commit()
+                return None
+        return JobVacancy.model_validate_json(row[0])
+
+    def _put(self, key: str, job: JobVacancy):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO vacancies (url, payload, expires_at) VALUES (?, ?, ?)",
+                (key, job.model_dump_json(), self.expires_at(job)),
+            )
+            self._conn.commit()
+
+    async def get(self, url: str) -> Optional[JobVacancy]:
+        job = await asyncio.to_thread(self._get, canonical_url(url))
+        if job is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return job
+
+    async def put(self, url: str, job: JobVacancy):
+        await asyncio.to_thread(self._put, canonical_url(url), job)
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_vacancy_cache = None
+def get_vacancy_cache() -> Optional[VacancyCache]:
+    """Returns the shared parsed-vacancy cache, or None when it is disabled."""
+    global _vacancy_cache
+    settings = get_settings()
+    if not settings.VACANCY_CACHE_ENABLED:
+        return None
+    if _vacancy_cache is None:
+        _vacancy_cache = VacancyCache(
+            settings.VACANCY_CACHE_PATH,
+            default_ttl=settings.VACANCY_CACHE_DEFAULT_TTL,
+            max_ttl=settings.VACANCY_CACHE_MAX_TTL,
+        )
+    return _vacancy_cache
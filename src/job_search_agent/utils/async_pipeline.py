@@ -0,0 +1,103 @@
+import asyncio
+from typing import AsyncIterable, AsyncIterator, Awaitable, Callable, List, Optional, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+async def map_unordered(
+    source: AsyncIterable[T],
+    fn: Callable[[T], Awaitable[R]],
+    limit: Optional[int] = None,
+) -> AsyncIterator[R]:
+    """
+    Starts `fn(item)` as soon as each item arrives from `source` and yields results
+    in completion order. Exceptions from `fn` are yielded as values so a single
+    failure does not stop the stream; callers filter them like `gather(return_exceptions=True)`.
+    At most `limit` calls run at once when given.
+    """
+    iterator = source.__aiter__()
+    next_item: Optional[asyncio.Future] = asyncio.ensure_future(iterator.__anext__())
+    pending = set()
+
+    try:
+        while next_item is not None or pending:
+            waiting = set(pending)
+            if next_item is not None and (limit is None or len(pending) < limit):
+                waiting.add(next_item)
+            done, _ = await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+
+            for task in done:
+                if task is next_item:
+                    try:
+                        item = task.result()
+                    except StopAsyncIteration:
+                        next_item = None
+                        continue
+                    pending.add(asyncio.ensure_future(fn(item)))
+                    next_item = asyncio.ensure_future(iterator.__anext__())
+                else:
+                    pending.discard(task)
+                    try:
+                        yield task.result()
+                    except Exception as e:
+                        yield e
+    finally:
+        for task in pending:
+            task.cancel()
+        if next_item is not None:
+            next_item.cancel()
+
+
+async def batched(source: AsyncIterable[T], size: int, max_wait: Optional[float] = None) -> AsyncIterator[List[T]]:
+    """
+    Groups items from `source` into lists of up to `size`. A partial batch is flushed
+    once `max_wait` seconds pass without it filling up, so a slow upstream does not
+    hold back items that are already available.
+    """
+    iterator = source.__aiter__()
+    batch: List[T] = []
+    next_item: Optional[asyncio.Future] = None
+
+    try:
+        while True:
+            if next_item is None:
+                next_item = asyncio.ensure_future(iterator.__anext__())
+            timeout = max_wait if batch else None
+            done, _ = await asyncio.wait({next_item}, timeout=timeout)
+
+            if not done:
+                yield batch
+                batch = []
+                continue
+
+            try:
+                item = next_item.result()
+            except StopAsyncIteration:
+                next_item = None
+                break
+            next_item = None
+            batch.append(item)
+            if len(batch) >= size:
+                yield batch
+                batch = []
+
+        if batch:
+            yield batch
+    finally:
+        if next_item is not None:
+            next_item.cancel()
+
+
+async def iterate_as_completed(awaitables: List[Awaitable[T]]) -> AsyncIterator[T]:
+    """Yields results of the given awaitables in completion order; exceptions are yielded as values."""
+    tasks = [asyncio.ensure_future(awaitable) for awaitable in awaitables]
+    try:
+        for future in asyncio.as_completed(tasks):
+            try:
+                yield await future
+            except Exception as e:
+                yield e
+    finally:
+        for task in tasks:
+            task.cancel()
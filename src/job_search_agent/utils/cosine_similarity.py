@@ -1,10 +1,19 @@
-import math
 from typing import List
 
+import numpy as np
+
+
 def cosine_similarity(v1: List[float], v2: List[float]) -> float:
-    dot_product = sum(a * b for a, b in zip(v1, v2))
-    magnitude1 = math.sqrt(sum(a * a for a in v1))
-    magnitude2 = math.sqrt(sum(b * b for b in v2))
+    """
+    Cosine similarity of two vectors; see utils.vector_similarity for batched versions.
+    Vectors of different lengths are compared over their common prefix (each norm still
+    covers the whole vector), and a zero vector has similarity 0.0.
+    """
+    a = np.asarray(v1, dtype=np.float64)
+    b = np.asarray(v2, dtype=np.float64)
+    magnitude1 = np.linalg.norm(a)
+    magnitude2 = np.linalg.norm(b)
     if not magnitude1 or not magnitude2:
         return 0.0
-    return dot_product / (magnitude1 * magnitude2)
+    n = min(len(a), len(b))
+    return float(a[:n] @ b[:n] / (magnitude1 * magnitude2))
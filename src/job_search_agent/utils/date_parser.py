@@ -0,0 +1,69 @@
+import re
+from datetime import datetime
+from typing import Optional
+
+# Month names as they appear on local job boards (Azerbaijani, English, Russian).
+MONTHS = {
+    "yanvar": 1, "fevral": 2, "mart": 3, "aprel": 4, "may": 5, "iyun": 6,
+    "iyul": 7, "avqust": 8, "sentyabr": 9, "oktyabr": 10, "noyabr": 11, "dekabr": 12,
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "jun": 6, "jul": 7, "aug": 8,
+    "sep": 9, "oct": 10, "nov": 11, "dec": 12,
+    "янв": 1, "фев": 2, "мар": 3, "апр": 4, "мая": 5, "май": 5, "июн": 6,
+    "июл": 7, "авг": 8, "сен": 9, "окт": 10, "ноя": 11, "дек": 12,
+}
+
+_NUMERIC = re.compile(r"(\d{1,2})[./-](\d{1,2})[./-](\d{4})")
+_ISO = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})")
+_DAY_MONTH = re.compile(r"(\d{1,2})\s+([^\W\d_]+)\.?,?\s*(\d{4})?", re.UNICODE)
+_MONTH_DAY = re.compile(r"([^\W\d_]+)\.?\s+(\d{1,2}),?\s*(\d{4})?", re.UNICODE)
+
+
+def _month(name: str) -> Optional[int]:
+    name = name.replace("İ", "i").lower()
+    if name in MONTHS:
+        return MONTHS[name]
+    for prefix in (name[:4], name[:3]):
+        if prefix in MONTHS:
+            return MONTHS[prefix]
+    return None
+
+
+def _build(year: int, month: int, day: int) -> Optional[datetime]:
+    try:
+        return datetime(year, month, day)
+    except ValueError:
+        return None
+
+
+def parse_deadline(text: Optional[str], now: Optional[datetime] = None) -> Optional[datetime]:
+    """
+    Parses a vacancy deadline such as "25.03.2026", "2026-03-25", "25 Mart 2026" or "Mar 25, 2026".
+    When the year is missing the next occurrence of that date is assumed.
+    Returns None for unknown formats and placeholders like "N/A".
+    """
+    if not text:
+        return None
+    now = now or datetime.now()
+
+    match = _ISO.search(text)
+    if match:
+        return _build(int(match.group(1)), int(match.group(2)), int(match.group(3)))
+
+    match = _NUMERIC.search(text)
+    if match:
+        return _build(int(match.group(3)), int(match.group(2)), int(match.group(1)))
+
+    for pattern, day_group, month_group in ((_DAY_MONTH, 1, 2), (_MONTH_DAY, 2, 1)):
+        for match in pattern.finditer(text):
+            month = _month(match.group(month_group))
+            if month is None:
+                continue
+            day = int(match.group(day_group))
+            if match.group(3):
+                return _build(int(match.group(3)), month, day)
+            candidate = _build(now.year, month, day)
+            if candidate and candidate.date() < now.date():
+                candidate = _build(now.year + 1, month, day)
+            return candidate
+
+    return None
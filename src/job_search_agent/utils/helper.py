@@ -1,8 +1,11 @@
 import json
+from functools import lru_cache
 from pathlib import Path
 
 
+@lru_cache(maxsize=1)
 def get_config_file():
+    """Pricing/limits config, parsed once per process. Shared by all callers: treat as read-only."""
     config = None
     base_dir = Path(__file__).resolve().parent.parent
     config_path = base_dir / 'configs/pricing/current.json'
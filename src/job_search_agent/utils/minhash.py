@@ -0,0 +1,73 @@
+import zlib
+from collections import defaultdict
+from typing import Dict, Hashable, Iterable, List, Set, Tuple
+
+import numpy as np
+
+# Mersenne prime for the universal hash family h(x) = (a * x + b) mod p.
+_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+
+def shingle_hashes(shingles: Iterable[str]) -> np.ndarray:
+    """Stable 32-bit hashes of shingles (crc32, so signatures agree across processes)."""
+    return np.fromiter((zlib.crc32(s.encode("utf-8")) for s in set(shingles)), dtype=np.uint64)
+
+
+class MinHashLSH:
+    """
+    MinHash signatures with a banded LSH index for near-duplicate lookup.
+
+    A signature is `bands * rows` minimum hashes; two sets collide in a band
+    with probability J^rows, so candidates are found in time proportional to the
+    bucket sizes rather than the number of indexed items. Candidates are then
+    confirmed by the estimated Jaccard similarity against `threshold`.
+    The default 20 bands x 6 rows puts the detection S-curve midpoint near J = 0.6.
+    """
+
+    def __init__(self, threshold: float = 0.6, bands: int = 20, rows: int = 6, seed: int = 1):
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = rows
+        rng = np.random.default_rng(seed)
+        num_perm = bands * rows
+        # a, b and x all fit in 32 bits, so a * x + b cannot overflow uint64.
+        self._a = rng.integers(1, _MAX_HASH, num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, _MAX_HASH, num_perm, dtype=np.uint64)
+        self._buckets: List[Dict[bytes, List[Hashable]]] = [defaultdict(list) for _ in range(bands)]
+        self._signatures: Dict[Hashable, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def signature(self, shingles: Iterable[str]) -> np.ndarray:
+        hashes = shingle_hashes(shingles)
+        if not hashes.size:
+            return np.full(self.bands * self.rows, _MAX_HASH, dtype=np.uint64)
+        permuted = (np.outer(self._a, hashes) + self._b[:, None]) % _PRIME
+        return (permuted & _MAX_HASH).min(axis=1)
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        return [signature[i * self.rows:(i + 1) * self.rows].tobytes() for i in range(self.bands)]
+
+    @staticmethod
+    def similarity(a: np.ndarray, b: np.ndarray) -> float:
+        """Estimated Jaccard similarity of the sets behind two signatures."""
+        return float(np.mean(a == b))
+
+    def query(self, signature: np.ndarray) -> List[Tuple[Hashable, float]]:
+        """Indexed keys whose estimated similarity reaches the threshold, most similar first."""
+        candidates: Set[Hashable] = set()
+        for band, key in zip(self._buckets, self._band_keys(signature)):
+            candidates.update(band.get(key, ()))
+        matches = []
+        for candidate in candidates:
+            score = self.similarity(signature, self._signatures[candidate])
+            if score >= self.threshold:
+                matches.append((candidate, score))
+        return sorted(matches, key=lambda match: -match[1])
+
+    def add(self, key: Hashable, signature: np.ndarray):
+        self._signatures[key] = signature
+        for band, band_key in zip(self._buckets, self._band_keys(signature)):
+            band[band_key].append(key)
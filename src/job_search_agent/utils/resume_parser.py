@@ -1,8 +1,8 @@
 import io
 
-import pdfplumber
-
 def resume_parser(file: bytes) -> str:
+    import pdfplumber
+
     text = []
     with pdfplumber.open(io.BytesIO(file)) as pdf:
         for page in pdf.pages:
@@ -0,0 +1,67 @@
+import re
+import unicodedata
+from functools import lru_cache
+from typing import List
+
+# Azerbaijani letters folded to their ASCII base so "Mühasib", "muhasib" and
+# "MÜHASİB" index the same way. Turkish dotted/dotless i are handled before lowercasing.
+_FOLD = str.maketrans({
+    "ə": "e", "Ə": "e",
+    "ı": "i", "I": "i", "İ": "i",
+    "ş": "s", "Ş": "s",
+    "ç": "c", "Ç": "c",
+    "ğ": "g", "Ğ": "g",
+    "ö": "o", "Ö": "o",
+    "ü": "u", "Ü": "u",
+})
+
+# Keeps tech tokens such as "c++", "c#" and "node.js" intact; hyphenated words are split below.
+_TOKEN = re.compile(r"[a-z0-9]+(?:[.][a-z0-9]+)*[+#]*")
+
+STOPWORDS = frozenset({
+    # English
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "in", "is", "of",
+    "on", "or", "the", "to", "with", "we", "you", "our", "your",
+    # Azerbaijani (folded)
+    "ve", "ile", "ucun", "uzre", "bu", "bir", "da", "de", "olan", "olmaq", "edir",
+    "kimi", "her", "daha", "en", "cox",
+})
+
+
+def fold(text: str) -> str:
+    """Lowercases and strips Azerbaijani (and other Latin) diacritics."""
+    text = text.translate(_FOLD).lower()
+    text = unicodedata.normalize("NFKD", text)
+    return "".join(ch for ch in text if not unicodedata.combining(ch))
+
+
+@lru_cache(maxsize=50_000)
+def _normalize_token(token: str) -> str:
+    # Light plural stemming: "telebler" -> "teleb", "resurslari" -> "resurs", "developers" -> "developer".
+    if len(token) > 6 and (token.endswith("lari") or token.endswith("leri")):
+        return token[:-4]
+    if len(token) > 5 and (token.endswith("lar") or token.endswith("ler")):
+        return token[:-3]
+    if len(token) > 4 and token.endswith("s") and not token.endswith("ss") and token.isalpha():
+        return token[:-1]
+    return token
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Splits text into normalized search tokens.
+
+    Hyphenated and slashed words also emit their joined form, so "Front-end",
+    "Frontend" and "front end" queries all share the "frontend" or "front"/"end" tokens.
+    """
+    if not text:
+        return []
+    tokens = []
+    for chunk in fold(text).split():
+        parts = [p for p in re.split(r"[-/_]", chunk) if p]
+        if len(parts) > 1:
+            joined = _TOKEN.findall("".join(parts))
+            tokens.extend(_normalize_token(t) for t in joined if t not in STOPWORDS)
+        for part in parts:
+            tokens.extend(_normalize_token(t) for t in _TOKEN.findall(part) if t not in STOPWORDS)
+    return tokens
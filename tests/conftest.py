@@ -0,0 +1,5 @@
+import os
+
+# Settings are validated on first use; placeholders stand in for unset secrets.
+os.environ.setdefault("GEMINI_PROJECT_ID", "test")
+os.environ.setdefault("GOOGLE_API_KEY", "test")
@@ -0,0 +1,26 @@
+from job_search_agent.core.llm_gateways.batch_jobs import BatchJobStore
+
+MESSAGES = [{"type": "human", "content": "hi"}]
+SCHEMA = {"type": "object"}
+
+
+def test_claim_requeues_requests_orphaned_in_submitting(tmp_path):
+    store = BatchJobStore(str(tmp_path / "batches.sqlite3"), claim_lease=60)
+    store._enqueue("request-1", "model", MESSAGES, SCHEMA)
+    assert [request[0] for request in store._claim(10)["model"]] == ["request-1"]
+
+    # The claiming worker died before mark_submitted/release; within the lease nobody takes it over.
+    assert store._claim(10) == {}
+
+    store._conn.execute("UPDATE batch_requests SET updated_at = updated_at - 120 WHERE id = 'request-1'")
+    assert [request[0] for request in store._claim(10)["model"]] == ["request-1"]
+    assert store._stats() == {"submitting": 1}
+
+
+def test_claim_leaves_submitted_requests_alone(tmp_path):
+    store = BatchJobStore(str(tmp_path / "batches.sqlite3"), claim_lease=0)
+    store._enqueue("request-1", "model", MESSAGES, SCHEMA)
+    store._claim(10)
+    store._mark_submitted(["request-1"], "batches/1")
+    assert store._claim(10) == {}
+    assert store._stats() == {"submitted": 1}
@@ -0,0 +1,30 @@
+import math
+
+import pytest
+
+from job_search_agent.utils.cosine_similarity import cosine_similarity
+
+
+def reference(v1, v2):
+    dot_product = sum(a * b for a, b in zip(v1, v2))
+    magnitude1 = math.sqrt(sum(a * a for a in v1))
+    magnitude2 = math.sqrt(sum(b * b for b in v2))
+    if not magnitude1 or not magnitude2:
+        return 0.0
+    return dot_product / (magnitude1 * magnitude2)
+
+
+@pytest.mark.parametrize(
+    "v1, v2",
+    [
+        ([1.0, 2.0, 3.0], [1.0, 2.0, 3.0]),
+        ([1.0, 0.0], [0.0, 1.0]),
+        ([0.5, -1.5, 2.0], [-0.5, 1.5, -2.0]),
+        ([1.0, 2.0, 3.0], [1.0, 2.0]),
+        ([3.0], [1.0, 4.0, 2.0]),
+        ([0.0, 0.0], [1.0, 1.0]),
+        ([], [1.0]),
+    ],
+)
+def test_matches_pure_python_definition(v1, v2):
+    assert cosine_similarity(v1, v2) == pytest.approx(reference(v1, v2))
@@ -0,0 +1,33 @@
+import time
+
+from job_search_agent.core.orchestration.tools.http_client.response_cache import CachedResponse, ResponseCache
+
+
+def make_cache(tmp_path, max_bytes=10_000):
+    return ResponseCache(str(tmp_path / "http.sqlite3"), ttl=60, retention=3600, max_bytes=max_bytes, purge_interval=0)
+
+
+def page(url, fetched_at, size=100):
+    return CachedResponse(url=url, body="x" * size, fetched_at=fetched_at)
+
+
+def test_purges_pages_older_than_retention(tmp_path):
+    cache = make_cache(tmp_path)
+    now = time.time()
+    cache._put(page("https://example.com/old", now - 7200))
+    cache._put(page("https://example.com/stale", now - 600))
+    cache._put(page("https://example.com/new", now))
+    assert cache._get("https://example.com/old") is None
+    # Past the TTL but within retention: kept for revalidation.
+    assert cache._get("https://example.com/stale") is not None
+    assert len(cache) == 2
+
+
+def test_evicts_least_recently_fetched_pages_over_max_bytes(tmp_path):
+    cache = make_cache(tmp_path, max_bytes=1_000)
+    now = time.time()
+    for i in range(20):
+        cache._put(page(f"https://example.com/{i}", now - 100 + i))
+    assert len(cache) == 10
+    assert cache._get("https://example.com/0") is None
+    assert cache._get("https://example.com/19") is not None
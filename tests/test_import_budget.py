@@ -0,0 +1,76 @@
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, Tuple
+
+import pytest
+
+# Cold-start budget of the API process: importing it must stay under BUDGET_MS (median of
+# RUNS fresh interpreters) and must not pull in any of DEFERRED_MODULES, which are imported
+# on first use instead.
+API_MODULE = "job_search_agent.api.main"
+BUDGET_MS = 600
+RUNS = 5
+DEFERRED_MODULES = (
+    "langchain",
+    "langchain_core",
+    "langchain_google_genai",
+    "langchain_community",
+    "langsmith",
+    "google.genai",
+    "tavily",
+    "ddgs",
+    "pdfplumber",
+    "bs4",
+    "numpy",
+    "torch",
+    "sentence_transformers",
+)
+
+
+def import_profile(module: str) -> Tuple[float, Dict[str, float]]:
+    """
+    Imports `module` in a fresh interpreter with -X importtime. Returns its total
+    import time and the cumulative time of every imported module, in milliseconds.
+    """
+    # Settings are validated on import; placeholders stand in for unset secrets.
+    env = {"GEMINI_PROJECT_ID": "import-budget", "GOOGLE_API_KEY": "import-budget", **os.environ}
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{completed.stderr[-2000:]}")
+
+    cumulative: Dict[str, float] = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, self_us, cumulative_us, name = (part.strip() for part in line.replace("import time:", "|", 1).split("|"))
+        if cumulative_us.isdigit():
+            cumulative[name] = int(cumulative_us) / 1000
+    return cumulative.get(module, 0.0), cumulative
+
+
+@pytest.fixture(scope="module")
+def profiles():
+    return [import_profile(API_MODULE) for _ in range(RUNS)]
+
+
+def test_api_import_defers_heavy_modules(profiles):
+    _, cumulative = profiles[-1]
+    eager = [name for name in DEFERRED_MODULES if name in cumulative]
+    assert not eager, f"deferred modules imported at startup: {', '.join(eager)}"
+
+
+def test_api_import_time_within_budget(profiles):
+    median = statistics.median(total for total, _ in profiles)
+    _, cumulative = profiles[-1]
+    slowest = sorted(cumulative.items(), key=lambda item: item[1], reverse=True)[1:11]
+    assert median <= BUDGET_MS, (
+        f"import {API_MODULE}: median {median:.0f}ms over {RUNS} runs exceeds the {BUDGET_MS}ms budget; slowest:\n"
+        + "\n".join(f"  {ms:8.1f}ms  {name}" for name, ms in slowest)
+    )
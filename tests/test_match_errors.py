@@ -0,0 +1,70 @@
+import asyncio
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from job_search_agent.api.dependencies import get_orchestrator
+from job_search_agent.api.routes import core
+from job_search_agent.core.llm_gateways.cost_controller import BudgetExceeded
+from job_search_agent.core.orchestration.agents.resume_ranking_agent import ResumeRankingAgent
+from job_search_agent.core.orchestration.models.job_vacancy import JobVacancy
+from job_search_agent.core.orchestration.models.matching_models import BatchJobMatchResult
+
+RESUME = {"titles": ["Developer"], "skills": ["Python"], "seniority": "Mid", "years_experience": 3, "keywords": ["python"]}
+
+
+def make_agent(calls):
+    """A ranking agent whose first shard fails with BudgetExceeded and whose others hang."""
+    agent = ResumeRankingAgent.__new__(ResumeRankingAgent)
+    agent.shard_retries = 1
+    agent._shard_jobs = lambda jobs, _: [(i, [job]) for i, job in enumerate(jobs)]
+
+    async def check_shard(jobs, _):
+        calls.append(jobs[0].title)
+        if jobs[0].title == "job-0":
+            raise BudgetExceeded("Monthly LLM budget reached")
+        await asyncio.sleep(60)
+        return BatchJobMatchResult(matching_indices=[0], reasons={})
+
+    agent._check_shard = check_shard
+    return agent
+
+
+def jobs(count):
+    return [JobVacancy.model_construct(title=f"job-{i}", company="c", url=f"https://example.com/{i}") for i in range(count)]
+
+
+def test_budget_error_cancels_sibling_shards_and_propagates():
+    calls = []
+    agent = make_agent(calls)
+
+    async def run():
+        try:
+            await asyncio.wait_for(agent._batch_check_matches(jobs(3), "resume"), timeout=5)
+        except BudgetExceeded:
+            return "raised"
+
+    assert asyncio.run(run()) == "raised"
+    # Not retried, and the hanging shards were cancelled rather than awaited.
+    assert calls.count("job-0") == 1
+
+
+class FakeOrchestrator:
+    def __init__(self, agent):
+        self.agent = agent
+
+    async def find_jobs(self, cv):
+        async def candidates():
+            for job in jobs(3):
+                yield job
+        return [ranked async for ranked in self.agent._match_jobs(candidates(), "resume", 3, None)]
+
+
+def test_find_jobs_returns_402_when_budget_is_exceeded():
+    app = FastAPI()
+    app.include_router(core.router)
+    app.dependency_overrides[get_orchestrator] = lambda: FakeOrchestrator(make_agent([]))
+
+    response = TestClient(app).post("/core/find-jobs", json=RESUME)
+    assert response.status_code == 402
+    assert "budget" in response.json()["detail"]
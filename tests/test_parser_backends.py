@@ -0,0 +1,19 @@
+from importlib.util import find_spec
+from pathlib import Path
+
+import pytest
+
+from job_search_agent.core.orchestration.tools.website_scrapper.benchmark import SCRAPERS, load_corpus
+from job_search_agent.core.orchestration.tools.website_scrapper.parsing import PARSER_BACKENDS, compare_backends
+
+CORPUS = Path(__file__).resolve().parents[1] / "benchmarks" / "scraper_corpus"
+PAGES = load_corpus(CORPUS)
+
+
+@pytest.mark.parametrize("backend", [name for name in PARSER_BACKENDS if name != "html.parser"])
+@pytest.mark.parametrize("page", PAGES, ids=[page["file"] for page in PAGES])
+def test_backend_extracts_same_fields_as_html_parser(backend, page):
+    if find_spec(PARSER_BACKENDS[backend]) is None:
+        pytest.skip(f"{backend} is not installed")
+    diffs = compare_backends(SCRAPERS[page["scraper"]], page["html"], page["url"], backends=[backend])
+    assert diffs == {backend: {}}
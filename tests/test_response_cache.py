@@ -0,0 +1,18 @@
+from job_search_agent.core.llm_gateways.response_cache import SQLiteBackend
+
+
+def test_sqlite_backend_purges_expired_entries(tmp_path):
+    backend = SQLiteBackend(str(tmp_path / "responses.sqlite3"), max_bytes=10_000, purge_interval=0)
+    backend.set("expired", "x" * 100, ttl=-1)
+    backend.set("fresh", "y" * 100, ttl=60)
+    assert len(backend) == 1
+    assert backend.get("fresh") == "y" * 100
+
+
+def test_sqlite_backend_evicts_oldest_entries_over_max_bytes(tmp_path):
+    backend = SQLiteBackend(str(tmp_path / "responses.sqlite3"), max_bytes=1_000, purge_interval=0)
+    for i in range(30):
+        backend.set(f"key-{i}", "v" * 100, ttl=60 + i)
+    assert len(backend) == 10
+    assert backend.get("key-0") is None
+    assert backend.get("key-29") == "v" * 100
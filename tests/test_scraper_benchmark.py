@@ -0,0 +1,32 @@
+from pathlib import Path
+
+import pytest
+
+from job_search_agent.core.orchestration.tools.website_scrapper import benchmark
+
+CORPUS = Path(__file__).resolve().parents[1] / "benchmarks" / "scraper_corpus"
+
+
+@pytest.fixture(scope="module")
+def pages():
+    return benchmark.load_corpus(CORPUS)
+
+
+def test_corpus_covers_every_scraper(pages):
+    assert {page["scraper"] for page in pages} == set(benchmark.SCRAPERS)
+
+
+def test_reference_backend_matches_golden_output(pages):
+    expected = benchmark._load_json(CORPUS / "expected.json", {})
+    assert benchmark.check_stability(pages, benchmark.REFERENCE_BACKEND, expected) == []
+
+
+def test_benchmark_reports_every_scraper(pages):
+    report = benchmark.benchmark(pages, benchmark.REFERENCE_BACKEND, repeat=1)
+    assert set(report) == set(benchmark.SCRAPERS)
+    assert sum(stats["pages"] for stats in report.values()) == len(pages)
+    assert all(stats["pages_per_sec"] > 0 for stats in report.values())
+
+
+def test_run_passes_on_recorded_corpus():
+    assert benchmark.run(CORPUS, [benchmark.REFERENCE_BACKEND], repeat=1) == 0
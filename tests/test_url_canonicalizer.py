@@ -0,0 +1,31 @@
+import pytest
+
+from job_search_agent.core.orchestration.tools.website_scrapper.url_canonicalizer import canonical_url
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        (
+            "https://jobs.glorri.com/vacancies/idda/idda-aparici-layihe-meneceri-38152?isLocal=true",
+            "https://jobs.glorri.com/vacancies/idda/idda-aparici-layihe-meneceri-38152",
+        ),
+        (
+            "https://www.glorri.com/vacancies/idda/idda-aparici-layihe-meneceri-38152/",
+            "https://jobs.glorri.com/vacancies/idda/idda-aparici-layihe-meneceri-38152",
+        ),
+        ("https://glorri.com/about", "https://glorri.com/about"),
+        ("https://glorri.com/blog/hiring-tips/?page=2", "https://glorri.com/blog/hiring-tips?page=2"),
+        (
+            "https://jobsearch.az/vacancies/python-developer-38152?utm_source=tg",
+            "https://classic.jobsearch.az/vacancies/python-developer-38152",
+        ),
+        (
+            "https://classic.jobsearch.az/vacancies?page=2&ref=home&category=it",
+            "https://classic.jobsearch.az/vacancies?category=it&page=2",
+        ),
+        ("https://example.com/jobs/1/?b=2&a=1&fbclid=x", "https://example.com/jobs/1?a=1&b=2"),
+    ],
+)
+def test_canonical_url(url, expected):
+    assert canonical_url(url) == expected